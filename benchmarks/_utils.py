@@ -0,0 +1,62 @@
+"""Synthetic land data frames shared by the benchmarks.
+
+The pixels lie on the national hectare grid (see `swisslandstats.rowcol_to_xy`), and
+the data columns are random integer codes drawn from a seeded generator, so that the
+runs are reproducible.
+"""
+
+import numpy as np
+import pandas as pd
+from rasterio.crs import CRS
+
+import swisslandstats as sls
+
+
+def get_synthetic_ldf(
+    shape, columns, *, dtype="int64", num_pixels=None, rng=None, reli_index=False
+):
+    """
+    Get a synthetic LandDataFrame.
+
+    Parameters
+    ----------
+    shape : tuple
+        The (rows, cols) shape of the (north-western) part of the national hectare grid
+        covered by the land data frame.
+    columns : dict-like
+        Mapping of the data column names to the (low, high) range of their random
+        integer codes (high exclusive), which are drawn in order.
+    dtype : str, default "int64"
+        Data type of the data columns.
+    num_pixels : int, optional
+        Number of pixels, which are sampled at random (and sorted) from the grid. If
+        `None` is provided, the land data frame covers all the pixels of the grid.
+    rng : numpy.random.Generator, optional
+        Random generator, e.g., to draw several land data frames in a row. If `None` is
+        provided, a generator seeded with 0 is used.
+    reli_index : bool, default False
+        Whether to index the land data frame by the RELI of the pixels.
+
+    Returns
+    -------
+    ldf : LandDataFrame
+    """
+    if rng is None:
+        rng = np.random.default_rng(0)
+    num_rows, num_cols = shape
+    if num_pixels is None:
+        pixels = np.arange(num_rows * num_cols)
+    else:
+        pixels = np.sort(rng.choice(num_rows * num_cols, num_pixels, replace=False))
+    x, y = sls.rowcol_to_xy(*np.divmod(pixels, num_cols))
+    data = {"E_COORD": x, "N_COORD": y}
+    for column, (low, high) in columns.items():
+        data[column] = rng.integers(low, high, size=pixels.size, dtype=dtype)
+    index = pd.Index(sls.xy_to_reli(x, y), name="RELI") if reli_index else None
+    return sls.LandDataFrame(
+        pd.DataFrame(data, index=index),
+        x_column="E_COORD",
+        y_column="N_COORD",
+        crs=CRS.from_epsg(2056),
+        res=(100, 100),
+    )
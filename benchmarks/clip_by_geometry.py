@@ -0,0 +1,58 @@
+"""Run time of `LandDataFrame.clip_by_geometry` with the raster and sjoin methods.
+
+The methods are compared on the bundled `tests/input_data/sls.csv` file as well as on
+a synthetic land data frame covering a 1000x1500 pixel grid. Note that the "sjoin"
+method queries the (cached) STRtree of the pixel centroids rather than performing a
+geopandas spatial join, and that the raster method is slower on small land data frames
+because of the fixed cost of the rasterization.
+
+Usage: python benchmarks/clip_by_geometry.py
+"""
+
+import timeit
+
+from _utils import get_synthetic_ldf
+from shapely.geometry import Point
+
+import swisslandstats as sls
+
+SLS_FILEPATH = "tests/input_data/sls.csv"
+NUM_ROWS, NUM_COLS = 1000, 1500
+NUM_REPEATS = 5
+
+
+def get_geometry(ldf):
+    """Get a (non-rectangular) geometry covering about a quarter of `ldf`."""
+    x = ldf[ldf.x_column]
+    y = ldf[ldf.y_column]
+    return Point(x.mean() + 33, y.mean() + 33).buffer((x.max() - x.min()) / 3)
+
+
+if __name__ == "__main__":
+    for label, ldf in [
+        (SLS_FILEPATH, sls.read_csv(SLS_FILEPATH)),
+        (
+            f"synthetic {NUM_ROWS}x{NUM_COLS}",
+            get_synthetic_ldf((NUM_ROWS, NUM_COLS), {"LU_4": (1, 5)}),
+        ),
+    ]:
+        geometry = get_geometry(ldf)
+        # compute the grid index beforehand since it is cached
+        ldf.get_grid_index()
+        print(f"{label} ({len(ldf)} pixels):")
+        for method, method_label in [
+            ("raster", "raster"),
+            ("sjoin", "sjoin (STRtree query)"),
+        ]:
+            t = min(
+                timeit.repeat(
+                    lambda: ldf.clip_by_geometry(geometry, method=method),
+                    number=1,
+                    repeat=NUM_REPEATS,
+                )
+            )
+            num_pixels = len(ldf.clip_by_geometry(geometry, method=method))
+            print(
+                f"{method_label:>22}: {t * 1000:10.2f} ms "
+                f"({num_pixels} pixels selected)"
+            )
@@ -0,0 +1,67 @@
+"""Run time and peak memory of `merge_many` versus chained outer merges.
+
+Four synthetic land data frames of 10 uint8 columns each, covering different shares
+of a 2000x2000 pixel grid, are merged (as when joining SLS, STATPOP, BDS and STATENT).
+
+Usage: python benchmarks/merge_many.py
+"""
+
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+from _utils import get_synthetic_ldf
+
+import swisslandstats as sls
+
+GRID_SIZE = 2000
+SHARES = [0.5, 0.25, 0.15, 0.4]
+NUM_COLUMNS = 10
+
+
+def get_ldfs():
+    """Get the synthetic land data frames."""
+    # a single generator so that each land data frame covers different pixels
+    rng = np.random.default_rng(0)
+    return [
+        get_synthetic_ldf(
+            (GRID_SIZE, GRID_SIZE),
+            {f"C{k}_{i}": (1, 100) for i in range(NUM_COLUMNS)},
+            dtype="uint8",
+            num_pixels=int(share * GRID_SIZE**2),
+            rng=rng,
+            reli_index=True,
+        )
+        for k, share in enumerate(SHARES)
+    ]
+
+
+def chained_merge(ldfs):
+    """Merge the land data frames one after another with `pandas.merge`."""
+    result = ldfs[0]
+    for ldf in ldfs[1:]:
+        result = pd.merge(
+            result,
+            ldf[ldf.columns.difference(result.columns)],
+            how="outer",
+            left_index=True,
+            right_index=True,
+        )
+    return result
+
+
+if __name__ == "__main__":
+    ldfs = get_ldfs()
+    for label, func in [("chained", chained_merge), ("merge_many", sls.merge_many)]:
+        start = time.perf_counter()
+        func(ldfs)
+        elapsed = time.perf_counter() - start
+        tracemalloc.start()
+        result = func(ldfs)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(
+            f"{label:>10}: {elapsed:6.2f} s, peak {peak / 2**20:8.1f} MiB, "
+            f"result {result.memory_usage().sum() / 2**20:8.1f} MiB"
+        )
@@ -0,0 +1,58 @@
+"""Run time of `read_csv` with the c, pyarrow and polars engines.
+
+A synthetic CSV file with the shape of the SLS dataset (about 4.1 million hectares, the
+RELI, the E and N coordinates and 30 columns of small integer codes) is written to a
+temporary directory and parsed with each engine, reading either all the columns or
+only four of them. Each run takes place in a fresh process so that the memory retained
+by the allocators of the previous runs does not interfere.
+
+Usage: python benchmarks/read_csv_engines.py
+"""
+
+import os
+import tempfile
+import time
+from concurrent import futures
+
+import pandas as pd
+from _utils import get_synthetic_ldf
+
+import swisslandstats as sls
+
+NUM_ROWS = 4_100_000
+NUM_COLUMNS = 30
+ENGINES = ["c", "pyarrow", "polars"]
+
+
+def write_csv(filepath):
+    """Write the synthetic SLS-like CSV file."""
+    ldf = get_synthetic_ldf(
+        sls.GRID_SHAPE,
+        {f"LU{i:02d}_46": (101, 424) for i in range(NUM_COLUMNS)},
+        dtype="uint16",
+        num_pixels=NUM_ROWS,
+        reli_index=True,
+    )
+    pd.DataFrame(ldf).to_csv(filepath, sep=";")
+
+
+def time_read_csv(filepath, columns, engine):
+    """Time reading the CSV file with the given columns and engine."""
+    start = time.perf_counter()
+    sls.read_csv(filepath, columns=columns, engine=engine)
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        filepath = os.path.join(tmp_dir, "sls.csv")
+        write_csv(filepath)
+        print(f"file size: {os.path.getsize(filepath) / 2**20:.1f} MiB")
+        for columns in [None, ["LU00_46", "LU10_46", "LU20_46", "LU29_46"]]:
+            label = "all columns" if columns is None else f"{len(columns)} columns"
+            for engine in ENGINES:
+                with futures.ProcessPoolExecutor(1) as executor:
+                    elapsed = executor.submit(
+                        time_read_csv, filepath, columns, engine
+                    ).result()
+                print(f"{label:>12}, {engine:>8}: {elapsed:6.2f} s")
@@ -0,0 +1,61 @@
+"""Peak memory of `LandDataFrame.to_xarray`.
+
+Compares the preallocated single-buffer rasterization with the former approach, which
+built a list of 2D arrays (one per column) and then stacked them into the data array.
+
+Usage: python benchmarks/to_xarray_memory.py
+"""
+
+import tracemalloc
+
+import numpy as np
+import xarray as xr
+from _utils import get_synthetic_ldf
+
+import swisslandstats as sls
+
+NUM_ROWS, NUM_COLS = 1000, 1500
+NUM_COLUMNS = 15
+
+
+def legacy_to_xarray(ldf, columns, nodata=0, dtype="uint8"):
+    """Rasterize each column to its own array and stack them (former approach)."""
+    grid_index = ldf.get_grid_index()
+
+    def _to_ndarray(column):
+        arr = np.full(grid_index.shape, nodata, dtype=dtype)
+        arr[grid_index.rows, grid_index.cols] = np.where(
+            ldf[column].isna(), nodata, ldf[column]
+        )
+        return arr
+
+    return xr.DataArray([_to_ndarray(column) for column in columns])
+
+
+def get_peak(func, *args):
+    """Get the result of `func` and its peak of traced memory."""
+    tracemalloc.start()
+    result = func(*args)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, peak
+
+
+if __name__ == "__main__":
+    ldf = get_synthetic_ldf(
+        (NUM_ROWS, NUM_COLS), {f"LU{k:02d}_4": (1, 5) for k in range(NUM_COLUMNS)}
+    )
+    columns = [column for column in ldf.columns if column.startswith("LU")]
+    # compute the grid index beforehand so that it is not accounted for
+    ldf.get_grid_index()
+    ldf._get_flat_index()
+
+    for label, func in [
+        ("legacy", legacy_to_xarray),
+        ("preallocated", sls.LandDataFrame.to_xarray),
+    ]:
+        da, peak = get_peak(func, ldf, columns)
+        print(
+            f"{label:>12}: peak {peak / 2**20:8.1f} MiB, "
+            f"result {da.nbytes / 2**20:8.1f} MiB, ratio {peak / da.nbytes:.2f}"
+        )
@@ -0,0 +1,69 @@
+"""Run time of `LandDataFrame.zonal_stats` versus clipping and counting per zone.
+
+The zones are 26 synthetic "cantons" (the Voronoi polygons of random points) covering a
+synthetic land data frame of the size of the national hectare grid. The former approach
+clips the land data frame by each zone (with the sjoin method) and then counts its
+classes with `value_counts`.
+
+Usage: python benchmarks/zonal_stats.py
+"""
+
+import time
+
+import geopandas as gpd
+import numpy as np
+import shapely
+from _utils import get_synthetic_ldf
+
+import swisslandstats as sls
+
+NUM_ROWS, NUM_COLS = sls.GRID_SHAPE
+NUM_ZONES = 26
+COLUMNS = ["LU_4", "LU_46"]
+
+
+def get_zones(ldf):
+    """Get the synthetic cantons as a GeoSeries."""
+    rng = np.random.default_rng(0)
+    x_min, y_min = ldf[[ldf.x_column, ldf.y_column]].min()
+    x_max, y_max = ldf[[ldf.x_column, ldf.y_column]].max()
+    extent = shapely.box(x_min, y_min, x_max, y_max)
+    points = shapely.multipoints(
+        np.column_stack(
+            [
+                rng.uniform(x_min, x_max, NUM_ZONES),
+                rng.uniform(y_min, y_max, NUM_ZONES),
+            ]
+        )
+    )
+    polygons = shapely.get_parts(shapely.voronoi_polygons(points, extend_to=extent))
+    return gpd.GeoSeries(shapely.intersection(polygons, extent), crs=ldf.crs)
+
+
+def clip_and_count(ldf, zones):
+    """Clip the land data frame by each zone and count the classes (former approach)."""
+    return {
+        zone: {
+            column: zone_ldf[column].value_counts()
+            for column in COLUMNS
+            for zone_ldf in [ldf.clip_by_geometry(geometry, method="sjoin")]
+        }
+        for zone, geometry in zones.items()
+    }
+
+
+if __name__ == "__main__":
+    ldf = get_synthetic_ldf(
+        (NUM_ROWS, NUM_COLS), {"LU_4": (1, 5), "LU_46": (1, 47)}, dtype="uint8"
+    )
+    zones = get_zones(ldf)
+    # build the (cached) spatial index beforehand so that it is not accounted for
+    ldf.clip_by_geometry(zones.iloc[0], method="sjoin")
+    print(f"{len(ldf)} pixels, {len(zones)} zones:")
+    for label, func in [
+        ("clip and count", clip_and_count),
+        ("zonal_stats", lambda ldf, zones: ldf.zonal_stats(zones, COLUMNS)),
+    ]:
+        start = time.perf_counter()
+        func(ldf, zones)
+        print(f"{label:>15}: {time.perf_counter() - start:8.2f} s")
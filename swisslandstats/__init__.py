@@ -1,7 +1,14 @@
 """swisslandstats init."""
 
+from .coarsening import *
 from .dataframe import *
+from .focal_stats import *
 from .geometry import *
+from .grid import *
+from .landscape import *
 from .plotting import *
+from .registry import *
+from .transitions import *
+from .zonal import *
 
 __version__ = "0.12.0"
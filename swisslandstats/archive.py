@@ -0,0 +1,74 @@
+"""Members of zipped datasets."""
+
+import zipfile
+from pathlib import PurePath
+
+
+def select_member(names, which_member):
+    """
+    Select a member of an archive.
+
+    Parameters
+    ----------
+    names : list-like of str
+        Names (or paths) of the members.
+    which_member : int, str or callable, optional
+        The member to select, either by its position in `names`, by its name (which
+        matches the names or paths that end with it, e.g., "STATPOP2023.csv") or by
+        a predicate that takes a name and returns whether to select it (the first
+        matching member is selected). If `None` is provided, the archive must have a
+        single member.
+
+    Returns
+    -------
+    name : str
+        The name of the selected member.
+    """
+    names = list(names)
+    if which_member is None:
+        if len(names) != 1:
+            raise ValueError(
+                f"The archive has {len(names)} members, so `which_member` must be "
+                "provided."
+            )
+        return names[0]
+    if isinstance(which_member, int):
+        return names[which_member]
+    if isinstance(which_member, str):
+        parts = PurePath(which_member).parts
+
+        def which_member(name):
+            return PurePath(name).parts[-len(parts) :] == parts
+
+    for name in names:
+        if which_member(name):
+            return name
+    raise ValueError("No member of the archive matches `which_member`.")
+
+
+def open_member(filepath, which_member=None):
+    """
+    Open a member of a zip archive as a binary stream.
+
+    The member is read straight out of the archive, i.e., decompressed on the fly (or
+    read as is if it is stored without compression), so that it is never extracted to
+    disk.
+
+    Parameters
+    ----------
+    filepath : str or pathlib.Path
+        Path to the zip archive.
+    which_member : int, str or callable, optional
+        The member, see `select_member`. The positions refer to the file members, i.e.,
+        excluding the directories.
+
+    Returns
+    -------
+    member_file : file object
+        The binary stream of the member, which keeps the archive open until closed.
+    """
+    # the member keeps a reference to the archive file, which is therefore only closed
+    # when the member file is
+    with zipfile.ZipFile(filepath) as zip_file:
+        names = [info.filename for info in zip_file.infolist() if not info.is_dir()]
+        return zip_file.open(select_member(names, which_member))
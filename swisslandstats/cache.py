@@ -0,0 +1,156 @@
+"""Columnar cache of parsed datasets."""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+try:
+    import pyarrow as pa
+    from pyarrow import feather, parquet
+except ImportError:
+    pa = None
+
+CACHE_FORMATS = {"parquet": "parquet", "feather": "arrow"}
+
+_pa_warning_msg = """
+The parsed-data cache requires the pyarrow package, which can be installed as in:
+conda install -c conda-forge pyarrow
+Loading the dataset without cache.
+"""
+
+# key of the schema metadata entry where the LandDataFrame attributes are stored
+_METADATA_KEY = b"swisslandstats"
+
+
+def get_cache_filepath(cache_dir, cache_format, known_hash, read_csv_kwargs):
+    """
+    Get the path of the cached parsed dataset.
+
+    Parameters
+    ----------
+    cache_dir : str or pathlib.Path
+        Path to the cache directory.
+    cache_format : {"parquet", "feather"}
+        Format of the cached file.
+    known_hash : str
+        Hash of the downloaded (raw) file.
+    read_csv_kwargs : dict-like
+        Keyword arguments used to parse the file, which are hashed together with
+        `known_hash` to form the file name.
+
+    Returns
+    -------
+    cache_filepath : pathlib.Path
+    """
+    if cache_format not in CACHE_FORMATS:
+        raise ValueError(
+            f"Unknown cache format {cache_format!r}. "
+            f"Must be one of {list(CACHE_FORMATS)}."
+        )
+    kwargs_hash = hashlib.sha256(
+        json.dumps(read_csv_kwargs, sort_keys=True, default=str).encode()
+    ).hexdigest()
+    # strip the (optional) algorithm prefix, e.g., "sha256:"
+    known_hash = known_hash.split(":")[-1]
+    return (
+        Path(cache_dir)
+        / f"{known_hash[:16]}-{kwargs_hash[:16]}.{CACHE_FORMATS[cache_format]}"
+    )
+
+
+def read_cache(cache_filepath, cache_format):
+    """
+    Read a cached parsed dataset.
+
+    The file is memory-mapped. The columns of the (uncompressed) feather files are
+    converted to the data frame without copies whenever their data types allow it,
+    e.g., numeric columns without missing values, whereas the parquet files are
+    decoded into memory.
+
+    Parameters
+    ----------
+    cache_filepath : str or pathlib.Path
+        Path to the cached file.
+    cache_format : {"parquet", "feather"}
+        Format of the cached file.
+
+    Returns
+    -------
+    df : pandas.DataFrame
+        The data frame, with the index already set.
+    attrs : dict
+        The LandDataFrame attributes, i.e., "x_column", "y_column", "crs" (as string)
+        and "res".
+    """
+    if cache_format == "parquet":
+        table = parquet.read_table(cache_filepath, memory_map=True)
+    else:
+        table = feather.read_table(cache_filepath, memory_map=True)
+    attrs = json.loads(table.schema.metadata[_METADATA_KEY])
+    # split the blocks so that each column is converted (without copying it when
+    # possible) rather than consolidated into two-dimensional blocks, and release each
+    # column of the table once converted
+    return table.to_pandas(split_blocks=True, self_destruct=True), attrs
+
+
+def write_cache(df, attrs, cache_filepath, cache_format):
+    """
+    Write a parsed dataset to the cache.
+
+    The file is first written to a temporary path and then renamed, so that concurrent
+    processes never read a partially written file.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        The data frame.
+    attrs : dict
+        The LandDataFrame attributes, i.e., "x_column", "y_column", "crs" (as string)
+        and "res".
+    cache_filepath : str or pathlib.Path
+        Path to the cached file.
+    cache_format : {"parquet", "feather"}
+        Format of the cached file.
+    """
+    table = pa.Table.from_pandas(df)
+    table = table.replace_schema_metadata(
+        {**table.schema.metadata, _METADATA_KEY: json.dumps(attrs).encode()}
+    )
+    cache_filepath = Path(cache_filepath)
+    cache_filepath.parent.mkdir(parents=True, exist_ok=True)
+    tmp_filepath = cache_filepath.with_name(f"{cache_filepath.name}.{os.getpid()}.tmp")
+    if cache_format == "parquet":
+        parquet.write_table(table, tmp_filepath)
+    else:
+        # write uncompressed so that the columns of the memory-mapped file can be
+        # converted without copies (see `read_cache`)
+        feather.write_feather(table, tmp_filepath, compression="uncompressed")
+    os.replace(tmp_filepath, cache_filepath)
+
+
+def read_cache_columns(cache_filepath, cache_format):
+    """
+    Read the column names of a cached parsed dataset.
+
+    Only the schema of the file is read.
+
+    Parameters
+    ----------
+    cache_filepath : str or pathlib.Path
+        Path to the cached file.
+    cache_format : {"parquet", "feather"}
+        Format of the cached file.
+
+    Returns
+    -------
+    columns : list of str
+        The column names, excluding the index.
+    """
+    if cache_format == "parquet":
+        schema = parquet.read_schema(cache_filepath)
+    else:
+        with pa.memory_map(str(cache_filepath)) as source:
+            schema = pa.ipc.open_file(source).schema
+    index_columns = schema.pandas_metadata.get("index_columns", [])
+    return [name for name in schema.names if name not in index_columns]
@@ -0,0 +1,154 @@
+"""Aggregation to coarser grids."""
+
+import numpy as np
+import pandas as pd
+
+__all__ = ["coarsen"]
+
+COARSEN_FUNCS = ["sum", "mean", "count", "mode", "share"]
+
+_coarsen_doc = """
+Aggregate the pixels to a coarser grid
+
+The pixels are assigned to the coarse pixel that contains them with integer arithmetic
+on their coordinates, and the data columns are then aggregated with grouped
+`np.bincount` reductions. The pixels are grouped by their coordinates rounded down to a
+multiple of the coarse resolution, so that, e.g., a factor of 10 aggregates the
+hectares to the kilometric grid. Like the coordinates of the pixels, the coordinates of
+each coarse pixel are the ones of its centroid, i.e., the coordinates rounded down plus
+half the difference between the coarse and the original resolution, so that the
+coarse grid (e.g., its transform and bounds) is aligned with the original one.
+
+Parameters
+----------%s
+factor : int
+    number of pixels of each side of the coarse pixels, e.g., 10 and 100 to aggregate
+    hectare pixels to 1 km and 10 km respectively.
+agg : str or dict
+    aggregation function of the data columns, either a single one for all the data
+    columns or a mapping of column names to their function (the columns not mapped are
+    dropped). The functions are "sum", "mean", "count" (number of pixels with data),
+    "mode" (most frequent value, the smallest one in case of ties) and "share" (the
+    proportion of the pixels with data that have each class, returned as a
+    "<column>_<class>" column for each class of the column). Missing values are
+    ignored.
+
+Returns
+-------
+result : LandDataFrame
+    land data frame with a row for each coarse pixel that contains at least one pixel,
+    with the resolution multiplied by `factor`.
+"""
+
+
+def _get_parent_coords(parent_index, res, factor, dtype):
+    # centroid coordinates of the coarse pixels given their integer index along an axis,
+    # which keep the integer dtype of the coordinates whenever the offset is integral
+    coarse_res = res * factor
+    offset = (coarse_res - res) / 2
+    parent_coords = parent_index * coarse_res + offset
+    if np.issubdtype(dtype, np.integer) and offset != int(offset):
+        return parent_coords
+    return parent_coords.astype(dtype)
+
+
+def _get_parent_codes(x, y, res, factor):
+    # integer code of the coarse pixel of each pixel (sorted by the coarse x and then y
+    # coordinates), and the x and y coordinates of the (centroids of the) coarse pixels
+    xres, yres = res
+    x = np.asarray(x)
+    y = np.asarray(y)
+    parent_cols = x // (xres * factor)
+    parent_rows = y // (yres * factor)
+    col_min = parent_cols.min()
+    row_min = parent_rows.min()
+    num_parent_rows = int(parent_rows.max() - row_min) + 1
+    keys = (parent_cols - col_min).astype(np.int64) * num_parent_rows + (
+        parent_rows - row_min
+    ).astype(np.int64)
+    keys, parent_codes = np.unique(keys, return_inverse=True)
+    key_cols, key_rows = np.divmod(keys, num_parent_rows)
+    parent_x = _get_parent_coords(key_cols + col_min, xres, factor, x.dtype)
+    parent_y = _get_parent_coords(key_rows + row_min, yres, factor, y.dtype)
+    return parent_codes, parent_x, parent_y
+
+
+def _aggregate(ser, func, parent_codes, num_parents):
+    # dict of the aggregated column(s) of `ser` with the given function
+    valid = ser.notna().to_numpy()
+    codes = parent_codes[valid]
+    count = np.bincount(codes, minlength=num_parents)
+    if func == "count":
+        return {ser.name: count}
+    if func in ["sum", "mean"]:
+        # the dtype is checked on the series since nullable integer and boolean columns
+        # convert to object arrays
+        is_integer = pd.api.types.is_integer_dtype(ser.dtype) or (
+            pd.api.types.is_bool_dtype(ser.dtype)
+        )
+        values = ser[valid].to_numpy(dtype=np.int64 if is_integer else float)
+        total = np.bincount(codes, weights=values, minlength=num_parents)
+        if func == "sum":
+            if is_integer:
+                total = total.astype(np.int64)
+            return {ser.name: total}
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return {ser.name: total / count}
+
+    classes = pd.Index(ser[valid].unique()).sort_values()
+    num_classes = len(classes)
+    class_counts = np.bincount(
+        codes.astype(np.int64) * num_classes + classes.get_indexer(ser[valid]),
+        minlength=num_parents * num_classes,
+    ).reshape(num_parents, num_classes)
+    if func == "share":
+        with np.errstate(invalid="ignore", divide="ignore"):
+            shares = class_counts / count[:, np.newaxis]
+        return {
+            f"{ser.name}_{_class}": shares[:, i] for i, _class in enumerate(classes)
+        }
+    # mode, where `argmax` returns the first (i.e., smallest) class in case of ties
+    mode = classes.take(class_counts.argmax(axis=1)).to_numpy()
+    if not np.all(count):
+        mode = pd.Series(mode).where(count > 0).to_numpy()
+    return {ser.name: mode}
+
+
+def coarsen(ldf, factor, agg):  # noqa: D103
+    if int(factor) != factor or factor < 1:
+        raise ValueError(f"The factor must be a positive integer, got {factor}.")
+    factor = int(factor)
+    if isinstance(agg, str):
+        agg = {
+            column: agg
+            for column in ldf.columns.difference(
+                [ldf.x_column, ldf.y_column], sort=False
+            )
+        }
+    unknown_funcs = set(agg.values()).difference(COARSEN_FUNCS)
+    if unknown_funcs:
+        raise ValueError(
+            f"Unknown functions {unknown_funcs}. Must be in {COARSEN_FUNCS}."
+        )
+
+    coarse_res = tuple(r * factor for r in ldf.res)
+    parent_codes, parent_x, parent_y = _get_parent_codes(
+        ldf[ldf.x_column], ldf[ldf.y_column], ldf.res, factor
+    )
+    data = {}
+    for column, func in agg.items():
+        data.update(_aggregate(ldf[column], func, parent_codes, len(parent_x)))
+
+    return type(ldf)._from_pixel_data(
+        data,
+        parent_x,
+        parent_y,
+        res=coarse_res,
+        crs=ldf.crs,
+        index_column=ldf.index.name,
+        x_column=ldf.x_column,
+        y_column=ldf.y_column,
+    )
+
+
+coarsen.__doc__ = _coarsen_doc % "\nldf : LandDataFrame"
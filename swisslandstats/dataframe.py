@@ -1,17 +1,59 @@
 """Land data frame."""
 
+import logging as lg
+import multiprocessing
+import operator
+import os
+import warnings
+import weakref
+import zipfile
+from collections import namedtuple
+from concurrent import futures
+
 import numpy as np
 import pandas as pd
 import pooch
 import rasterio as rio
 import xarray as xr
-from rasterio import transform
+from rasterio import shutil as rio_shutil
+from rasterio import transform, windows
 from rasterio.crs import CRS
 
+from . import archive as sls_archive
+from . import cache as sls_cache
+from . import coarsening as sls_coarsening
+from . import focal_stats as sls_focal_stats
 from . import geometry as sls_geometry
-from . import plotting, settings, utils
-
-__all__ = ["LandDataFrame", "merge", "read_csv", "load_dataset"]
+from . import grid, plotting, settings, utils
+from . import landscape as sls_landscape
+from . import registry as sls_registry
+from . import transitions as sls_transitions
+from . import zonal as sls_zonal
+
+try:
+    import dask.array as dask_array
+except ImportError:
+    dask_array = None
+
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+try:
+    from scipy import sparse as sp_sparse
+except ImportError:
+    sp_sparse = None
+
+__all__ = [
+    "LandDataFrame",
+    "merge",
+    "merge_many",
+    "read_csv",
+    "rasterize_chunks",
+    "aggregate_chunks",
+    "load_dataset",
+    "load_datasets",
+]
 
 _merge_doc = """
 Merges LandDataFrame objects.
@@ -37,6 +79,142 @@ Returns
 result : LandDataFrame
 """
 
+_scipy_error_msg = (
+    "Sparse rasterization requires the scipy package, which can be installed as in:\n"
+    "conda install -c conda-forge scipy"
+)
+
+_dask_error_msg = (
+    "Lazy rasterization requires the dask package, which can be installed as in:\n"
+    "conda install -c conda-forge dask"
+)
+
+_pa_engine_warning_msg = """
+The pyarrow engine requires the pyarrow package, which can be installed as in:
+conda install -c conda-forge pyarrow
+Parsing with the c engine.
+"""
+
+_pl_engine_warning_msg = """
+The polars engine requires the polars package, which can be installed as in:
+conda install -c conda-forge polars
+Parsing with the c engine.
+"""
+
+GridIndex = namedtuple("GridIndex", ["origin", "shape", "rows", "cols"])
+GridIndex.__doc__ = """
+Grid index of a LandDataFrame.
+
+Attributes
+----------
+origin : tuple
+    The (x, y) coordinates of the upper-left corner of the grid.
+shape : tuple
+    The (number of rows, number of columns) of the grid.
+rows, cols : np.ndarray
+    The integer row and column of the pixel of each row of the LandDataFrame.
+"""
+
+
+class _GridCache(dict):
+    # dict to cache data derived from the pixel coordinates of a LandDataFrame. The
+    # `key` attribute identifies the coordinates from which the data was derived and
+    # the cache is dropped when pickling (the key would no longer be valid)
+    def __init__(self, key=None):
+        super().__init__()
+        self.key = key
+
+    def __reduce__(self):
+        return (_GridCache, ())
+
+
+class _GridCacheRef(weakref.ref):
+    # weak reference to the grid cache of a LandDataFrame, which is propagated to the
+    # land data frames derived from it (via `_metadata`) so that the ones with the same
+    # coordinates can share the cache, whereas the other ones (e.g., slices) do not keep
+    # it alive. The reference is dropped when pickling
+    def __reduce__(self):
+        return (type(None), ())
+
+
+def _get_array_key(values):
+    # identify an array by its memory location (rather than its contents) so that the
+    # key can be obtained in constant time
+    if isinstance(values, np.ndarray):
+        return (
+            values.__array_interface__["data"][0],
+            values.shape,
+            values.strides,
+            values.dtype.str,
+        )
+    return (id(values), len(values))
+
+
+class _LazyRaster:
+    # array-like (n_columns, rows, cols) raster of a land data frame, whose blocks are
+    # only rasterized when sliced, so that it can back a dask array. The pixels are
+    # sorted by row so that each block only visits the pixels in its rows
+    def __init__(self, ldf, columns, nodata, dtype, origin, shape):
+        self.ldf = ldf
+        self.columns = columns
+        self.nodata = nodata
+        self.dtype = np.dtype(dtype)
+        self.shape = (len(columns),) + tuple(shape)
+        self.ndim = 3
+        if origin is None:
+            grid_index = ldf.get_grid_index()
+            rows, cols = grid_index.rows, grid_index.cols
+            positions = np.arange(len(ldf))
+        else:
+            rows, cols, mask = ldf._get_window_index(origin, shape)
+            positions = np.flatnonzero(mask)
+        order = np.argsort(rows, kind="stable")
+        self.rows = rows[order]
+        self.cols = cols[order]
+        self.positions = positions[order]
+
+    def __getitem__(self, key):
+        # dask may fuse integer indexing (e.g., selecting a single column) into the
+        # slicing, so integer indices are turned into slices and squeezed at the end
+        if not isinstance(key, tuple):
+            key = (key,)
+        key = key + (slice(None),) * (self.ndim - len(key))
+        slices = []
+        squeeze_key = []
+        for _key, n in zip(key, self.shape):
+            if isinstance(_key, slice):
+                slices.append(slice(*_key.indices(n)))
+                squeeze_key.append(slice(None))
+            else:
+                _key = operator.index(_key) % n
+                slices.append(slice(_key, _key + 1))
+                squeeze_key.append(0)
+        band_slice, row_slice, col_slice = slices
+        row_start, row_stop = row_slice.start, row_slice.stop
+        col_start, col_stop = col_slice.start, col_slice.stop
+        start, stop = np.searchsorted(self.rows, [row_start, row_stop])
+        cols = self.cols[start:stop]
+        in_block = (cols >= col_start) & (cols < col_stop)
+        flat_index = np.ravel_multi_index(
+            (self.rows[start:stop][in_block] - row_start, cols[in_block] - col_start),
+            (row_stop - row_start, col_stop - col_start),
+        )
+        positions = self.positions[start:stop][in_block]
+        columns = self.columns[band_slice]
+        out = np.full(
+            (len(columns), row_stop - row_start, col_stop - col_start),
+            self.nodata,
+            dtype=self.dtype,
+        )
+        flat_out = out.reshape(len(columns), -1)
+        for k, column in enumerate(columns):
+            flat_out[k, flat_index] = (
+                self.ldf[column]
+                .iloc[positions]
+                .to_numpy(dtype=self.dtype, na_value=self.nodata)
+            )
+        return out[tuple(squeeze_key)]
+
 
 class LandDataFrame(pd.DataFrame):
     """
@@ -49,7 +227,7 @@ class LandDataFrame(pd.DataFrame):
     """
 
     # so that pandas can allow setting this class attributes
-    _metadata = ["x_column", "y_column", "crs", "res"]
+    _metadata = ["x_column", "y_column", "crs", "res", "_grid_cache_ref"]
 
     # index_column = settings.DEFAULT_INDEX_COLUMN
 
@@ -75,7 +253,10 @@ class LandDataFrame(pd.DataFrame):
         data : ndarray (structured or homogeneous), Iterable, dict or DataFrame
             Data that will be passed to the initialization method of `pd.DataFrame`.
         index_column : str
-            Label of the index column.
+            Label of the index column. If the column does not exist but the index
+            column is the RELI (i.e., `settings.DEFAULT_INDEX_COLUMN`) and the
+            resolution is the one of the hectare grid, the RELI index is derived from
+            the x and y coordinates.
         x_column, y_column : str
             Labels of the x and y coordinates column respectively.
         crs : str or rasterio CRS
@@ -96,10 +277,23 @@ class LandDataFrame(pd.DataFrame):
                 self.index = self[index_column]
                 self.drop(columns=index_column, inplace=True)
             except KeyError:
-                utils.log(
-                    "Ignoring attempt to set non-existent "
-                    f"{index_column} column as index",
-                )
+                if (
+                    index_column == settings.DEFAULT_INDEX_COLUMN
+                    and res is not None
+                    and tuple(res) == settings.DEFAULT_RES
+                    and x_column in self.columns
+                    and y_column in self.columns
+                ):
+                    # the RELI can be derived from the coordinates of the hectares
+                    self.index = pd.Index(
+                        grid.xy_to_reli(self[x_column], self[y_column]),
+                        name=index_column,
+                    )
+                else:
+                    utils.log(
+                        "Ignoring attempt to set non-existent "
+                        f"{index_column} column as index",
+                    )
 
         # set the rest of attributes
         self.x_column = x_column
@@ -107,29 +301,513 @@ class LandDataFrame(pd.DataFrame):
         self.crs = crs
         self.res = res
 
-    def get_transform(self):
+    @classmethod
+    def _from_pixel_data(
+        cls, data, x, y, *, res, crs, index_column, x_column, y_column
+    ):
+        # instantiate a land data frame from the values of the data columns (`data`)
+        # and the x and y coordinates of the pixel centroids. The RELI index is only
+        # reconstructed for hectare grids
+        if index_column is None:
+            index_column = settings.DEFAULT_INDEX_COLUMN
+        if x_column is None:
+            x_column = settings.DEFAULT_X_COLUMN
+        if y_column is None:
+            y_column = settings.DEFAULT_Y_COLUMN
+        if crs is None:
+            crs = CRS.from_string(settings.DEFAULT_CRS)
+        elif isinstance(crs, str):
+            crs = CRS.from_string(crs)
+        res = tuple(int(r) if float(r).is_integer() else float(r) for r in res)
+        if res == settings.DEFAULT_RES:
+            _data = {index_column: grid.xy_to_reli(x, y)}
+        else:
+            utils.log(
+                f"Not setting the {index_column} index since the resolution {res} is "
+                f"not the one of the hectare grid {settings.DEFAULT_RES}",
+            )
+            _data = {}
+        _data.update({x_column: x, y_column: y})
+        _data.update(data)
+        return cls(
+            _data,
+            index_column=index_column,
+            x_column=x_column,
+            y_column=y_column,
+            crs=crs,
+            res=res,
+        )
+
+    @classmethod
+    def from_ndarray(
+        cls,
+        arr,
+        *,
+        transform,
+        columns=None,
+        nodata=0,
+        crs=None,
+        index_column=None,
+        x_column=None,
+        y_column=None,
+    ):
         """
-        Get the affine transform of the current land data frame.
+        Instantiate a land data frame from a raster array.
+
+        Each pixel with data in at least one band becomes a row of the land data frame,
+        whose x and y coordinates are the pixel centroids. If the resolution is the one
+        of the hectare grid, the RELI index is reconstructed from the coordinates.
+
+        Parameters
+        ----------
+        arr : np.ndarray
+            A (rows, cols) raster array or a (bands, rows, cols) array.
+        transform : Affine
+            The affine transform of the raster.
+        columns : list of str, optional
+            names of the data columns (one for each band). If not provided, the columns
+            are named as "band_1", "band_2" and so on.
+        nodata : numeric, list-like of numeric or None, default 0
+            value (or values for each band) of the pixels with no data. If None, all
+            the pixels are considered to have data.
+        crs : str or rasterio CRS, optional
+            Coordinate reference system. If not provided, the value set in
+            `settings.DEFAULT_CRS` will be taken.
+        index_column, x_column, y_column : str, optional
+            Labels of the index, x and y coordinates columns respectively. If not
+            provided, the values set in `settings.DEFAULT_INDEX_COLUMN`,
+            `settings.DEFAULT_X_COLUMN` and `settings.DEFAULT_Y_COLUMN` will be taken.
 
         Returns
         -------
-        transform : Affine
+        ldf : LandDataFrame
+        """
+        arr = np.asarray(arr)
+        if arr.ndim == 2:
+            arr = arr[np.newaxis]
+        if columns is None:
+            columns = [f"band_{band}" for band in range(1, len(arr) + 1)]
+        if nodata is None or np.ndim(nodata) == 0:
+            nodata = [nodata] * len(arr)
+        data, x, y = _get_pixel_data(arr, nodata, transform)
+        return cls._from_pixel_data(
+            dict(zip(columns, data)),
+            x,
+            y,
+            res=(transform.a, -transform.e),
+            crs=crs,
+            index_column=index_column,
+            x_column=x_column,
+            y_column=y_column,
+        )
+
+    @classmethod
+    def from_xarray(
+        cls,
+        da,
+        *,
+        nodata=None,
+        crs=None,
+        index_column=None,
+        x_column=None,
+        y_column=None,
+    ):
         """
+        Instantiate a land data frame from a xarray data array or dataset.
+
+        Each pixel with data in at least one band (or variable) becomes a row of the
+        land data frame, whose x and y coordinates are the pixel centroids. If the
+        resolution is the one of the hectare grid, the RELI index is reconstructed
+        from the coordinates. This is the inverse of `to_xarray` and `to_dataset`.
+
+        Parameters
+        ----------
+        da : xr.DataArray or xr.Dataset
+            A data array with (y, x) or (band, y, x) dimensions, or a dataset whose
+            variables have (y, x) dimensions. The x and y coordinates must be the
+            evenly spaced pixel centroids.
+        nodata : numeric, optional
+            value of the pixels with no data. If not provided, the value of the
+            "nodata" attribute of the data array (or of each variable of the dataset)
+            is taken, and if there is no such attribute, all the pixels are considered
+            to have data.
+        crs : str or rasterio CRS, optional
+            Coordinate reference system. If not provided, the value of the
+            "pyproj_srs" attribute is taken (or `settings.DEFAULT_CRS` if there is no
+            such attribute).
+        index_column : str, optional
+            Label of the index column. If not provided, the value set in
+            `settings.DEFAULT_INDEX_COLUMN` will be taken.
+        x_column, y_column : str, optional
+            Labels of the x and y coordinates columns respectively. If not provided,
+            the names of the x and y dimensions will be taken.
+
+        Returns
+        -------
+        ldf : LandDataFrame
+        """
+        if isinstance(da, xr.Dataset):
+            arrays = [da[var] for var in da.data_vars]
+            columns = list(da.data_vars)
+        elif da.ndim == 2:
+            arrays = [da]
+            columns = [da.name if da.name is not None else "band_1"]
+        else:
+            arrays = list(da)
+            columns = da[da.dims[0]].values.tolist()
+        if nodata is None:
+            nodata = [arr.attrs.get("nodata", da.attrs.get("nodata")) for arr in arrays]
+        else:
+            nodata = [nodata] * len(arrays)
+        y_dim, x_dim = arrays[0].dims[-2:]
+        if x_column is None:
+            x_column = x_dim
+        if y_column is None:
+            y_column = y_dim
+        if crs is None:
+            crs = da.attrs.get("pyproj_srs")
+
+        x_coords = da[x_dim].values
+        y_coords = da[y_dim].values
+        xres, yres = settings.DEFAULT_RES
+        if len(x_coords) > 1:
+            xres = x_coords[1] - x_coords[0]
+        if len(y_coords) > 1:
+            yres = y_coords[0] - y_coords[1]
+        _transform = transform.from_origin(
+            x_coords[0] - xres / 2, y_coords[0] + yres / 2, xres, yres
+        )
+        data, x, y = _get_pixel_data(
+            [arr.transpose(y_dim, x_dim).values for arr in arrays], nodata, _transform
+        )
+        return cls._from_pixel_data(
+            dict(zip(columns, data)),
+            x,
+            y,
+            res=(xres, yres),
+            crs=crs,
+            index_column=index_column,
+            x_column=x_column,
+            y_column=y_column,
+        )
+
+    @classmethod
+    def from_geotiff(
+        cls,
+        fp,
+        *,
+        bands=None,
+        columns=None,
+        nodata=None,
+        window_height=None,
+        index_column=None,
+        x_column=None,
+        y_column=None,
+    ):
+        """
+        Instantiate a land data frame from a GeoTIFF file.
+
+        Each pixel with data in at least one band becomes a row of the land data frame,
+        whose x and y coordinates are the pixel centroids. If the resolution is the one
+        of the hectare grid, the RELI index is reconstructed from the coordinates.
+
+        Parameters
+        ----------
+        fp : str, file object or pathlib.Path object
+            A filename or URL, a file object opened in binary ('rb') mode, or a Path
+            object.
+        bands : list of int, optional
+            indices (starting at 1) of the bands to read. If not provided, all the bands
+            are read.
+        columns : list of str, optional
+            names of the data columns (one for each band). If not provided, the band
+            descriptions (as set by `to_geotiff`) are taken, or if the bands have no
+            descriptions, the columns are named as "band_1", "band_2" and so on.
+        nodata : numeric, optional
+            value of the pixels with no data. If not provided, the nodata value of each
+            band is taken, and if a band has no nodata value, all its pixels are
+            considered to have data.
+        window_height : int, optional
+            If provided, the file is read in windows of `window_height` rows so that
+            only one window is in memory at a time (besides the pixels with data).
+            Otherwise, all the bands are read at once.
+        index_column, x_column, y_column : str, optional
+            Labels of the index, x and y coordinates columns respectively. If not
+            provided, the values set in `settings.DEFAULT_INDEX_COLUMN`,
+            `settings.DEFAULT_X_COLUMN` and `settings.DEFAULT_Y_COLUMN` will be taken.
+
+        Returns
+        -------
+        ldf : LandDataFrame
+        """
+        with rio.open(fp) as src:
+            if bands is None:
+                bands = list(range(1, src.count + 1))
+            if columns is None:
+                descriptions = [src.descriptions[band - 1] for band in bands]
+                if all(descriptions):
+                    columns = descriptions
+                else:
+                    columns = [f"band_{band}" for band in bands]
+            if nodata is None:
+                nodata = [src.nodatavals[band - 1] for band in bands]
+            else:
+                nodata = [nodata] * len(bands)
+            if window_height is None:
+                window_height = src.height
+
+            data_pieces, x_pieces, y_pieces = [], [], []
+            for row_off in range(0, src.height, window_height):
+                window = windows.Window(
+                    0, row_off, src.width, min(window_height, src.height - row_off)
+                )
+                data, x, y = _get_pixel_data(
+                    src.read(bands, window=window),
+                    nodata,
+                    src.window_transform(window),
+                )
+                data_pieces.append(data)
+                x_pieces.append(x)
+                y_pieces.append(y)
+            _transform = src.transform
+            crs = src.crs
+
+        return cls._from_pixel_data(
+            {
+                column: np.concatenate([data[k] for data in data_pieces])
+                for k, column in enumerate(columns)
+            },
+            np.concatenate(x_pieces),
+            np.concatenate(y_pieces),
+            res=(_transform.a, -_transform.e),
+            crs=crs,
+            index_column=index_column,
+            x_column=x_column,
+            y_column=y_column,
+        )
+
+    def _get_grid_cache(self):
         x = self[self.x_column].values
         y = self[self.y_column].values
+        key = (
+            self.x_column,
+            self.y_column,
+            tuple(self.res),
+            _get_array_key(x),
+            _get_array_key(y),
+        )
+        grid_cache = getattr(self, "_grid_cache", None)
+        if grid_cache is None or grid_cache.key != key:
+            # the cache of the land data frame from which this one has been derived (if
+            # it is still alive) can be reused if the coordinates are the same
+            grid_cache_ref = getattr(self, "_grid_cache_ref", None)
+            grid_cache = grid_cache_ref() if grid_cache_ref is not None else None
+            if grid_cache is None or grid_cache.key != key:
+                # note that we create a new cache rather than clearing the existing one
+                # because the latter may be shared with other land data frames
+                grid_cache = _GridCache(key)
+                # keep a reference to the coordinate arrays so that their memory (and
+                # therefore the key) cannot be reused while cached
+                grid_cache["xy"] = (x, y)
+            # only the weak reference is propagated to the derived land data frames
+            object.__setattr__(self, "_grid_cache", grid_cache)
+            object.__setattr__(self, "_grid_cache_ref", _GridCacheRef(grid_cache))
+        return grid_cache
+
+    def get_grid_index(self):
+        """
+        Get the grid index of the current land data frame.
 
+        The grid index is computed lazily and cached, so that it is shared by all the
+        raster exports. The cache is invalidated when the x or y columns or the
+        resolution change. Note that in-place modifications of the values of the
+        coordinate columns are not detected, so the columns must be reassigned instead.
+        An empty land data frame does not span any grid, so a ValueError is raised, as
+        in all the raster exports that depend on the grid index.
+
+        Returns
+        -------
+        grid_index : GridIndex
+            Named tuple with the origin, shape and integer row and column arrays.
+        """
+        if len(self) == 0:
+            raise ValueError(
+                "The land data frame is empty, so it does not span any pixel grid."
+            )
+        grid_cache = self._get_grid_cache()
+        try:
+            return grid_cache["grid_index"]
+        except KeyError:
+            pass
+
+        x, y = (np.asarray(coords) for coords in grid_cache["xy"])
         xres, yres = self.res
+        x_min = x.min().item()
+        y_max = y.max().item()
+        rows = ((y_max - y) // yres).astype(np.intp, copy=False)
+        cols = ((x - x_min) // xres).astype(np.intp, copy=False)
+        grid_index = GridIndex(
+            origin=(x_min - xres // 2, y_max + yres // 2),
+            shape=(int(rows.max()) + 1, int(cols.max()) + 1),
+            rows=rows,
+            cols=cols,
+        )
+        grid_cache["grid_index"] = grid_index
+        return grid_index
+
+    def get_grid_key(self):
+        """
+        Get the grid key of each pixel of the current land data frame.
+
+        The grid key is the flat index of the pixel in the national hectare grid (see
+        `xy_to_grid_key`), i.e., a dense int32 key for integer-based joins, lookups
+        and neighborhood operations. It is computed lazily and cached as the grid
+        index (see `get_grid_index`).
+
+        Returns
+        -------
+        grid_key : np.ndarray
+            The int32 grid key of each row of the land data frame.
+        """
+        if tuple(self.res) != settings.DEFAULT_RES:
+            raise ValueError(
+                f"The grid key requires the hectare grid resolution "
+                f"{settings.DEFAULT_RES}, got {self.res}."
+            )
+        grid_cache = self._get_grid_cache()
+        try:
+            return grid_cache["grid_key"]
+        except KeyError:
+            grid_key = grid.xy_to_grid_key(*grid_cache["xy"])
+            grid_cache["grid_key"] = grid_key
+            return grid_key
+
+    def get_transform(self):
+        """
+        Get the affine transform of the current land data frame.
 
-        x_origin = min(x) - xres // 2
-        y_origin = max(y) + yres // 2
-        return transform.from_origin(x_origin, y_origin, xres, yres)
+        Returns
+        -------
+        transform : Affine
+        """
+        xres, yres = self.res
+        return transform.from_origin(*self.get_grid_index().origin, xres, yres)
+
+    def _get_flat_index(self):
+        # linear index of each pixel in the (raveled) grid, which makes the scatter
+        # faster than indexing with the rows and columns separately
+        grid_cache = self._get_grid_cache()
+        try:
+            return grid_cache["flat_index"]
+        except KeyError:
+            grid_index = self.get_grid_index()
+            flat_index = np.ravel_multi_index(
+                (grid_index.rows, grid_index.cols), grid_index.shape
+            )
+            grid_cache["flat_index"] = flat_index
+            return flat_index
+
+    def _get_window(self, bounds):
+        # origin and shape of the smallest window of the land data frame grid that
+        # covers `bounds`, i.e., a (left, bottom, right, top) tuple
+        left, bottom, right, top = bounds
+        x_origin, y_origin = self.get_grid_index().origin
+        xres, yres = self.res
+        col_start = int(np.floor((left - x_origin) / xres))
+        col_stop = int(np.ceil((right - x_origin) / xres))
+        row_start = int(np.floor((y_origin - top) / yres))
+        row_stop = int(np.ceil((y_origin - bottom) / yres))
+        if row_start >= row_stop or col_start >= col_stop:
+            raise ValueError(f"Empty window for bounds {bounds}.")
+        return (
+            (x_origin + col_start * xres, y_origin - row_start * yres),
+            (row_stop - row_start, col_stop - col_start),
+        )
 
-    def _to_ndarray(self, column, i, j, nodata, dtype):
-        arr = np.full((i.max() + 1, j.max() + 1), nodata, dtype=dtype)
-        arr[-i, j] = np.where(self[column].isna(), nodata, self[column])
-        return arr
+    def _get_window_index(self, origin, shape):
+        # integer row and column of each pixel in the grid of the given origin and
+        # shape (only for the pixels that lie within it), and boolean mask of the
+        # pixels that lie within it
+        x = np.asarray(self[self.x_column].values)
+        y = np.asarray(self[self.y_column].values)
+        xres, yres = self.res
+        rows = ((origin[1] - y) // yres).astype(np.intp)
+        cols = ((x - origin[0]) // xres).astype(np.intp)
+        mask = (rows >= 0) & (rows < shape[0]) & (cols >= 0) & (cols < shape[1])
+        return rows[mask], cols[mask], mask
+
+    def _to_ndarray(self, columns, nodata, dtype, *, origin=None, shape=None, out=None):
+        # preallocate a single (n_columns, rows, cols) buffer and scatter each column
+        # into it, so that the only temporary is the column being scattered (already
+        # cast to `dtype` and with the missing values set to `nodata`). If `origin` and
+        # `shape` are provided, the pixels are scattered into such grid (the pixels
+        # outside are ignored) instead of the grid of the land data frame.
+        if origin is None:
+            shape = self.get_grid_index().shape
+            flat_index = self._get_flat_index()
+            mask = None
+        else:
+            rows, cols, mask = self._get_window_index(origin, shape)
+            flat_index = np.ravel_multi_index((rows, cols), shape)
+        if out is None:
+            out = np.full((len(columns),) + tuple(shape), nodata, dtype=dtype)
+        flat_out = out.reshape(len(columns), -1)
+        for k, column in enumerate(columns):
+            values = self[column].to_numpy(dtype=dtype, na_value=nodata)
+            if mask is not None:
+                values = values[mask]
+            flat_out[k, flat_index] = values
+        return out
+
+    def _to_sparse(self, column, dtype, sparse_format, *, origin=None, shape=None):
+        # sparse array with only the pixels of the land data frame (with non-missing
+        # values) as stored entries
+        if origin is None:
+            grid_index = self.get_grid_index()
+            shape = grid_index.shape
+            rows, cols = grid_index.rows, grid_index.cols
+            mask = None
+        else:
+            rows, cols, mask = self._get_window_index(origin, shape)
+        ser = self[column]
+        if mask is not None:
+            ser = ser[mask]
+        notna = ser.notna().to_numpy()
+        if not notna.all():
+            ser = ser[notna]
+            rows, cols = rows[notna], cols[notna]
+        return sp_sparse.coo_array(
+            (ser.to_numpy(dtype=dtype), (rows, cols)), shape=shape
+        ).asformat(sparse_format)
+
+    def _get_raster_window(self, bounds):
+        # origin (None for the grid of the land data frame), shape and transform of the
+        # grid to rasterize
+        if bounds is None:
+            return None, self.get_grid_index().shape, self.get_transform()
+        origin, shape = self._get_window(bounds)
+        return origin, shape, transform.from_origin(*origin, *self.res)
+
+    def _get_raster_coords(self, _transform, shape):
+        # x and y coordinates of the pixel centroids of a grid
+        num_rows, num_cols = shape
+        cols = np.arange(num_cols)
+        rows = np.arange(num_rows)
+        x_coords, _ = transform.xy(_transform, cols, cols)
+        _, y_coords = transform.xy(_transform, rows, rows)
+        return {self.x_column: x_coords, self.y_column: y_coords}
+
+    def _to_dask_array(self, columns, nodata, dtype, origin, shape, chunks):
+        # (n_columns, rows, cols) dask array whose blocks are rasterized on demand.
+        # Note that `name=False` avoids hashing the whole land data frame
+        return dask_array.from_array(
+            _LazyRaster(self, columns, nodata, dtype, origin, shape),
+            chunks=chunks,
+            name=False,
+            meta=np.empty((0, 0, 0), dtype=dtype),
+        )
 
-    def to_ndarray(self, column, *, nodata=0, dtype="uint8"):
+    def to_ndarray(self, column, *, nodata=0, dtype="uint8", bounds=None, sparse=False):
         """
         Convert a data column to a numpy array.
 
@@ -141,22 +819,47 @@ class LandDataFrame(pd.DataFrame):
             value to be assigned to pixels with no data.
         dtype : str or numpy dtype, default uint8
             the data type.
+        bounds : tuple, optional
+            (left, bottom, right, top) bounds of the window to rasterize, in the CRS of
+            the land data frame. The window is aligned to the pixel grid and may extend
+            beyond the extent of the data. If not provided, the bounding box of all the
+            pixels is rasterized.
+        sparse : bool or {"coo", "csr", "csc"}, default False
+            whether to return a `scipy.sparse` array (in CSR format if True), which only
+            stores the pixels of the land data frame and is thus much lighter for data
+            sets that occupy a small share of their bounding box, e.g., STATENT. Pixels
+            with no data (including missing values) are not stored, i.e., they are the
+            implicit zeros of the sparse array and `nodata` is ignored. Requires scipy,
+            otherwise an ImportError is raised.
 
         Returns
         -------
-        arr : np.ndarray
+        arr : np.ndarray or scipy.sparse.sparray
             A raster array.
         """
-        x = self[self.x_column].values
-        y = self[self.y_column].values
-
-        xres, yres = self.res
-        i = (y - min(y)) // yres
-        j = (x - min(x)) // xres
-
-        return self._to_ndarray(column, i, j, nodata, dtype)
+        origin, shape, _ = self._get_raster_window(bounds)
+        if sparse:
+            if sp_sparse is None:
+                raise ImportError(_scipy_error_msg)
+            return self._to_sparse(
+                column,
+                dtype,
+                "csr" if sparse is True else sparse,
+                origin=origin,
+                shape=shape,
+            )
+        return self._to_ndarray([column], nodata, dtype, origin=origin, shape=shape)[0]
 
-    def to_xarray(self, columns, *, dim_name="time", nodata=0, dtype="uint8"):
+    def to_xarray(
+        self,
+        columns,
+        *,
+        dim_name="time",
+        nodata=0,
+        dtype="uint8",
+        bounds=None,
+        chunks=None,
+    ):
         """
         Convert a data column to a xarray data array.
 
@@ -170,75 +873,232 @@ class LandDataFrame(pd.DataFrame):
             value to be assigned to pixels with no data.
         dtype : str or numpy dtype, default uint8
             the data type.
+        bounds : tuple, optional
+            (left, bottom, right, top) bounds of the window to rasterize, in the CRS of
+            the land data frame. The window is aligned to the pixel grid and may extend
+            beyond the extent of the data. If not provided, the bounding box of all the
+            pixels is rasterized.
+        chunks : int, tuple, dict or "auto", optional
+            If provided, the data array is backed by a dask array of such chunks (see
+            `dask.array.from_array`), whose blocks are only rasterized when computed
+            (possibly in parallel). A dict can be keyed by the dimension names. If not
+            provided, the data array is rasterized eagerly into a numpy array. Requires
+            dask, otherwise an ImportError is raised.
 
         Returns
         -------
         da : xr.DataArray
             A xarray data array.
         """
-        x = self[self.x_column].values
-        y = self[self.y_column].values
-
-        xres, yres = self.res
-        i = (y - min(y)) // yres
-        j = (x - min(x)) // xres
-
         # ensure that `columns` is a list
         if isinstance(columns, str):
             columns = [columns]
-        # use a head-tail iteration pattern to get the array shape and prepare
-        # the pixel coordinates
-        arr = self._to_ndarray(columns[0], i, j, nodata, dtype)
-        num_rows, num_cols = arr.shape
-        _transform = self.get_transform()
-        cols = np.arange(num_cols)
-        rows = np.arange(num_rows)
-        x_coords, _ = transform.xy(_transform, cols, cols)
-        _, y_coords = transform.xy(_transform, rows, rows)
+        dims = [dim_name, self.y_column, self.x_column]
+        origin, shape, _transform = self._get_raster_window(bounds)
+        if chunks is None:
+            arr = self._to_ndarray(columns, nodata, dtype, origin=origin, shape=shape)
+        else:
+            if dask_array is None:
+                raise ImportError(_dask_error_msg)
+            if isinstance(chunks, dict):
+                chunks = {dims.index(dim): chunk for dim, chunk in chunks.items()}
+            arr = self._to_dask_array(columns, nodata, dtype, origin, shape, chunks)
 
         return xr.DataArray(
-            [arr]
-            + [self._to_ndarray(column, i, j, nodata, dtype) for column in columns[1:]],
-            dims=[dim_name, self.y_column, self.x_column],
+            arr,
+            dims=dims,
             coords={
-                self.x_column: x_coords,
-                self.y_column: y_coords,
+                **self._get_raster_coords(_transform, shape),
                 dim_name: columns,
             },
             attrs=dict(nodata=nodata, pyproj_srs=f"epsg:{self.crs.to_epsg()}"),
         )
 
-    def to_geotiff(self, fp, column, *, nodata=0, dtype="uint8"):
+    def to_dataset(
+        self, columns=None, *, nodata=0, dtypes=None, bounds=None, chunks=None
+    ):
+        """
+        Convert data columns to a xarray dataset.
+
+        Each data column is converted to a variable of the dataset with its own data
+        type and nodata value, whereas the coordinates are shared.
+
+        Parameters
+        ----------
+        columns : list of str, optional
+            names of the data columns. If not provided, all the numeric columns except
+            the x and y coordinate columns are converted.
+        nodata : numeric or dict-like, default 0
+            value to be assigned to pixels with no data, either for all the columns or
+            as a mapping of column names to values (columns not in the mapping get 0).
+        dtypes : str, numpy dtype or dict-like, optional
+            data type, either for all the columns or as a mapping of column names to
+            data types. By default (and for columns not in the mapping), the smallest
+            data type that can hold both the values of the column and its nodata value
+            is used, e.g., uint16 for survey years and uint8 for land use codes.
+        bounds : tuple, optional
+            (left, bottom, right, top) bounds of the window to rasterize, in the CRS of
+            the land data frame. The window is aligned to the pixel grid and may extend
+            beyond the extent of the data. If not provided, the bounding box of all the
+            pixels is rasterized.
+        chunks : int, tuple, dict or "auto", optional
+            If provided, each variable is backed by a dask array of such chunks along
+            the y and x dimensions (see `dask.array.from_array`), whose blocks are only
+            rasterized when computed. A dict can be keyed by the dimension names. If
+            not provided, the variables are rasterized eagerly into numpy arrays.
+            Requires dask, otherwise an ImportError is raised.
+
+        Returns
+        -------
+        ds : xr.Dataset
+            A xarray dataset.
+        """
+        if columns is None:
+            columns = [
+                column
+                for column in self.columns.drop([self.x_column, self.y_column])
+                if pd.api.types.is_numeric_dtype(self[column].dtype)
+            ]
+        if not isinstance(nodata, dict):
+            nodata = dict.fromkeys(columns, nodata)
+        if dtypes is None:
+            dtypes = {}
+        elif not isinstance(dtypes, dict):
+            dtypes = dict.fromkeys(columns, dtypes)
+        dims = [self.y_column, self.x_column]
+        origin, shape, _transform = self._get_raster_window(bounds)
+        if chunks is not None:
+            if dask_array is None:
+                raise ImportError(_dask_error_msg)
+            # a single column per block along the (hidden) column dimension
+            if isinstance(chunks, dict):
+                chunks = {
+                    0: 1,
+                    **{dims.index(dim) + 1: chunk for dim, chunk in chunks.items()},
+                }
+            elif isinstance(chunks, tuple):
+                chunks = (1,) + chunks
+            else:
+                chunks = (1, chunks, chunks)
+
+        data_vars = {}
+        for column in columns:
+            column_nodata = nodata.get(column, 0)
+            column_dtype = dtypes.get(column)
+            if column_dtype is None:
+                column_dtype = _get_raster_dtype(self[column], column_nodata)
+            if chunks is None:
+                arr = self._to_ndarray(
+                    [column], column_nodata, column_dtype, origin=origin, shape=shape
+                )
+            else:
+                arr = self._to_dask_array(
+                    [column], column_nodata, column_dtype, origin, shape, chunks
+                )
+            data_vars[column] = xr.Variable(
+                dims, arr[0], attrs=dict(nodata=column_nodata)
+            )
+
+        return xr.Dataset(
+            data_vars,
+            coords=self._get_raster_coords(_transform, shape),
+            attrs=dict(pyproj_srs=f"epsg:{self.crs.to_epsg()}"),
+        )
+
+    def to_geotiff(
+        self,
+        fp,
+        columns=None,
+        *,
+        column=None,
+        nodata=0,
+        dtype="uint8",
+        bounds=None,
+        cog=False,
+        num_threads=None,
+        **creation_options,
+    ):
         """
-        Export a data column to a GeoTIFF file.
+        Export one or more data columns to a GeoTIFF file.
 
         Parameters
         ----------
         fp : str, file object or pathlib.Path object
             A filename or URL, a file object opened in binary ('rb') mode, or a Path
             object.
-        column : str
-            name of the data column.
+        columns : str or list of str
+            name or names of the data columns, which are written as the bands of the
+            file (in the same order).
+        column : str, optional
+            deprecated alias of `columns`.
         nodata : numeric, default 0
             value to be assigned to pixels with no data.
         dtype : str or numpy dtype, default
             the data type.
+        bounds : tuple, optional
+            (left, bottom, right, top) bounds of the window to export, in the CRS of the
+            land data frame. The window is aligned to the pixel grid and may extend
+            beyond the extent of the data. If not provided, the bounding box of all the
+            pixels is exported.
+        cog : bool, default False
+            whether to write a Cloud-Optimized GeoTIFF (COG), i.e., tiled and with
+            internal overviews (computed with nearest resampling unless an
+            `overview_resampling` creation option is provided).
+        num_threads : int or str, optional
+            number of threads used by GDAL to compress the blocks (and compute the
+            overviews) in parallel, e.g., "all_cpus". Only used with compression.
+        **creation_options : dict-like, optional
+            GDAL creation options of the GTiff (or COG if `cog` is True) driver, e.g.,
+            `compress="zstd"`, `predictor=2`, `tiled=True` or `blockxsize=512`.
         """
-        arr = self.to_ndarray(column, nodata=nodata, dtype=dtype)
-
-        with rio.open(
-            fp,
-            "w",
-            driver="GTiff",
-            height=arr.shape[0],
-            width=arr.shape[1],
-            count=1,
-            dtype=str(dtype),
-            nodata=0,
+        if column is not None:
+            if columns is not None:
+                raise TypeError("Only one of `columns` and `column` can be provided.")
+            warnings.warn(
+                "The `column` argument is deprecated, use `columns` instead.",
+                FutureWarning,
+                stacklevel=2,
+            )
+            columns = column
+        elif columns is None:
+            raise TypeError("The `columns` argument is required.")
+        if isinstance(columns, str):
+            columns = [columns]
+        origin, shape, _transform = self._get_raster_window(bounds)
+        arr = self._to_ndarray(columns, nodata, dtype, origin=origin, shape=shape)
+
+        profile = dict(
+            height=arr.shape[1],
+            width=arr.shape[2],
+            count=len(columns),
+            dtype=arr.dtype.name,
+            nodata=nodata,
             crs=self.crs,
-            transform=self.get_transform(),
-        ) as raster:
-            raster.write(arr.astype(dtype), 1)
+            transform=_transform,
+        )
+        if num_threads is not None:
+            creation_options["num_threads"] = num_threads
+
+        if not cog:
+            with rio.open(
+                fp, "w", driver="GTiff", **profile, **creation_options
+            ) as raster:
+                raster.write(arr)
+                raster.descriptions = columns
+            return
+
+        # the COG driver can only create a copy of an existing dataset, so we first
+        # write the array to an in-memory dataset
+        creation_options.setdefault("overview_resampling", "nearest")
+        with rio.open("", "w", driver="MEM", **profile) as src:
+            src.write(arr)
+            src.descriptions = columns
+            if isinstance(fp, (str, os.PathLike)):
+                rio_shutil.copy(src, fp, driver="COG", **creation_options)
+            else:
+                with rio.MemoryFile() as memfile:
+                    rio_shutil.copy(src, memfile.name, driver="COG", **creation_options)
+                    fp.write(memfile.read())
 
     def plot(  # noqa: D102
         self,
@@ -267,11 +1127,122 @@ class LandDataFrame(pd.DataFrame):
         "\ncolumn : str\n    data column to display",
     )
 
-    def clip_by_geometry(self, geometry, *, geometry_crs=None):  # noqa: D102
-        return sls_geometry.clip_by_geometry(self, geometry, geometry_crs=geometry_crs)
+    def coarsen(self, factor, agg):  # noqa: D102
+        return sls_coarsening.coarsen(self, factor, agg)
+
+    coarsen.__doc__ = sls_coarsening._coarsen_doc % ""
+
+    def focal(  # noqa: D102
+        self, column, window, func="mean", *, value=None, block_rows=512
+    ):
+        return sls_focal_stats.focal(
+            self, column, window, func, value=value, block_rows=block_rows
+        )
+
+    focal.__doc__ = sls_focal_stats._focal_doc % ""
+
+    def transition_matrix(  # noqa: D102
+        self,
+        from_column,
+        to_column,
+        *,
+        weights=None,
+        by=None,
+        geometry_crs=None,
+        method="raster",
+    ):
+        return sls_transitions.transition_matrix(
+            self,
+            from_column,
+            to_column,
+            weights=weights,
+            by=by,
+            geometry_crs=geometry_crs,
+            method=method,
+        )
+
+    transition_matrix.__doc__ = sls_transitions._transition_matrix_doc % ""
+
+    def transition_matrices(  # noqa: D102
+        self,
+        columns,
+        *,
+        pairs="all",
+        weights=None,
+        by=None,
+        geometry_crs=None,
+        method="raster",
+    ):
+        return sls_transitions.transition_matrices(
+            self,
+            columns,
+            pairs=pairs,
+            weights=weights,
+            by=by,
+            geometry_crs=geometry_crs,
+            method=method,
+        )
+
+    transition_matrices.__doc__ = sls_transitions._transition_matrices_doc % ""
+
+    def zonal_stats(  # noqa: D102
+        self, zones, columns, stats=None, *, geometry_crs=None, method="raster"
+    ):
+        return sls_zonal.zonal_stats(
+            self, zones, columns, stats, geometry_crs=geometry_crs, method=method
+        )
+
+    zonal_stats.__doc__ = sls_zonal._zonal_stats_doc % ""
+
+    def landscape_metrics(  # noqa: D102
+        self,
+        columns,
+        *,
+        zones=None,
+        metrics=None,
+        neighborhood=8,
+        geometry_crs=None,
+        method="raster",
+    ):
+        return sls_landscape.landscape_metrics(
+            self,
+            columns,
+            zones=zones,
+            metrics=metrics,
+            neighborhood=neighborhood,
+            geometry_crs=geometry_crs,
+            method=method,
+        )
+
+    landscape_metrics.__doc__ = sls_landscape._landscape_metrics_doc % ""
+
+    def clip_by_geometry(  # noqa: D102
+        self, geometry, *, geometry_crs=None, method="raster"
+    ):
+        return sls_geometry.clip_by_geometry(
+            self, geometry, geometry_crs=geometry_crs, method=method
+        )
 
     clip_by_geometry.__doc__ = sls_geometry._clip_by_geometry_doc % ""
 
+    def label_by_geometries(  # noqa: D102
+        self, geometries, *, geometry_crs=None, method="raster"
+    ):
+        return sls_geometry.label_by_geometries(
+            self, geometries, geometry_crs=geometry_crs, method=method
+        )
+
+    label_by_geometries.__doc__ = sls_geometry._label_by_geometries_doc % ""
+
+    def clip_by_geometries(  # noqa: D102
+        self, geometries, *, geometry_crs=None, method="raster"
+    ):
+        return sls_geometry.clip_by_geometries(
+            self, geometries, geometry_crs=geometry_crs, method=method
+        )
+
+    clip_by_geometries.__doc__ = sls_geometry._clip_by_geometries_doc % ""
+
     def clip_by_nominatim(self, query, *, which_result=1):  # noqa: D102
         return sls_geometry.clip_by_nominatim(self, query, which_result=which_result)
 
@@ -346,6 +1317,35 @@ class LandDataFrame(pd.DataFrame):
     to_geodataframe.__doc__ = sls_geometry._to_geodataframe_doc % ""
 
 
+def _get_centroid_coords(offset, res, indices):
+    # coordinates of the pixel centroids along an axis, as integers if they are integral
+    # (as in the SFSO data)
+    coords = offset + (indices + 0.5) * res
+    if float(offset + res / 2).is_integer() and float(res).is_integer():
+        coords = np.rint(coords).astype(np.int64)
+    return coords
+
+
+def _get_pixel_data(arrays, nodata, _transform):
+    # values of the pixels with data in at least one of the (rows, cols) arrays, and x
+    # and y coordinates of their centroids (in row-major order)
+    has_data = np.zeros(np.shape(arrays[0]), dtype=bool)
+    for arr, _nodata in zip(arrays, nodata):
+        if _nodata is None:
+            has_data[:] = True
+            break
+        elif pd.isna(_nodata):
+            has_data |= ~np.isnan(arr)
+        else:
+            has_data |= arr != _nodata
+    rows, cols = np.nonzero(has_data)
+    return (
+        [arr[rows, cols] for arr in arrays],
+        _get_centroid_coords(_transform.c, _transform.a, cols),
+        _get_centroid_coords(_transform.f, _transform.e, rows),
+    )
+
+
 def merge(  # noqa: D103
     left,
     right,
@@ -374,6 +1374,207 @@ def merge(  # noqa: D103
 merge.__doc__ = _merge_doc % "\nleft : LandDataFrame"
 
 
+def _get_reli(ldf):
+    # integer RELI of each pixel, either from the index (if it is the RELI) or derived
+    # from the x and y coordinates
+    if (
+        ldf.index.name == settings.DEFAULT_INDEX_COLUMN
+        and pd.api.types.is_integer_dtype(ldf.index.dtype)
+    ):
+        return ldf.index.to_numpy(dtype=np.int64)
+    return grid.xy_to_reli(ldf[ldf.x_column].to_numpy(), ldf[ldf.y_column].to_numpy())
+
+
+def _take_column(ser, indexer, missing):
+    # take the values of `ser` at the positions of `indexer`, where the positions that
+    # are `missing` (-1 in `indexer`) are filled with missing values. Integer and
+    # boolean columns are converted to the (nullable) masked arrays so that they are
+    # not upcast to float
+    if missing is None:
+        return ser.to_numpy()[indexer]
+    # numpy-backed integer and boolean columns, i.e., not extension arrays (checked on
+    # the dtype since the name of the numpy-backed array class varies across versions)
+    values = ser.array
+    if isinstance(ser.dtype, np.dtype) and ser.dtype.kind in "iub":
+        # note that the values at the missing positions are irrelevant in masked arrays
+        values = ser.to_numpy()[indexer]
+        if pd.api.types.is_bool_dtype(values.dtype):
+            return pd.arrays.BooleanArray(values, missing)
+        return pd.arrays.IntegerArray(values, missing)
+    return pd.api.extensions.take(values, indexer, allow_fill=True)
+
+
+def merge_many(ldfs, *, how="outer"):
+    """
+    Merge any number of LandDataFrame objects on their RELI in a single pass.
+
+    The land data frames are aligned on the sorted union (or intersection) of their
+    RELI, which is taken from the index or derived from the x and y coordinates when
+    the index is not the RELI. Each data column is copied once into the result,
+    taken from the first land data frame in which it appears, and the x and y
+    coordinates are filled from all of them.
+
+    Parameters
+    ----------
+    ldfs : list-like of LandDataFrame
+        The land data frames to merge. The x and y column names, CRS and resolution
+        of the result are taken from the first one.
+    how : {'outer', 'inner', 'left'}, default 'outer'
+        Whether to keep the pixels of any land data frame ('outer'), only the pixels
+        present in all of them ('inner') or only the pixels of the first one ('left').
+        Data columns of integer (or boolean) dtype that miss pixels of the result are
+        converted to the nullable dtypes of pandas, e.g., "UInt8" for "uint8".
+
+    Returns
+    -------
+    result : LandDataFrame
+    """
+    if how not in {"outer", "inner", "left"}:
+        raise ValueError(f"Unknown how {how!r}. Must be one of outer, inner or left.")
+    ldfs = list(ldfs)
+    relis = [_get_reli(ldf) for ldf in ldfs]
+    if how == "left":
+        result_reli = np.sort(relis[0])
+    else:
+        result_reli, counts = np.unique(np.concatenate(relis), return_counts=True)
+        if how == "inner":
+            result_reli = result_reli[counts == len(ldfs)]
+    num_pixels = len(result_reli)
+
+    first = ldfs[0]
+    x_column, y_column = first.x_column, first.y_column
+    data = {
+        x_column: np.zeros(num_pixels, dtype=first[x_column].dtype),
+        y_column: np.zeros(num_pixels, dtype=first[y_column].dtype),
+    }
+    for ldf, reli in zip(ldfs, relis):
+        # positions of the pixels of `ldf` in the result (-1 if not in the result) and
+        # inversely, positions of the pixels of the result in `ldf` (-1 if missing)
+        positions = np.searchsorted(result_reli, reli)
+        in_result = positions < num_pixels
+        in_result[in_result] = result_reli[positions[in_result]] == reli[in_result]
+        positions = positions[in_result]
+        data[x_column][positions] = ldf[ldf.x_column].to_numpy()[in_result]
+        data[y_column][positions] = ldf[ldf.y_column].to_numpy()[in_result]
+        columns = [
+            column
+            for column in ldf.columns.drop([ldf.x_column, ldf.y_column])
+            if column not in data
+        ]
+        if not columns:
+            continue
+        indexer = np.full(num_pixels, -1, dtype=np.intp)
+        indexer[positions] = np.flatnonzero(in_result)
+        missing = indexer < 0 if len(positions) < num_pixels else None
+        for column in columns:
+            data[column] = _take_column(ldf[column], indexer, missing)
+
+    return LandDataFrame(
+        data,
+        index=pd.Index(result_reli, name=settings.DEFAULT_INDEX_COLUMN),
+        x_column=x_column,
+        y_column=y_column,
+        crs=first.crs,
+        res=first.res,
+        index_column=settings.DEFAULT_INDEX_COLUMN,
+    )
+
+
+def _has_integer_values(ser):
+    # whether a float series only has integer values (besides the missing values), e.g.,
+    # an integer column with missing values
+    values = ser.to_numpy(dtype=float, na_value=np.nan)
+    return bool(np.all(np.mod(values[~np.isnan(values)], 1) == 0))
+
+
+def _downcast_series(ser, *, signed=False):
+    # downcast a numeric series to the smallest dtype that can hold its values. Float
+    # series with integer values only are converted to the (nullable) integer dtypes
+    if pd.api.types.is_float_dtype(ser.dtype):
+        if not _has_integer_values(ser):
+            return ser
+        ser = ser.astype("Int64" if ser.hasnans else "int64")
+    elif not pd.api.types.is_integer_dtype(ser.dtype):
+        return ser
+    downcast = "integer" if signed or ser.min() < 0 else "unsigned"
+    return pd.to_numeric(ser, downcast=downcast)
+
+
+def _get_raster_dtype(ser, nodata):
+    # smallest dtype that can hold both the values of a numeric series and `nodata`.
+    # Float series with integer values only get integer dtypes
+    if pd.api.types.is_float_dtype(ser.dtype):
+        if not _has_integer_values(ser):
+            return np.result_type(ser.to_numpy().dtype, np.min_scalar_type(nodata))
+    elif not pd.api.types.is_integer_dtype(ser.dtype):
+        return np.result_type(ser.to_numpy().dtype, np.min_scalar_type(nodata))
+    extrema = [nodata]
+    if ser.notna().any():
+        extrema += [int(ser.min()), int(ser.max())]
+    return np.result_type(*(np.min_scalar_type(value) for value in extrema))
+
+
+def _compact_dtypes(df, *, skip_columns=None, signed_columns=None):
+    # downcast (in place) the numeric columns of a data frame except `skip_columns`
+    if skip_columns is None:
+        skip_columns = []
+    if signed_columns is None:
+        signed_columns = []
+    for column in df.columns.difference(skip_columns):
+        df[column] = _downcast_series(df[column], signed=column in signed_columns)
+
+
+# engines that parse the whole file at once, i.e., that cannot read in chunks
+_ARROW_ENGINES = ["pyarrow", "polars"]
+
+
+def _get_polars_dtype(dtype):
+    # polars data type to parse a column of the given pandas data type with
+    dtype = pd.api.types.pandas_dtype(dtype)
+    # nullable (extension) data types are backed by a numpy data type
+    numpy_dtype = getattr(dtype, "numpy_dtype", dtype)
+    if not isinstance(numpy_dtype, np.dtype):
+        return pl.String
+    if numpy_dtype.kind == "b":
+        return pl.Boolean
+    prefix = {"i": "Int", "u": "UInt", "f": "Float"}.get(numpy_dtype.kind)
+    if prefix is None:
+        return pl.String
+    return getattr(pl, f"{prefix}{numpy_dtype.itemsize * 8}")
+
+
+def _read_csv_engine(filepath_or_buffer, engine, read_csv_kwargs):
+    # parse the CSV file into a pandas data frame with the given engine
+    if engine != "polars":
+        return pd.read_csv(filepath_or_buffer, engine=engine, **read_csv_kwargs)
+    # translate the pandas arguments into polars ones (the remaining ones are passed
+    # as is). Note that the data types are still set after the conversion to pandas,
+    # e.g., for the nullable data types
+    polars_kwargs = read_csv_kwargs.copy()
+    polars_kwargs["separator"] = polars_kwargs.pop("sep")
+    usecols = polars_kwargs.pop("usecols", None)
+    if usecols is not None:
+        polars_kwargs["columns"] = list(usecols)
+    dtype = polars_kwargs.pop("dtype", None)
+    if dtype:
+        polars_kwargs["schema_overrides"] = {
+            column: _get_polars_dtype(column_dtype)
+            for column, column_dtype in dtype.items()
+        } | polars_kwargs.get("schema_overrides", {})
+    # infer the data types of the remaining columns from all the rows, otherwise the
+    # columns whose first rows are empty (e.g., of the ongoing survey) are parsed as
+    # strings
+    polars_kwargs.setdefault("infer_schema_length", None)
+    # split the blocks so that the (Arrow) columns are converted without copying them
+    # into consolidated two-dimensional blocks
+    df = pl.read_csv(filepath_or_buffer, **polars_kwargs).to_pandas(split_blocks=True)
+    if dtype:
+        df = df.astype(
+            {column: dtype[column] for column in df.columns.intersection(dtype)}
+        )
+    return df
+
+
 def read_csv(
     filepath_or_buffer,
     *,
@@ -384,6 +1585,12 @@ def read_csv(
     sep=None,
     crs=None,
     res=None,
+    dtypes=None,
+    chunksize=None,
+    bbox=None,
+    geometry=None,
+    geometry_crs=None,
+    engine=None,
     read_csv_kwargs=None,
     df_init_kwargs=None,
 ):
@@ -420,14 +1627,60 @@ def read_csv(
     res : tuple, optional
         The (x, y) resolution of the dataset. If `None` is provided, the value
         set in `settings.DEFAULT_RES` will be taken.
+    dtypes : "compact" or dict-like, optional
+        Data type policy. If "compact", the numeric columns are downcast to the
+        smallest data type that can hold their values (signed for the index and
+        coordinate columns, unsigned for the rest unless they have negative values).
+        Float columns whose values are all integers are converted to (nullable)
+        integer columns. A dict-like maps column names to data types, which are passed
+        to the parser, and the remaining columns are downcast as with "compact". If
+        `None` is provided, the data types inferred by pandas are kept.
+    chunksize : int, optional
+        If provided, the file is read in chunks of `chunksize` rows and an iterator of
+        LandDataFrame chunks is returned instead, so that the whole file never needs
+        to be in memory. Note that so that all the chunks have the same data types,
+        the "compact" `dtypes` policy only applies the data types of the dict-like
+        (e.g., the ones set in `settings.DATASET_DICT`, see `load_dataset`) to the
+        chunks, and the remaining columns are not downcast. If `bbox` or `geometry`
+        are provided, the file is always read in chunks (of
+        `settings.DEFAULT_CHUNKSIZE` rows unless `chunksize` is provided) and each
+        chunk is filtered as soon as it is read, so that the discarded pixels are never
+        held in memory. See also `rasterize_chunks` and `aggregate_chunks`.
+    bbox : tuple, optional
+        Bounding box (west, south, east, north) in the `crs` coordinates. If provided,
+        only the pixels whose x and y coordinates lie within it are kept. If no pixel
+        is kept, an empty LandDataFrame (with the requested columns) is returned,
+        whose raster exports raise a ValueError since it does not span any grid.
+    geometry : shapely Polygon or MultiPolygon, optional
+        If provided, only the pixels within the geometry are kept (as in
+        `clip_by_geometry`, see also `bbox` for empty results). Reprojecting the
+        geometry from `geometry_crs` requires geopandas, otherwise an ImportError is
+        raised.
+    geometry_crs : dict, optional
+        the starting coordinate reference system of the passed-in geometry.
+        If not given, it will take the default crs from the settings.
+    engine : {"c", "python", "pyarrow", "polars"}, optional
+        The CSV parser. "c" (the default) and "python" are engines of
+        `pandas.read_csv` (any other engine is passed to it as is), and "pyarrow" and
+        "polars" are multithreaded parsers that only parse the requested `columns` and
+        whose Arrow columns are converted to the data frame without copying when
+        possible, which is considerably faster for large files. The latter two do not
+        support reading in chunks, so with `bbox` or `geometry`, the whole file is
+        parsed before being filtered, and they return the `columns` in the provided
+        order (rather than in the order of the file). If the parser is not installed,
+        a warning is logged and the "c" engine is used instead. If `None` is provided,
+        the "engine" of `read_csv_kwargs` is taken, if any.
     read_csv_kwargs : dict-like, optional
-        Keyword arguments to be passed to `pandas.read_csv`, except `sep`.
+        Keyword arguments to be passed to `pandas.read_csv` (or `polars.read_csv` if
+        `engine` is "polars", where the data types of the columns that are not in
+        `dtypes` are inferred from all the rows unless "infer_schema_length" is
+        provided), except `sep`.
     df_init_kwargs : dict-like, optional
         Keyword arguments to be passed to `LandDataFrame.__init__`
 
     Returns
     -------
-    result : LandDataFrame
+    result : LandDataFrame or iterator of LandDataFrame
     """
     if read_csv_kwargs is None:
         _read_csv_kwargs = {}
@@ -444,8 +1697,9 @@ def read_csv(
     # we are using "columns" instead of "usecols" in case we eventually want to use
     # another backend, e.g., polars
     if columns is not None:
-        # ensure that the index, x and y columns are included
-        columns = list(set(columns).union({index_column, x_column, y_column}))
+        # ensure that the index, x and y columns are included (in a deterministic
+        # order, which the pyarrow and polars engines follow)
+        columns = list(dict.fromkeys([index_column, x_column, y_column, *columns]))
         _read_csv_kwargs["usecols"] = columns
 
     if crs is None:
@@ -460,12 +1714,98 @@ def read_csv(
         sep = _read_csv_kwargs.get("sep", settings.DEFAULT_SEP)
     _read_csv_kwargs["sep"] = sep
 
-    df = pd.read_csv(filepath_or_buffer, **_read_csv_kwargs)
+    # process dtypes arg
+    if isinstance(dtypes, str):
+        if dtypes != "compact":
+            raise ValueError(
+                f"Unknown dtypes policy {dtypes!r}. Must be 'compact' or dict-like."
+            )
+        dtypes = {}
+    if dtypes is not None:
+        _read_csv_kwargs["dtype"] = {**dtypes, **_read_csv_kwargs.get("dtype", {})}
+
+    # process engine arg (the `engine` argument takes precedence over the one of
+    # `read_csv_kwargs`, which must be removed from the keyword arguments in any case)
+    kwargs_engine = _read_csv_kwargs.pop("engine", None)
+    if engine is None:
+        engine = "c" if kwargs_engine is None else kwargs_engine
+    if engine == "pyarrow" and sls_cache.pa is None:
+        utils.log(_pa_engine_warning_msg, level=lg.WARNING)
+        engine = "c"
+    elif engine == "polars" and pl is None:
+        utils.log(_pl_engine_warning_msg, level=lg.WARNING)
+        engine = "c"
+    if engine in _ARROW_ENGINES and chunksize is not None:
+        raise ValueError(
+            f"Reading in chunks is not supported by the {engine!r} engine."
+        )
 
     if df_init_kwargs is None:
         df_init_kwargs = {}
+
+    # process filter args
+    if geometry is not None:
+        geometry = sls_geometry._project_geometry(geometry, geometry_crs, crs)
+
+    def _filter(ldf):
+        x = ldf[x_column].to_numpy()
+        y = ldf[y_column].to_numpy()
+        if geometry is not None:
+            mask = sls_geometry._get_within_mask(x, y, geometry)
+        else:
+            mask = np.ones(len(ldf), dtype=bool)
+        if bbox is not None:
+            west, south, east, north = bbox
+            mask &= (x >= west) & (x <= east) & (y >= south) & (y <= north)
+        return ldf[mask]
+
+    def _to_ldf(df, *, downcast=True):
+        if dtypes is not None and downcast:
+            _compact_dtypes(
+                df,
+                skip_columns=list(_read_csv_kwargs["dtype"]),
+                signed_columns=[index_column, x_column, y_column],
+            )
+        ldf = LandDataFrame(
+            df,
+            index_column=index_column,
+            x_column=x_column,
+            y_column=y_column,
+            crs=crs,
+            res=res,
+            **df_init_kwargs,
+        )
+        if bbox is not None or geometry is not None:
+            ldf = _filter(ldf)
+        return ldf
+
+    if engine in _ARROW_ENGINES or (
+        chunksize is None and bbox is None and geometry is None
+    ):
+        return _to_ldf(_read_csv_engine(filepath_or_buffer, engine, _read_csv_kwargs))
+
+    def _read_chunks(chunksize, *, downcast=True):
+        with pd.read_csv(
+            filepath_or_buffer, chunksize=chunksize, engine=engine, **_read_csv_kwargs
+        ) as reader:
+            for df in reader:
+                yield _to_ldf(df, downcast=downcast)
+
+    if chunksize is not None:
+        # the chunks are not downcast according to their own values, so that all of
+        # them have the data types set at parse time
+        return _read_chunks(chunksize, downcast=False)
+    ldfs = list(_read_chunks(settings.DEFAULT_CHUNKSIZE))
+    if not ldfs:
+        # the reader did not return any chunk, so we return an empty land data frame
+        # with the requested columns (or at least the index, x and y columns)
+        ldfs = [
+            _to_ldf(pd.DataFrame(columns=columns or [index_column, x_column, y_column]))
+        ]
+    # note that we need to re-instantiate the land data frame because `pd.concat` does
+    # not propagate its attributes
     return LandDataFrame(
-        df,
+        pd.concat(ldfs),
         index_column=index_column,
         x_column=x_column,
         y_column=y_column,
@@ -475,6 +1815,327 @@ def read_csv(
     )
 
 
+def rasterize_chunks(chunks, columns, *, transform, shape, nodata=0, dtype="uint8"):
+    """
+    Rasterize an iterator of LandDataFrame chunks into a preallocated array.
+
+    Each chunk is scattered into the array as soon as it is read, so that only one
+    chunk needs to be in memory at a time. Pixels outside the array are ignored.
+
+    Parameters
+    ----------
+    chunks : iterable of LandDataFrame
+        The chunks, e.g., as returned by `read_csv` with the `chunksize` argument. The
+        resolution of the chunks must match the one of `transform`.
+    columns : str or list of str
+        name or names of the data columns.
+    transform : Affine
+        The affine transform of the target array.
+    shape : tuple
+        The (number of rows, number of columns) of the target array.
+    nodata : numeric, default 0
+        value to be assigned to pixels with no data.
+    dtype : str or numpy dtype, default uint8
+        the data type.
+
+    Returns
+    -------
+    arr : np.ndarray
+        A raster array of shape `shape` if `columns` is a string, or of shape
+        (number of columns,) + `shape` otherwise.
+    """
+    if isinstance(columns, str):
+        _columns = [columns]
+    else:
+        _columns = list(columns)
+    origin = (transform.c, transform.f)
+    res = (transform.a, -transform.e)
+    arr = np.full((len(_columns),) + tuple(shape), nodata, dtype=dtype)
+    for chunk in chunks:
+        if tuple(chunk.res) != res:
+            raise ValueError(
+                f"The resolution of the chunk {chunk.res} does not match the "
+                f"resolution of the transform {res}."
+            )
+        chunk._to_ndarray(_columns, nodata, dtype, origin=origin, shape=shape, out=arr)
+
+    if isinstance(columns, str):
+        return arr[0]
+    return arr
+
+
+# functions that can be computed by chunks, mapped to the function that combines the
+# per-chunk results
+_CHUNK_AGG_FUNCS = {"sum": "sum", "count": "sum", "min": "min", "max": "max"}
+
+
+def aggregate_chunks(chunks, columns=None, *, by=None, func="sum"):
+    """
+    Aggregate an iterator of LandDataFrame chunks.
+
+    The per-chunk results are combined as soon as each chunk is read, so that only one
+    chunk needs to be in memory at a time.
+
+    Parameters
+    ----------
+    chunks : iterable of LandDataFrame
+        The chunks, e.g., as returned by `read_csv` with the `chunksize` argument. A
+        ValueError is raised if there are no chunks.
+    columns : list of str, optional
+        The data columns to aggregate. If `None` is provided, all the columns except
+        the x and y columns (and the `by` columns) are aggregated.
+    by : str or list of str, optional
+        Columns to group by, e.g., the municipality identifier. If `None` is provided,
+        the columns are aggregated over all the pixels.
+    func : {"sum", "count", "min", "max", "mean"}, default "sum"
+        The aggregation function.
+
+    Returns
+    -------
+    result : pandas.Series or pandas.DataFrame
+        A series indexed by the column names if `by` is `None`, otherwise a data frame
+        indexed by the groups.
+    """
+    if func == "mean":
+        funcs = ["sum", "count"]
+    elif func in _CHUNK_AGG_FUNCS:
+        funcs = [func]
+    else:
+        raise ValueError(
+            f"Unknown function {func!r}. "
+            f"Must be one of {list(_CHUNK_AGG_FUNCS) + ['mean']}."
+        )
+    if by is None:
+        by_columns = []
+    elif isinstance(by, str):
+        by_columns = [by]
+    else:
+        by_columns = list(by)
+
+    result_dict = {_func: None for _func in funcs}
+    num_chunks = 0
+    for num_chunks, chunk in enumerate(chunks, start=1):
+        if columns is None:
+            _columns = list(
+                chunk.columns.difference(
+                    [chunk.x_column, chunk.y_column] + by_columns, sort=False
+                )
+            )
+        else:
+            _columns = list(columns)
+        df = pd.DataFrame(chunk[_columns + by_columns])
+        if by is None:
+            # use a one-row data frame so that the combination is the same as with
+            # the grouped case
+            grouped = df.groupby(np.zeros(len(df), dtype=np.int8))
+        else:
+            grouped = df.groupby(by)
+        for _func in funcs:
+            partial = grouped.agg(_func)
+            if result_dict[_func] is not None:
+                partial = (
+                    pd.concat([result_dict[_func], partial])
+                    .groupby(level=list(range(partial.index.nlevels)))
+                    .agg(_CHUNK_AGG_FUNCS[_func])
+                )
+            result_dict[_func] = partial
+    if num_chunks == 0:
+        raise ValueError("No chunks to aggregate.")
+
+    if func == "mean":
+        result = result_dict["sum"] / result_dict["count"]
+    else:
+        result = result_dict[func]
+    if by is None:
+        return result.iloc[0].rename(None)
+    return result
+
+
+_LoadArgs = namedtuple(
+    "_LoadArgs",
+    [
+        "url",
+        "retrieve_kwargs",
+        "which_member",
+        "stream_member",
+        "read_csv_kwargs",
+        "cache",
+        "cache_filepath",
+    ],
+)
+
+
+def _get_load_args(
+    dataset_key,
+    year,
+    url,
+    retrieve_kwargs,
+    which_member,
+    unzip,
+    columns,
+    dtypes,
+    cache,
+    cache_dir,
+    read_csv_kwargs,
+):
+    # process the arguments of `load_dataset` into the URL, the keyword arguments of
+    # `pooch.retrieve` and `read_csv` and the path of the parsed-data cache (if any)
+    if read_csv_kwargs is None:
+        _read_csv_kwargs = {}
+    else:
+        _read_csv_kwargs = read_csv_kwargs.copy()
+
+    if dataset_key is not None:
+        dataset_items = settings.DATASET_DICT[dataset_key]
+        if year is None:
+            year = dataset_items["latest"]
+        elif isinstance(year, int):
+            year = str(year)
+
+        dataset_item = dataset_items[year]
+        url = dataset_item["url"]
+        _retrieve_kwargs = {"known_hash": dataset_item["known_hash"]}
+        # whether the member is read straight out of the downloaded archive
+        stream_member = dataset_item["zip"] and not unzip
+        if not dataset_item["zip"]:
+            which_member = None
+        elif unzip:
+            _retrieve_kwargs["processor"] = pooch.Unzip(
+                members=[dataset_item["members"]]
+            )
+            which_member = dataset_item["which_member"]
+        else:
+            which_member = dataset_item["members"]
+
+        _read_csv_kwargs.update(dataset_item["read_csv_kwargs"])
+    else:
+        if retrieve_kwargs is None:
+            _retrieve_kwargs = {"known_hash": None}
+        else:
+            _retrieve_kwargs = retrieve_kwargs.copy()
+        stream_member = not unzip
+        if stream_member:
+            _retrieve_kwargs.pop("processor", None)
+
+        if url is None:
+            raise ValueError("Either `dataset_key` or `url` must be provided.")
+
+    # process column and dtypes args
+    if columns is not None:
+        _read_csv_kwargs["columns"] = columns
+    if dtypes == "compact" and dataset_key is not None:
+        dtypes = dataset_item.get("dtypes", dtypes)
+    if dtypes is not None:
+        _read_csv_kwargs["dtypes"] = dtypes
+
+    # process cache arg
+    cache_filepath = None
+    if cache is not None:
+        known_hash = _retrieve_kwargs.get("known_hash")
+        if sls_cache.pa is None:
+            utils.log(sls_cache._pa_warning_msg, level=lg.WARNING)
+        elif _read_csv_kwargs.get("chunksize") is not None:
+            utils.log(
+                "Ignoring the cache because the dataset is read in chunks",
+                level=lg.WARNING,
+            )
+        elif known_hash is None:
+            utils.log(
+                "Ignoring the cache because no known hash has been provided",
+                level=lg.WARNING,
+            )
+        else:
+            if cache_dir is None:
+                cache_dir = _retrieve_kwargs.get("path", pooch.os_cache("pooch"))
+            cache_filepath = sls_cache.get_cache_filepath(
+                cache_dir,
+                cache,
+                known_hash,
+                # the parsed data does not depend on the engine
+                {
+                    "which_member": which_member,
+                    **{
+                        key: value
+                        for key, value in _read_csv_kwargs.items()
+                        if key != "engine"
+                    },
+                },
+            )
+
+    return _LoadArgs(
+        url,
+        _retrieve_kwargs,
+        which_member,
+        stream_member,
+        _read_csv_kwargs,
+        cache,
+        cache_filepath,
+    )
+
+
+def _read_load_cache(load_args):
+    # cached LandDataFrame if it exists, otherwise `None`
+    if load_args.cache_filepath is None or not load_args.cache_filepath.exists():
+        return None
+    df, attrs = sls_cache.read_cache(load_args.cache_filepath, load_args.cache)
+    return LandDataFrame(
+        df,
+        index_column=df.index.name,
+        x_column=attrs["x_column"],
+        y_column=attrs["y_column"],
+        crs=CRS.from_string(attrs["crs"]),
+        res=tuple(attrs["res"]),
+    )
+
+
+def _retrieve_dataset(load_args):
+    # download (and unpack) the file, returning its local path (the path of the archive
+    # if its members are not extracted)
+    # response = requests.get(url)
+    # filepath_or_buffer = io.StringIO(response.content.decode(response.encoding))
+    filepath_or_buffer = sls_registry.retrieve(
+        load_args.url, **load_args.retrieve_kwargs
+    )
+    if not load_args.stream_member and load_args.which_member is not None:
+        filepath_or_buffer = sls_archive.select_member(
+            filepath_or_buffer, load_args.which_member
+        )
+    return filepath_or_buffer
+
+
+def _parse_dataset(filepath_or_buffer, load_args):
+    # parse the file (and cache the result if requested). Note that the files of
+    # custom URLs are only read as archives if they are actually zipped
+    if not load_args.stream_member or not zipfile.is_zipfile(filepath_or_buffer):
+        ldf = read_csv(filepath_or_buffer, **load_args.read_csv_kwargs)
+    else:
+        member_file = sls_archive.open_member(
+            filepath_or_buffer, load_args.which_member
+        )
+        if load_args.read_csv_kwargs.get("chunksize") is None:
+            with member_file:
+                ldf = read_csv(member_file, **load_args.read_csv_kwargs)
+        else:
+            # the chunks are read lazily, so the member file is closed when the
+            # iterator is garbage-collected
+            ldf = read_csv(member_file, **load_args.read_csv_kwargs)
+
+    if load_args.cache_filepath is not None:
+        sls_cache.write_cache(
+            ldf,
+            {
+                "x_column": ldf.x_column,
+                "y_column": ldf.y_column,
+                "crs": ldf.crs.to_string(),
+                "res": list(ldf.res),
+            },
+            load_args.cache_filepath,
+            load_args.cache,
+        )
+
+    return ldf
+
+
 def load_dataset(
     dataset_key=None,
     *,
@@ -482,7 +2143,11 @@ def load_dataset(
     url=None,
     retrieve_kwargs=None,
     which_member=None,
+    unzip=True,
     columns=None,
+    dtypes=None,
+    cache=None,
+    cache_dir=None,
     **read_csv_kwargs,
 ):
     """
@@ -502,15 +2167,43 @@ def load_dataset(
     url : str, optional
         The URL of the file. Ignored if `dataset_key` is provided.
     retrieve_kwargs : dict-like
-        Keyword arguments passed to `pooch.retrieve`. Ignored if `dataset_key` is
-        provided.
-    which_member : int, optional
-        When downloading a custom url with an unpacking processor, the index of the
-        member to be extracted. Ignored if `dataset_key` is provided.
+        Keyword arguments passed to `registry.retrieve`, a drop-in replacement of
+        `pooch.retrieve` which looks up the file in the mirror set in
+        `settings.DATASET_MIRROR` and verifies its known hash against a persisted
+        hash index. Ignored if `dataset_key` is provided.
+    which_member : int, str or callable, optional
+        When downloading a custom url of an archive, the member to be read, either by
+        its position (in the list of extracted files returned by the unpacking
+        processor, or among the file members of the archive if `unzip` is False), by
+        its name (e.g., "STATPOP2023.csv") or by a predicate on the member names. See
+        `archive.select_member`. Ignored if `dataset_key` is provided.
+    unzip : bool, default True
+        Whether the members of zipped datasets are extracted to disk (with
+        `pooch.Unzip` for the datasets of `settings.DATASET_DICT`, or with the
+        processor of `retrieve_kwargs` for custom URLs) before being parsed. If False,
+        the member is parsed as a stream decompressed straight out of the downloaded
+        archive, which avoids writing (and reading back) the extracted file, and the
+        processor of `retrieve_kwargs` is ignored. Files that are not zipped are
+        parsed as is in any case.
     columns : list-like, optional
         The columns to be read from the dataset. If `None` is provided and `dataset_key`
         is not None, the columns set in `settings.DATASET_DICT` for the given
         `dataset_key` will be taken. Otherwise, all columns will be read.
+    dtypes : "compact" or dict-like, optional
+        Data type policy, passed to `read_csv`. If "compact" and `dataset_key` is
+        provided, the data types set in `settings.DATASET_DICT` for the given
+        `dataset_key` are used at parse time and the remaining columns are downcast.
+    cache : {"parquet", "feather"}, optional
+        If provided, the parsed LandDataFrame is cached in this format after the first
+        load, and read from the cache in later loads (without downloading nor parsing
+        the file). The feather format is memory-mapped and its columns are converted
+        without copies when possible (see `cache.read_cache`), whereas the parquet
+        format is smaller on disk. The cache is keyed by the known hash of the file
+        and the arguments used to parse it, so it requires a known hash (always the
+        case when `dataset_key` is provided). Requires pyarrow.
+    cache_dir : str or pathlib.Path, optional
+        Directory of the parsed-data cache. If `None` is provided, the directory where
+        pooch caches the downloaded files will be used.
     **read_csv_kwargs : dict-like
         Keyword arguments to be passed to `pandas.read_csv`. If both the `columns`
         argument and a "columns" key are provided, the former will be taken.
@@ -519,49 +2212,158 @@ def load_dataset(
     -------
     ldf : LandDataFrame
     """
-    if read_csv_kwargs is None:
-        _read_csv_kwargs = {}
-    else:
-        _read_csv_kwargs = read_csv_kwargs.copy()
+    load_args = _get_load_args(
+        dataset_key,
+        year,
+        url,
+        retrieve_kwargs,
+        which_member,
+        unzip,
+        columns,
+        dtypes,
+        cache,
+        cache_dir,
+        read_csv_kwargs,
+    )
+    ldf = _read_load_cache(load_args)
+    if ldf is not None:
+        return ldf
+    return _parse_dataset(_retrieve_dataset(load_args), load_args)
 
-    if dataset_key is not None:
-        dataset_items = settings.DATASET_DICT[dataset_key]
-        if year is None:
-            year = dataset_items["latest"]
-        elif isinstance(year, int):
-            year = str(year)
 
-        dataset_item = dataset_items[year]
-        retrieve_args = [dataset_item["url"]]
-        _retrieve_kwargs = {"known_hash": dataset_item["known_hash"]}
-        if dataset_item["zip"]:
-            # TODO: better approach than positional "which_member", e.g., a function?
-            filepath_or_buffer = pooch.retrieve(
-                *retrieve_args,
-                processor=pooch.Unzip(members=[dataset_item["members"]]),
-                **_retrieve_kwargs,
-            )[dataset_item["which_member"]]
-        else:
-            filepath_or_buffer = pooch.retrieve(
-                *retrieve_args,
-                **_retrieve_kwargs,
-            )
-
-        _read_csv_kwargs.update(dataset_item["read_csv_kwargs"])
-    else:
-        if retrieve_kwargs is None:
-            retrieve_kwargs = {"known_hash": None}
+def load_datasets(
+    dataset_keys,
+    *,
+    years=None,
+    columns=None,
+    dtypes=None,
+    cache=None,
+    cache_dir=None,
+    unzip=True,
+    merge=False,
+    how="outer",
+    max_workers=None,
+    parser_pool="process",
+):
+    """
+    Load several GEOSTAT datasets concurrently.
 
-        if url is None:
-            raise ValueError("Either `dataset_key` or `url` must be provided.")
-        # response = requests.get(url)
-        # filepath_or_buffer = io.StringIO(response.content.decode(response.encoding))
-        filepath_or_buffer = pooch.retrieve(url, **retrieve_kwargs)
-        if which_member is not None:
-            filepath_or_buffer = filepath_or_buffer[which_member]
+    The files are downloaded (and unpacked) in a thread pool, and each file is parsed
+    as soon as it is available in a pool of processes (or threads), so that the
+    downloads overlap with each other and with the parsing.
 
-    # process column arg
-    if columns is not None:
-        _read_csv_kwargs["columns"] = columns
+    Parameters
+    ----------
+    dataset_keys : list-like of {"sls", "statpop", "bds", "statent"}
+        The keys of the datasets, see `load_dataset`.
+    years : int, str or dict-like, optional
+        The year of all the datasets, or a mapping of dataset keys to their year. The
+        latest available year is taken for the datasets without a year.
+    columns : list-like or dict-like, optional
+        The columns to be read from all the datasets, or a mapping of dataset keys to
+        their columns. See `load_dataset`.
+    dtypes : "compact" or dict-like, optional
+        Data type policy of all the datasets, see `load_dataset`.
+    cache : {"parquet", "feather"}, optional
+        Format of the parsed-data cache, see `load_dataset`. The datasets found in the
+        cache are neither downloaded nor parsed.
+    cache_dir : str or pathlib.Path, optional
+        Directory of the parsed-data cache, see `load_dataset`.
+    unzip : bool, default True
+        Whether the members of the zipped datasets are extracted to disk before being
+        parsed, see `load_dataset`.
+    merge : bool, default False
+        Whether to merge the LandDataFrames into a single one (with `merge_many`).
+    how : {"outer", "inner", "left"}, default "outer"
+        How to merge the LandDataFrames, see `merge_many`. Ignored if `merge` is False.
+    max_workers : int, optional
+        Maximum number of workers of each pool. If `None` is provided, one worker per
+        dataset is used (up to the number of CPUs for the parsing pool).
+    parser_pool : {"process", "thread"}, default "process"
+        Whether the files are parsed in a process pool, which parses several files in
+        parallel (at the cost of pickling the LandDataFrames back), or in a thread
+        pool, which avoids the pickling but only parses in parallel while
+        `pandas.read_csv` releases the GIL.
 
-    return read_csv(filepath_or_buffer, **_read_csv_kwargs)
+    Returns
+    -------
+    result : dict or LandDataFrame
+        A mapping of the dataset keys to their LandDataFrame, or the merged
+        LandDataFrame if `merge` is True.
+    """
+    if parser_pool == "process":
+        # forking a process that runs the download threads may deadlock the children
+        # (e.g., on the locks held by the other threads), hence the processes are
+        # started from a clean server process (or spawned where it is not available)
+        parser_executor_cls = futures.ProcessPoolExecutor
+        start_method = (
+            "forkserver"
+            if "forkserver" in multiprocessing.get_all_start_methods()
+            else "spawn"
+        )
+        parser_executor_kwargs = {
+            "mp_context": multiprocessing.get_context(start_method)
+        }
+    elif parser_pool == "thread":
+        parser_executor_cls = futures.ThreadPoolExecutor
+        parser_executor_kwargs = {}
+    else:
+        raise ValueError(
+            f"Unknown parser pool {parser_pool!r}. Must be 'process' or 'thread'."
+        )
+    dataset_keys = list(dataset_keys)
+    if not isinstance(years, dict):
+        years = dict.fromkeys(dataset_keys, years)
+    if not isinstance(columns, dict):
+        columns = dict.fromkeys(dataset_keys, columns)
+
+    ldf_dict = {}
+    load_args_dict = {}
+    for dataset_key in dataset_keys:
+        load_args = _get_load_args(
+            dataset_key,
+            years.get(dataset_key),
+            None,
+            None,
+            None,
+            unzip,
+            columns.get(dataset_key),
+            dtypes,
+            cache,
+            cache_dir,
+            None,
+        )
+        ldf = _read_load_cache(load_args)
+        if ldf is not None:
+            ldf_dict[dataset_key] = ldf
+        else:
+            load_args_dict[dataset_key] = load_args
+
+    if load_args_dict:
+        num_workers = len(load_args_dict)
+        if max_workers is not None:
+            num_workers = min(num_workers, max_workers)
+        with futures.ThreadPoolExecutor(num_workers) as retrieve_executor:
+            with parser_executor_cls(
+                min(num_workers, os.cpu_count() or 1), **parser_executor_kwargs
+            ) as parse_executor:
+                retrieve_futures = {
+                    retrieve_executor.submit(_retrieve_dataset, load_args): dataset_key
+                    for dataset_key, load_args in load_args_dict.items()
+                }
+                parse_futures = {}
+                for retrieve_future in futures.as_completed(retrieve_futures):
+                    dataset_key = retrieve_futures[retrieve_future]
+                    parse_futures[dataset_key] = parse_executor.submit(
+                        _parse_dataset,
+                        retrieve_future.result(),
+                        load_args_dict[dataset_key],
+                    )
+                for dataset_key, parse_future in parse_futures.items():
+                    ldf_dict[dataset_key] = parse_future.result()
+
+    # keep the order of the dataset keys
+    ldf_dict = {dataset_key: ldf_dict[dataset_key] for dataset_key in dataset_keys}
+    if merge:
+        return merge_many(list(ldf_dict.values()), how=how)
+    return ldf_dict
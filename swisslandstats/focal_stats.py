@@ -0,0 +1,151 @@
+"""Focal (moving window) operations."""
+
+import numpy as np
+import pandas as pd
+
+__all__ = ["focal"]
+
+FOCAL_FUNCS = ["sum", "mean", "majority"]
+
+_focal_doc = """
+Compute a moving window statistic of a data column
+
+Each pixel gets the statistic of the pixels with data within the window centered on it.
+The column is rasterized once and the statistic is computed in blocks of rows, using
+separable box sums (cumulative sums along each axis), so that the temporaries are the
+size of a block rather than of the whole raster.
+
+Parameters
+----------%s
+column : str
+    name of the data column.
+window : int or tuple of int
+    size (in pixels) of the window, either as a single (square window) or as a
+    (rows, cols) tuple. The sizes must be odd so that the window is centered on each
+    pixel, e.g., 11 for the pixels within 500 m of a hectare (100 m) pixel.
+func : {"sum", "mean", "majority"}, default "mean"
+    the statistic: "sum" or "mean" of the values, or "majority", i.e., the most
+    frequent value (the smallest one in case of ties).
+value : numeric or list-like of numeric, optional
+    if provided, the statistic is computed on the indicator of the pixels whose value
+    is `value` (or any of the values if list-like), e.g., with `func="mean"`, the
+    share of the pixels of a class within the window, and with `func="sum"`, their
+    count.
+block_rows : int, default 512
+    number of rows of the raster processed at a time.
+
+Returns
+-------
+result : pd.Series
+    the statistic for each row of the LandDataFrame, with the same index. Pixels
+    without data within their window get NaN.
+"""
+
+
+def _get_window_shape(window):
+    # (rows, cols) of the window, which must be odd to be centered on each pixel
+    if np.ndim(window) == 0:
+        window = (window, window)
+    window = tuple(int(size) for size in window)
+    if len(window) != 2 or any(size < 1 or size % 2 == 0 for size in window):
+        raise ValueError(
+            f"The window must be a positive odd size or a tuple of two, got {window}."
+        )
+    return window
+
+
+def _box_sum(arr, window):
+    # sum of the values of `arr` within each window, where `arr` is padded by half a
+    # window on each side, so that the result has the shape of the unpadded array
+    for axis, size in enumerate(window):
+        cumsum = np.cumsum(arr, axis=axis)
+        cumsum = np.concatenate(
+            [np.zeros_like(cumsum.take([0], axis=axis)), cumsum], axis=axis
+        )
+        num = cumsum.shape[axis]
+        arr = cumsum.take(np.arange(size, num), axis=axis) - cumsum.take(
+            np.arange(num - size), axis=axis
+        )
+    return arr
+
+
+def focal(  # noqa: D103
+    ldf, column, window, func="mean", *, value=None, block_rows=512
+):
+    if func not in FOCAL_FUNCS:
+        raise ValueError(f"Unknown func {func!r}. Must be one of {FOCAL_FUNCS}.")
+    window_rows, window_cols = _get_window_shape(window)
+    half_rows, half_cols = window_rows // 2, window_cols // 2
+
+    ser = ldf[column]
+    is_integer = value is not None or pd.api.types.is_integer_dtype(ser.dtype)
+    if func == "majority":
+        if value is not None:
+            classes = np.array([False, True])
+        else:
+            classes = np.sort(ser.dropna().unique())
+    # rasterize once, with NaN for the pixels with no data
+    arr = ldf._to_ndarray([column], np.nan, "float64")[0]
+    num_rows, num_cols = arr.shape
+
+    # sort the pixels by row so that each block only visits the pixels in its rows
+    grid_index = ldf.get_grid_index()
+    order = np.argsort(grid_index.rows, kind="stable")
+    sorted_rows = grid_index.rows[order]
+    result = np.full(len(ldf), np.nan)
+    for row_start in range(0, num_rows, block_rows):
+        row_stop = min(row_start + block_rows, num_rows)
+        # block with a halo of half a window, padded (with no data) at the edges
+        halo_start = max(row_start - half_rows, 0)
+        halo_stop = min(row_stop + half_rows, num_rows)
+        block = np.pad(
+            arr[halo_start:halo_stop],
+            (
+                (
+                    half_rows - (row_start - halo_start),
+                    half_rows - (halo_stop - row_stop),
+                ),
+                (half_cols, half_cols),
+            ),
+            constant_values=np.nan,
+        )
+        valid = ~np.isnan(block)
+        count = _box_sum(valid.astype(np.int64), (window_rows, window_cols))
+        if value is not None:
+            block = np.isin(block, value)
+        if func == "majority":
+            block_result = np.full(count.shape, np.nan)
+            max_count = np.zeros(count.shape, dtype=np.int64)
+            for _class in classes:
+                class_count = _box_sum(
+                    ((block == _class) & valid).astype(np.int64),
+                    (window_rows, window_cols),
+                )
+                is_max = class_count > max_count
+                block_result[is_max] = _class
+                max_count[is_max] = class_count[is_max]
+        else:
+            block_result = _box_sum(
+                np.where(valid, block, 0).astype(
+                    np.int64 if is_integer else np.float64
+                ),
+                (window_rows, window_cols),
+            )
+            with np.errstate(invalid="ignore", divide="ignore"):
+                if func == "mean":
+                    block_result = block_result / count
+                block_result = np.where(count > 0, block_result, np.nan)
+
+        # map the block back to the rows of the land data frame
+        start, stop = np.searchsorted(sorted_rows, [row_start, row_stop])
+        positions = order[start:stop]
+        result[positions] = block_result[
+            grid_index.rows[positions] - row_start, grid_index.cols[positions]
+        ]
+
+    if func != "mean" and is_integer and not np.isnan(result).any():
+        result = result.astype(np.int64)
+    return pd.Series(result, index=ldf.index, name=column)
+
+
+focal.__doc__ = _focal_doc % "\nldf : LandDataFrame"
@@ -2,6 +2,10 @@
 
 import logging
 
+import numpy as np
+import pandas as pd
+from rasterio import features, windows
+
 from . import settings
 
 try:
@@ -9,6 +13,11 @@ try:
 except ImportError:
     gpd = None
 
+try:
+    import shapely
+except ImportError:
+    shapely = None
+
 try:
     import osmnx as ox
 except ImportError:
@@ -18,6 +27,8 @@ __all__ = [
     "get_geoseries",
     "to_geodataframe",
     "clip_by_geometry",
+    "label_by_geometries",
+    "clip_by_geometries",
     "clip_by_nominatim",
 ]
 
@@ -29,6 +40,11 @@ See https://github.com/geopandas/geopandas for more information about
 installing geopandas
 """
 
+_gpd_project_error_msg = (
+    "Reprojecting the geometry requires the geopandas package, which can be installed "
+    "as in:\nconda install -c conda-forge geopandas"
+)
+
 _get_geoseries_doc = """
 Get the geometry of the LandDataFrame as a geopandas GeoSeries%s
 
@@ -62,12 +78,69 @@ geometry : shapely Polygon or MultiPolygon
 geometry_crs : dict, optional
     the starting coordinate reference system of the passed-in geometry.
     If not given, it will take the default crs from the settings.
+method : {"raster", "sjoin"}, default "raster"
+    if "raster", the geometry is rasterized onto the grid of the LandDataFrame and the
+    pixels whose centroid lies within it are selected with an integer lookup. If
+    "sjoin", the (cached) spatial index of the pixel centroids (as points) is queried
+    for the points within the geometry, which is exact for the pixels whose centroid
+    lies exactly on the geometry boundary. The fixed cost of the rasterization makes
+    "sjoin" faster for small LandDataFrames (e.g., a few hundred pixels), whereas
+    "raster" is considerably faster for large ones.
 
 Returns
 -------
 result : LandDataFrame
 """
 
+_label_by_geometries_doc = """
+Label each pixel of a LandDataFrame with the geometry (zone) that contains it, in a
+single pass for all the geometries
+
+Parameters
+----------%s
+geometries : geopandas GeoSeries or GeoDataFrame
+    the geometries (zones), whose index is used as labels. If two geometries overlap,
+    the pixels in the intersection are labelled with the last one
+geometry_crs : dict, optional
+    the starting coordinate reference system of the passed-in geometries, only used if
+    they have no crs set. If not given, it will take the default crs from the settings.
+method : {"raster", "sjoin"}, default "raster"
+    if "raster", the geometries are rasterized onto the grid of the LandDataFrame. If
+    "sjoin", the (cached) spatial index of the pixel centroids (as points) is queried
+    once for all the geometries. See `clip_by_geometry`.
+
+Returns
+-------
+result : pandas Series
+    the label of each pixel (as categorical), or NaN for the pixels outside all
+    geometries
+"""
+
+_clip_by_geometries_doc = """
+Clip a LandDataFrame by many geometries (zones) in a single pass
+
+The result for each geometry matches `clip_by_geometry`, but the pixels are assigned
+to the geometries at once rather than clipping by each geometry separately.
+
+Parameters
+----------%s
+geometries : geopandas GeoSeries or GeoDataFrame
+    the geometries (zones), whose index is used as keys of the result. If two
+    geometries overlap, the pixels in the intersection are only assigned to the last one
+geometry_crs : dict, optional
+    the starting coordinate reference system of the passed-in geometries, only used if
+    they have no crs set. If not given, it will take the default crs from the settings.
+method : {"raster", "sjoin"}, default "raster"
+    if "raster", the geometries are rasterized onto the grid of the LandDataFrame. If
+    "sjoin", the (cached) spatial index of the pixel centroids (as points) is queried
+    once for all the geometries. See `clip_by_geometry`.
+
+Returns
+-------
+result : dict
+    mapping the index of each geometry to the clipped LandDataFrame
+"""
+
 _clip_by_nominatim_doc = """
 Clip a LandDataFrame by a single place name query to Nominatim. See also the
 documentation for `osmnx.gdf_from_place`
@@ -85,12 +158,59 @@ result : LandDataFrame
 """
 
 
+def _project_geometry(geometry, geometry_crs, crs):
+    # project a shapely geometry from `geometry_crs` (default crs if None) to `crs`
+    if geometry_crs is None:
+        geometry_crs = settings.DEFAULT_CRS
+    if geometry_crs != crs:
+        if gpd is None:
+            raise ImportError(_gpd_project_error_msg)
+        geometry = gpd.GeoSeries([geometry], crs=geometry_crs).to_crs(crs).iloc[0]
+    return geometry
+
+
+def _get_within_mask(x, y, geometry):
+    # boolean mask of the points (x, y) that lie within the geometry, using a cheap
+    # coordinate-range prefilter so that only the points within the geometry bounds go
+    # through the exact point-in-polygon test
+    west, south, east, north = geometry.bounds
+    mask = (x >= west) & (x <= east) & (y >= south) & (y <= north)
+    candidates = np.flatnonzero(mask)
+    mask[candidates] = shapely.contains_xy(geometry, x[candidates], y[candidates])
+    return mask
+
+
+def _get_points(ldf):
+    # array of shapely points of the pixel centroids, cached in the land data frame (and
+    # thus invalidated when the coordinates change)
+    grid_cache = ldf._get_grid_cache()
+    try:
+        return grid_cache["points"]
+    except KeyError:
+        x, y = grid_cache["xy"]
+        points = shapely.points(np.asarray(x), np.asarray(y))
+        grid_cache["points"] = points
+        return points
+
+
+def _get_strtree(ldf):
+    # spatial index of the pixel centroids, cached as `_get_points`
+    grid_cache = ldf._get_grid_cache()
+    try:
+        return grid_cache["strtree"]
+    except KeyError:
+        strtree = shapely.STRtree(_get_points(ldf))
+        grid_cache["strtree"] = strtree
+        return strtree
+
+
 def get_geoseries(ldf):  # noqa: D103
     if gpd:
+        # note that the crs is not cached with the points so that it is always taken
+        # from the current land data frame
         return gpd.GeoSeries(
-            gpd.points_from_xy(ldf[ldf.x_column], ldf[ldf.y_column]),
+            gpd.array.from_shapely(_get_points(ldf), crs=ldf.crs),
             index=ldf.index,
-            crs=ldf.crs,
         )
     else:
         logging.warning(_gpd_warning_msg)
@@ -117,36 +237,68 @@ def to_geodataframe(ldf, *, drop_xy_columns=True):  # noqa: D103
 to_geodataframe.__doc__ = _to_geodataframe_doc % "\nldf : LandDataFrame"
 
 
-def clip_by_geometry(ldf, geometry, *, geometry_crs=None):  # noqa: D103
-    if geometry_crs is None:
-        geometry_crs = settings.DEFAULT_CRS
+def _rasterize_pixels(ldf, shapes, bounds, dtype):
+    # value of the shapes (pairs of geometry and value) at the pixels of `ldf`, where
+    # a pixel takes the value of a shape if its centroid lies within its geometry, and
+    # 0 otherwise. The shapes are rasterized onto the window of the land data frame grid
+    # that covers `bounds`
+    if len(ldf) == 0:
+        # an empty land data frame has no grid (nor pixels to label)
+        return np.zeros(0, dtype=dtype)
+    grid_index = ldf.get_grid_index()
+    num_rows, num_cols = grid_index.shape
+    transform = ldf.get_transform()
+    window = windows.from_bounds(*bounds, transform=transform)
+    row_start = max(int(np.floor(window.row_off)), 0)
+    row_stop = min(int(np.ceil(window.row_off + window.height)), num_rows)
+    col_start = max(int(np.floor(window.col_off)), 0)
+    col_stop = min(int(np.ceil(window.col_off + window.width)), num_cols)
+    values = np.zeros(len(ldf), dtype=dtype)
+    if row_start >= row_stop or col_start >= col_stop:
+        return values
+
+    window = windows.Window.from_slices((row_start, row_stop), (col_start, col_stop))
+    window_arr = features.rasterize(
+        shapes,
+        out_shape=(window.height, window.width),
+        transform=windows.transform(window, transform),
+        fill=0,
+        dtype=dtype,
+    )
+    rows = grid_index.rows - row_start
+    cols = grid_index.cols - col_start
+    in_window = np.flatnonzero(
+        (rows >= 0) & (rows < window.height) & (cols >= 0) & (cols < window.width)
+    )
+    values[in_window] = window_arr[rows[in_window], cols[in_window]]
+    return values
+
+
+def _get_raster_mask(ldf, geometry):
+    # boolean mask of the pixels of `ldf` whose centroid lies within the geometry
+    return _rasterize_pixels(ldf, [(geometry, 1)], geometry.bounds, "uint8").astype(
+        bool
+    )
+
+
+def clip_by_geometry(ldf, geometry, *, geometry_crs=None, method="raster"):  # noqa: D103
+    if method not in {"raster", "sjoin"}:
+        raise ValueError(
+            f"Unknown method {method!r}. Must be either 'raster' or 'sjoin'."
+        )
 
     if gpd:
-        # TODO: it'd be cool to 'cache' the GeoSeries (maybe as an
-        # attribute of LandDataFrame)
-
-        gdf = gpd.GeoDataFrame({"geometry": [geometry]}, crs=geometry_crs)
-        if geometry_crs != ldf.crs:
-            # alternative with osmnx (slower):
-            # geometry = ox.project_geometry(geometry, to_crs=ls_ldf.crs)
-            # alternative without geopandas (faster but less ):
-            # geometry = transform(
-            #     partial(pyproj.transform, pyproj.Proj(**geometry_crs),
-            #             pyproj.Proj(**ldf.crs)), geometry)
-            gdf = gdf.to_crs(ldf.crs)
-
-        return ldf.loc[
-            gpd.sjoin(
-                gpd.GeoDataFrame(
-                    geometry=gpd.points_from_xy(
-                        ldf[ldf.x_column], ldf[ldf.y_column], crs=ldf.crs
-                    ),
-                    index=ldf.index,
-                ),
-                gdf,
-                how="inner",
-                predicate="within",
-            ).index
+        # alternative with osmnx (slower):
+        # geometry = ox.project_geometry(geometry, to_crs=ls_ldf.crs)
+        geometry = _project_geometry(geometry, geometry_crs, ldf.crs)
+
+        if method == "raster":
+            return ldf[_get_raster_mask(ldf, geometry)]
+
+        # query the (cached) spatial index of the pixel centroids, i.e., the points
+        # that are within the geometry
+        return ldf.iloc[
+            np.sort(_get_strtree(ldf).query(geometry, predicate="contains"))
         ]
 
     else:
@@ -158,6 +310,84 @@ def clip_by_geometry(ldf, geometry, *, geometry_crs=None):  # noqa: D103
 clip_by_geometry.__doc__ = _clip_by_geometry_doc % "\nldf : LandDataFrame"
 
 
+def _get_geometry_codes(ldf, geometries, *, geometry_crs=None, method="raster"):
+    # position of the geometry (zone) that contains each pixel of `ldf` (-1 for the
+    # pixels outside all geometries), computed in a single pass
+    if method not in {"raster", "sjoin"}:
+        raise ValueError(
+            f"Unknown method {method!r}. Must be either 'raster' or 'sjoin'."
+        )
+    geoseries = gpd.GeoSeries(geometries.geometry)
+    if geoseries.crs is None:
+        if geometry_crs is None:
+            geometry_crs = settings.DEFAULT_CRS
+        geoseries = geoseries.set_crs(geometry_crs)
+    geoseries = geoseries.to_crs(ldf.crs)
+
+    if method == "raster":
+        # burn the position plus one so that 0 is left for the pixels outside
+        return (
+            _rasterize_pixels(
+                ldf,
+                zip(geoseries.values, range(1, len(geoseries) + 1)),
+                geoseries.total_bounds,
+                "int32",
+            )
+            - 1
+        )
+
+    zone_codes = np.full(len(ldf), -1, dtype="int32")
+    zone_idx, pixel_idx = _get_strtree(ldf).query(
+        geoseries.values, predicate="contains"
+    )
+    # as in the raster method, the pixels in overlapping geometries are assigned to
+    # the last one
+    order = np.argsort(zone_idx, kind="stable")
+    zone_codes[pixel_idx[order]] = zone_idx[order]
+    return zone_codes
+
+
+def label_by_geometries(  # noqa: D103
+    ldf, geometries, *, geometry_crs=None, method="raster"
+):
+    if gpd:
+        zone_codes = _get_geometry_codes(
+            ldf, geometries, geometry_crs=geometry_crs, method=method
+        )
+        return pd.Series(
+            pd.Categorical.from_codes(zone_codes, categories=geometries.index),
+            index=ldf.index,
+        )
+    else:
+        logging.warning(_gpd_warning_msg)
+
+
+label_by_geometries.__doc__ = _label_by_geometries_doc % "\nldf : LandDataFrame"
+
+
+def clip_by_geometries(  # noqa: D103
+    ldf, geometries, *, geometry_crs=None, method="raster"
+):
+    if gpd:
+        zone_codes = _get_geometry_codes(
+            ldf, geometries, geometry_crs=geometry_crs, method=method
+        )
+        # sort the pixels by zone so that the pixels of each zone are contiguous
+        order = np.argsort(zone_codes, kind="stable")
+        bounds = np.searchsorted(
+            zone_codes[order], np.arange(len(geometries) + 1), side="left"
+        )
+        return {
+            label: ldf.iloc[order[start:stop]]
+            for label, start, stop in zip(geometries.index, bounds[:-1], bounds[1:])
+        }
+    else:
+        logging.warning(_gpd_warning_msg)
+
+
+clip_by_geometries.__doc__ = _clip_by_geometries_doc % "\nldf : LandDataFrame"
+
+
 def clip_by_nominatim(ldf, query, **geocode_to_gdf_kwargs):  # noqa: D103
     if ox:
         try:
@@ -0,0 +1,236 @@
+"""Hectare grid of the Swiss Federal Statistical Office (SFSO)."""
+
+import numpy as np
+
+__all__ = [
+    "GRID_SHAPE",
+    "xy_to_reli",
+    "reli_to_xy",
+    "xy_to_rowcol",
+    "rowcol_to_xy",
+    "reli_to_rowcol",
+    "rowcol_to_reli",
+    "rowcol_to_grid_key",
+    "grid_key_to_rowcol",
+    "xy_to_grid_key",
+]
+
+# the LV95 coordinates are the LV03 ones plus these offsets
+_LV95_X_OFFSET = 2000000
+_LV95_Y_OFFSET = 1000000
+# size of the hectare grid cells and factor of the x component of the RELI
+_HECTARE_RES = 100
+_RELI_X_FACTOR = 10000
+# national hectare grid, in LV03 hectare units (i.e., LV03 coordinates divided by the
+# hectare size): the westernmost column and the northernmost row
+_GRID_COL_OFFSET = 4800
+_GRID_ROW_OFFSET = 2999
+# shape of the national hectare grid, which spans from (2480000, 1070000) to
+# (2840000, 1300000) in LV95 coordinates
+GRID_SHAPE = (2300, 3600)
+
+
+def xy_to_reli(x, y):
+    """
+    Get the RELI identifier of the hectares that contain the given coordinates.
+
+    The RELI is the identifier of the hectares of the SFSO, which concatenates the
+    kilometric and hectometric digits of the LV03 x and y coordinates of the
+    hectare, e.g., 48551097 for the hectare at (2485500, 1109700).
+
+    Parameters
+    ----------
+    x, y : numeric or array-like
+        The x and y coordinates, in either the LV95 (EPSG:2056) or LV03 (EPSG:21781)
+        coordinate reference system.
+
+    Returns
+    -------
+    reli : numeric or np.ndarray
+        The RELI identifiers.
+    """
+    x, y = _get_hectares(x, y)
+    return x * _RELI_X_FACTOR + y
+
+
+def reli_to_xy(reli, *, lv95=True):
+    """
+    Get the coordinates of the hectares identified by the given RELI.
+
+    Parameters
+    ----------
+    reli : numeric or array-like
+        The RELI identifiers.
+    lv95 : bool, default True
+        Whether to return the coordinates in the LV95 (EPSG:2056) coordinate reference
+        system (otherwise LV03, i.e., EPSG:21781, coordinates are returned).
+
+    Returns
+    -------
+    x, y : numeric or np.ndarray
+        The x and y coordinates of the hectares.
+    """
+    x, y = np.divmod(np.asarray(reli, dtype=np.int64), _RELI_X_FACTOR)
+    x = x * _HECTARE_RES
+    y = y * _HECTARE_RES
+    if lv95:
+        x = x + _LV95_X_OFFSET
+        y = y + _LV95_Y_OFFSET
+    return x, y
+
+
+def _get_hectares(x, y):
+    # LV03 hectare units of the hectares that contain the given LV95 or LV03
+    # coordinates. The LV03 coordinates are below 1e6 and the LV95 offsets are multiples
+    # of 1e6, so the modulo turns the LV95 coordinates into LV03 ones (and leaves the
+    # latter as is)
+    x = np.asarray(x) % _LV95_Y_OFFSET
+    y = np.asarray(y) % _LV95_Y_OFFSET
+    return (x // _HECTARE_RES).astype(np.int64), (y // _HECTARE_RES).astype(np.int64)
+
+
+def xy_to_rowcol(x, y):
+    """
+    Get the row and column of the hectares that contain the given coordinates.
+
+    The rows and columns refer to the national hectare grid (of shape `GRID_SHAPE`),
+    with the rows counted from the north and the columns from the west.
+
+    Parameters
+    ----------
+    x, y : numeric or array-like
+        The x and y coordinates, in either the LV95 (EPSG:2056) or LV03 (EPSG:21781)
+        coordinate reference system.
+
+    Returns
+    -------
+    row, col : numeric or np.ndarray
+        The rows and columns.
+    """
+    x, y = _get_hectares(x, y)
+    return _GRID_ROW_OFFSET - y, x - _GRID_COL_OFFSET
+
+
+def rowcol_to_xy(row, col, *, lv95=True):
+    """
+    Get the coordinates of the hectares at the given rows and columns.
+
+    Parameters
+    ----------
+    row, col : numeric or array-like
+        The rows and columns in the national hectare grid.
+    lv95 : bool, default True
+        Whether to return the coordinates in the LV95 (EPSG:2056) coordinate reference
+        system (otherwise LV03, i.e., EPSG:21781, coordinates are returned).
+
+    Returns
+    -------
+    x, y : numeric or np.ndarray
+        The x and y coordinates of the hectares.
+    """
+    x = (np.asarray(col, dtype=np.int64) + _GRID_COL_OFFSET) * _HECTARE_RES
+    y = (_GRID_ROW_OFFSET - np.asarray(row, dtype=np.int64)) * _HECTARE_RES
+    if lv95:
+        x = x + _LV95_X_OFFSET
+        y = y + _LV95_Y_OFFSET
+    return x, y
+
+
+def reli_to_rowcol(reli):
+    """
+    Get the row and column of the hectares identified by the given RELI.
+
+    Parameters
+    ----------
+    reli : numeric or array-like
+        The RELI identifiers.
+
+    Returns
+    -------
+    row, col : numeric or np.ndarray
+        The rows and columns in the national hectare grid.
+    """
+    x, y = np.divmod(np.asarray(reli, dtype=np.int64), _RELI_X_FACTOR)
+    return _GRID_ROW_OFFSET - y, x - _GRID_COL_OFFSET
+
+
+def rowcol_to_reli(row, col):
+    """
+    Get the RELI identifier of the hectares at the given rows and columns.
+
+    Parameters
+    ----------
+    row, col : numeric or array-like
+        The rows and columns in the national hectare grid.
+
+    Returns
+    -------
+    reli : numeric or np.ndarray
+        The RELI identifiers.
+    """
+    return (np.asarray(col, dtype=np.int64) + _GRID_COL_OFFSET) * _RELI_X_FACTOR + (
+        _GRID_ROW_OFFSET - np.asarray(row, dtype=np.int64)
+    )
+
+
+def rowcol_to_grid_key(row, col):
+    """
+    Get the grid key of the hectares at the given rows and columns.
+
+    The grid key is the (row-major) flat index of the hectare in the national hectare
+    grid, i.e., a dense int32 key that can be used to index arrays of the size of the
+    national grid, or to join and look up hectares with integer arithmetic.
+
+    Parameters
+    ----------
+    row, col : numeric or array-like
+        The rows and columns in the national hectare grid.
+
+    Returns
+    -------
+    grid_key : numeric or np.ndarray
+        The int32 grid keys.
+    """
+    row = np.asarray(row)
+    col = np.asarray(col)
+    num_rows, num_cols = GRID_SHAPE
+    if np.any((row < 0) | (row >= num_rows) | (col < 0) | (col >= num_cols)):
+        raise ValueError("Some hectares are outside the national hectare grid.")
+    return (row * num_cols + col).astype(np.int32)
+
+
+def grid_key_to_rowcol(grid_key):
+    """
+    Get the row and column of the hectares with the given grid keys.
+
+    Parameters
+    ----------
+    grid_key : numeric or array-like
+        The grid keys.
+
+    Returns
+    -------
+    row, col : numeric or np.ndarray
+        The rows and columns in the national hectare grid.
+    """
+    return np.divmod(np.asarray(grid_key, dtype=np.int64), GRID_SHAPE[1])
+
+
+def xy_to_grid_key(x, y):
+    """
+    Get the grid key of the hectares that contain the given coordinates.
+
+    See `rowcol_to_grid_key` for the definition of the grid key.
+
+    Parameters
+    ----------
+    x, y : numeric or array-like
+        The x and y coordinates, in either the LV95 (EPSG:2056) or LV03 (EPSG:21781)
+        coordinate reference system.
+
+    Returns
+    -------
+    grid_key : numeric or np.ndarray
+        The int32 grid keys.
+    """
+    return rowcol_to_grid_key(*xy_to_rowcol(x, y))
@@ -0,0 +1,237 @@
+"""Landscape metrics."""
+
+import numpy as np
+import pandas as pd
+
+from . import zonal as sls_zonal
+
+try:
+    from scipy import sparse
+    from scipy.sparse import csgraph
+except ImportError:
+    sparse = None
+
+__all__ = ["landscape_metrics"]
+
+LANDSCAPE_METRICS = [
+    "class_area",
+    "number_of_patches",
+    "edge_density",
+    "largest_patch_index",
+]
+
+_scipy_error_msg = (
+    "The landscape metrics require the scipy package, which can be installed as in:\n"
+    "conda install -c conda-forge scipy"
+)
+
+_landscape_metrics_doc = """
+Compute class-level landscape metrics of data columns
+
+The data columns (e.g., the periods of a survey) are rasterized onto the pixel grid of
+the LandDataFrame at once, and the patches of all the classes and zones of each column
+are labelled in a single connected components pass, so that the metrics of many zones
+and periods are computed without clipping or re-rasterizing the data. Following
+FRAGSTATS, the landscape of each zone only includes its pixels with data, and the edges
+with pixels outside the landscape are not counted. Requires scipy, otherwise an
+ImportError is raised.
+
+Parameters
+----------%s
+columns : str or list-like of str
+    names of the data columns.
+zones : geopandas GeoSeries or GeoDataFrame, str or array-like, optional
+    the zones (landscapes) for which the metrics are computed, either as geometries or
+    as the zone of each pixel (see `zonal_stats`). If not provided, the metrics are
+    computed for the whole LandDataFrame.
+metrics : list-like of str, optional
+    the metrics to compute, among "class_area" (area of the class, in squared units of
+    the CRS), "number_of_patches", "edge_density" (length of the edges between the
+    class and other classes, in units of the CRS, per hectare of landscape) and
+    "largest_patch_index" (percentage of the landscape covered by the largest patch of
+    the class). If not provided, all the metrics are computed.
+neighborhood : {4, 8}, default 8
+    whether the pixels are connected to their 4 orthogonal neighbors or also to their
+    diagonal neighbors when labelling the patches.
+geometry_crs : dict, optional
+    the starting coordinate reference system of the passed-in geometries, only used if
+    they have no crs set. If not given, it will take the default crs from the settings.
+method : {"raster", "sjoin"}, default "raster"
+    how the geometries are assigned to the pixels, see `label_by_geometries`.
+
+Returns
+-------
+result : pd.DataFrame
+    tidy data frame with a row for each (zone,) column and class present in the
+    (zone,) landscape, with the ("zone",) "column" and "class" columns followed by the
+    metrics.
+"""
+
+# hectare in squared meters, since the edge density is expressed per hectare
+_HECTARE_AREA = 10000
+
+
+def _get_neighbor_pairs(shape, neighborhood):
+    # pairs of (flat) positions of neighboring pixels of a raster of the given shape, as
+    # arrays of positions and neighbor positions for each direction (to the right, down
+    # and, for the 8-neighborhood, the two diagonals down)
+    flat_index = np.arange(shape[0] * shape[1]).reshape(shape)
+    slices = [
+        ((slice(None), slice(None, -1)), (slice(None), slice(1, None))),
+        ((slice(None, -1), slice(None)), (slice(1, None), slice(None))),
+    ]
+    if neighborhood == 8:
+        slices += [
+            ((slice(None, -1), slice(None, -1)), (slice(1, None), slice(1, None))),
+            ((slice(None, -1), slice(1, None)), (slice(1, None), slice(None, -1))),
+        ]
+    for from_slice, to_slice in slices:
+        yield flat_index[from_slice].ravel(), flat_index[to_slice].ravel()
+
+
+def _get_column_metrics(
+    codes, zone_raster, num_zones, num_classes, metrics, neighborhood, res
+):
+    # metrics of each zone and class of a column, given the raster of the class codes
+    # (-1 for no data) and the raster of the zone codes (-1 outside all zones)
+    xres, yres = res
+    pixel_area = abs(xres * yres)
+    # combined zone and class code of each pixel (-1 outside the landscapes)
+    codes = np.where(
+        (codes >= 0) & (zone_raster >= 0), zone_raster * num_classes + codes, -1
+    ).ravel()
+    in_landscape = codes >= 0
+    num_codes = num_zones * num_classes
+    counts = np.bincount(codes[in_landscape], minlength=num_codes)
+    landscape_area = (
+        counts.reshape(num_zones, num_classes).sum(axis=1).repeat(num_classes)
+        * pixel_area
+    )
+
+    result = {}
+    if "class_area" in metrics:
+        result["class_area"] = counts * pixel_area
+    if "edge_density" in metrics:
+        edge_lengths = np.zeros(num_codes)
+        # the edges between horizontal neighbors have the pixel height as length and
+        # those between vertical neighbors the pixel width
+        for (positions, neighbors), length in zip(
+            _get_neighbor_pairs(zone_raster.shape, 4),
+            [abs(yres), abs(xres)],
+        ):
+            from_codes = codes[positions]
+            to_codes = codes[neighbors]
+            # edges between different classes of the same zone
+            is_edge = (
+                (from_codes >= 0)
+                & (to_codes >= 0)
+                & (from_codes != to_codes)
+                & (from_codes // num_classes == to_codes // num_classes)
+            )
+            for edge_codes in [from_codes[is_edge], to_codes[is_edge]]:
+                edge_lengths += np.bincount(edge_codes, minlength=num_codes) * length
+        with np.errstate(invalid="ignore", divide="ignore"):
+            result["edge_density"] = edge_lengths / landscape_area * _HECTARE_AREA
+    if {"number_of_patches", "largest_patch_index"}.intersection(metrics):
+        # label the patches, i.e., the connected components of the graph whose edges
+        # join neighboring pixels with the same zone and class
+        edge_positions, edge_neighbors = [], []
+        for positions, neighbors in _get_neighbor_pairs(
+            zone_raster.shape, neighborhood
+        ):
+            is_same = in_landscape[positions] & (codes[positions] == codes[neighbors])
+            edge_positions.append(positions[is_same])
+            edge_neighbors.append(neighbors[is_same])
+        edge_positions = np.concatenate(edge_positions)
+        graph = sparse.coo_array(
+            (
+                np.ones(len(edge_positions), dtype=np.int8),
+                (edge_positions, np.concatenate(edge_neighbors)),
+            ),
+            shape=(codes.size, codes.size),
+        ).tocsr()
+        _, patch_labels = csgraph.connected_components(graph, directed=False)
+        patch_labels = patch_labels[in_landscape]
+        patch_sizes = np.bincount(patch_labels)
+        # zone and class code of each patch (the patches of pixels outside the
+        # landscapes have no pixels in `patch_labels`, hence size 0)
+        patch_codes = np.zeros(len(patch_sizes), dtype=codes.dtype)
+        patch_codes[patch_labels] = codes[in_landscape]
+        is_patch = patch_sizes > 0
+        patch_codes = patch_codes[is_patch]
+        patch_sizes = patch_sizes[is_patch]
+        if "number_of_patches" in metrics:
+            result["number_of_patches"] = np.bincount(patch_codes, minlength=num_codes)
+        if "largest_patch_index" in metrics:
+            largest_patch_sizes = np.zeros(num_codes, dtype=patch_sizes.dtype)
+            np.maximum.at(largest_patch_sizes, patch_codes, patch_sizes)
+            with np.errstate(invalid="ignore", divide="ignore"):
+                result["largest_patch_index"] = (
+                    largest_patch_sizes * pixel_area / landscape_area * 100
+                )
+
+    # only keep the zones and classes present in the landscapes
+    present = np.flatnonzero(counts)
+    zone_idx, class_idx = np.divmod(present, num_classes)
+    return zone_idx, class_idx, {metric: result[metric][present] for metric in metrics}
+
+
+def landscape_metrics(  # noqa: D103
+    ldf,
+    columns,
+    *,
+    zones=None,
+    metrics=None,
+    neighborhood=8,
+    geometry_crs=None,
+    method="raster",
+):
+    if sparse is None:
+        raise ImportError(_scipy_error_msg)
+    if metrics is None:
+        metrics = LANDSCAPE_METRICS
+    unknown_metrics = set(metrics).difference(LANDSCAPE_METRICS)
+    if unknown_metrics:
+        raise ValueError(
+            f"Unknown metrics {unknown_metrics}. Must be in {LANDSCAPE_METRICS}."
+        )
+    if neighborhood not in {4, 8}:
+        raise ValueError(f"Unknown neighborhood {neighborhood}. Must be 4 or 8.")
+    if isinstance(columns, str):
+        columns = [columns]
+
+    # rasterize the zone codes and (below) the class codes of each column onto the
+    # pixel grid of the land data frame, which is shared by all the columns
+    shape = ldf.get_grid_index().shape
+    flat_index = ldf._get_flat_index()
+    zone_raster = np.full(shape, -1, dtype=np.int64)
+    if zones is None:
+        zone_labels = None
+        num_zones = 1
+        zone_raster.ravel()[flat_index] = 0
+    else:
+        zone_codes, zone_labels = sls_zonal._get_zone_codes(
+            ldf, zones, geometry_crs, method
+        )
+        num_zones = len(zone_labels)
+        zone_raster.ravel()[flat_index] = zone_codes
+
+    dfs = []
+    for column in columns:
+        classes = pd.Index(ldf[column].dropna().unique()).sort_values()
+        codes = np.full(shape, -1, dtype=np.int64)
+        codes.ravel()[flat_index] = classes.get_indexer(ldf[column])
+        zone_idx, class_idx, column_metrics = _get_column_metrics(
+            codes, zone_raster, num_zones, len(classes), metrics, neighborhood, ldf.res
+        )
+        df = pd.DataFrame({"column": column, "class": classes.take(class_idx)})
+        if zone_labels is not None:
+            df.insert(0, "zone", zone_labels.take(zone_idx))
+        for metric in metrics:
+            df[metric] = column_metrics[metric]
+        dfs.append(df)
+
+    return pd.concat(dfs, ignore_index=True)
+
+
+landscape_metrics.__doc__ = _landscape_metrics_doc % "\nldf : LandDataFrame"
@@ -0,0 +1,313 @@
+"""Offline-first registry of the dataset files."""
+
+import hashlib
+import json
+import logging as lg
+import os
+import shutil
+from pathlib import Path
+from urllib import parse
+
+import pandas as pd
+import pooch
+
+from . import cache as sls_cache
+from . import settings, utils
+
+__all__ = ["list_datasets"]
+
+# name of the file of the hash index, stored in the pooch cache directory
+HASH_INDEX_FILENAME = "swisslandstats-hash-index.json"
+
+
+def _is_url(mirror):
+    # whether the mirror is a (base) URL rather than a local directory
+    return "://" in str(mirror)
+
+
+def _get_cache_path(path):
+    # pooch cache directory (with the user directory expanded), as in pooch
+    if path is None:
+        path = pooch.os_cache("pooch")
+    return Path(os.path.expanduser(str(path)))
+
+
+def _get_fname(url):
+    # file name of the URL in the pooch cache, i.e., the MD5 hash of the URL followed by
+    # the last part of its path (cropped to 255 characters), as in pooch
+    md5 = hashlib.md5(url.encode()).hexdigest()
+    fname = parse.urlsplit(url).path.split("/")[-1]
+    return f"{md5}-{fname[-(255 - len(md5) - 1) :]}"
+
+
+def _get_hash(known_hash):
+    # hash with its algorithm prefix, e.g., "sha256:...", as in pooch
+    if ":" not in known_hash:
+        known_hash = f"sha256:{known_hash}"
+    return known_hash.lower()
+
+
+def _read_hash_index(index_filepath):
+    try:
+        with open(index_filepath) as src:
+            return json.load(src)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def _write_hash_index(hash_index, index_filepath):
+    # write to a temporary file and rename it, so that concurrent processes never read
+    # a partially written index
+    index_filepath = Path(index_filepath)
+    index_filepath.parent.mkdir(parents=True, exist_ok=True)
+    tmp_filepath = index_filepath.with_name(f"{index_filepath.name}.{os.getpid()}.tmp")
+    with open(tmp_filepath, "w") as dst:
+        json.dump(hash_index, dst, indent=2)
+    os.replace(tmp_filepath, index_filepath)
+
+
+def _get_file_key(filepath):
+    # size and modification time of the file, which identify its content in the index
+    stat = os.stat(filepath)
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def verify_file(filepath, known_hash, index_filepath):
+    """
+    Verify the hash of a file, using the persisted hash index when possible.
+
+    The hash of a file is only computed if the index has no entry for it or if its
+    size or modification time have changed since it was indexed, so that large files
+    are not rehashed on each load.
+
+    Parameters
+    ----------
+    filepath : str or pathlib.Path
+        Path to the file.
+    known_hash : str
+        Expected hash of the file, optionally prefixed by the algorithm, e.g.,
+        "sha256:...", as in `pooch.retrieve`.
+    index_filepath : str or pathlib.Path
+        Path to the hash index (a JSON file), which is created or updated if the file
+        is hashed.
+
+    Returns
+    -------
+    matches : bool
+        Whether the hash of the file matches `known_hash`.
+    """
+    known_hash = _get_hash(known_hash)
+    filepath = str(Path(filepath).resolve())
+    hash_index = _read_hash_index(index_filepath)
+    file_key = _get_file_key(filepath)
+    entry = hash_index.get(filepath)
+    if (
+        entry is not None
+        and {key: entry.get(key) for key in file_key} == file_key
+        and entry.get("hash", "").split(":")[0] == known_hash.split(":")[0]
+    ):
+        return entry["hash"] == known_hash
+
+    alg = known_hash.split(":")[0]
+    file_hash = f"{alg}:{pooch.file_hash(filepath, alg=alg)}"
+    # re-read the index right before writing it to reduce the chances of dropping the
+    # entries written by concurrent processes in the meantime
+    hash_index = _read_hash_index(index_filepath)
+    hash_index[filepath] = {**file_key, "hash": file_hash}
+    _write_hash_index(hash_index, index_filepath)
+    return file_hash == known_hash
+
+
+def _index_file(filepath, known_hash, index_filepath):
+    # record a file whose hash has already been verified (e.g., by pooch)
+    hash_index = _read_hash_index(index_filepath)
+    hash_index[str(Path(filepath).resolve())] = {
+        **_get_file_key(filepath),
+        "hash": _get_hash(known_hash),
+    }
+    _write_hash_index(hash_index, index_filepath)
+
+
+def _link_file(src_filepath, dst_filepath):
+    # hard-link the file (or copy it if it is not possible, e.g., across file systems)
+    # to a temporary file that is then renamed, so that concurrent processes never see
+    # a partially copied file
+    dst_filepath = Path(dst_filepath)
+    dst_filepath.parent.mkdir(parents=True, exist_ok=True)
+    tmp_filepath = dst_filepath.with_name(f"{dst_filepath.name}.{os.getpid()}.tmp")
+    try:
+        os.link(src_filepath, tmp_filepath)
+    except OSError:
+        shutil.copy2(src_filepath, tmp_filepath)
+    os.replace(tmp_filepath, dst_filepath)
+
+
+def retrieve(
+    url,
+    known_hash=None,
+    fname=None,
+    path=None,
+    processor=None,
+    *,
+    mirror=None,
+    **retrieve_kwargs,
+):
+    """
+    Retrieve a dataset file, from a local mirror if available.
+
+    This is a drop-in replacement of `pooch.retrieve` which (i) looks up the file in a
+    local mirror directory before downloading it, or downloads it from a mirror URL
+    (e.g., of an internal object store) instead of `url` and (ii) verifies the known
+    hash of the files against a persisted hash index (see `verify_file`) rather than
+    rehashing them on each call. The files of the mirror are named as in the pooch
+    cache, i.e., the MD5 hash of the URL followed by the file name of the URL, so that
+    a mirror can be populated by copying the pooch cache directory of a machine with
+    network access.
+
+    Parameters
+    ----------
+    url : str
+        The URL of the file.
+    known_hash : str, optional
+        Expected hash of the file. If `None` is provided, the hash is not verified (nor
+        indexed) and the file is retrieved as with `pooch.retrieve`.
+    fname, path, processor : optional
+        Arguments of `pooch.retrieve`. Note that when the file is found in a local
+        mirror directory, it is hard-linked (or copied if it is not possible) to `path`
+        as `fname`, so that the processor is called with the file in the pooch cache
+        as if it had been downloaded, e.g., `pooch.Unzip` extracts the members there
+        rather than in the mirror.
+    mirror : str or pathlib.Path, optional
+        Local directory or base URL of the mirror. If `None` is provided, the value set
+        in `settings.DATASET_MIRROR` is taken.
+    **retrieve_kwargs : dict-like
+        Additional keyword arguments passed to `pooch.retrieve`.
+
+    Returns
+    -------
+    filepath : str or list of str
+        The path to the local file, or the output of the processor if provided.
+    """
+    if mirror is None:
+        mirror = settings.DATASET_MIRROR
+    if known_hash is None:
+        if mirror is not None:
+            utils.log(
+                "Ignoring the mirror because no known hash has been provided",
+                level=lg.WARNING,
+            )
+        return pooch.retrieve(
+            url,
+            known_hash,
+            fname=fname,
+            path=path,
+            processor=processor,
+            **retrieve_kwargs,
+        )
+
+    path = _get_cache_path(path)
+    index_filepath = path / HASH_INDEX_FILENAME
+    mirror_fname = _get_fname(url)
+    if fname is None:
+        fname = mirror_fname
+    filepath = path / fname
+
+    if mirror is not None:
+        if not _is_url(mirror):
+            mirror_filepath = Path(mirror) / mirror_fname
+            if mirror_filepath.exists():
+                if not verify_file(mirror_filepath, known_hash, index_filepath):
+                    raise ValueError(
+                        f"The hash of the mirrored file {mirror_filepath} does not "
+                        f"match the known hash {known_hash}."
+                    )
+                # the processor runs on the file in the pooch cache (rather than in the
+                # mirror, which may be read-only), so the file is placed there
+                if not (
+                    filepath.exists()
+                    and verify_file(filepath, known_hash, index_filepath)
+                ):
+                    _link_file(mirror_filepath, filepath)
+                    _index_file(filepath, known_hash, index_filepath)
+                utils.log(f"Retrieved {url} from the mirror at {mirror_filepath}")
+        else:
+            # note that the file keeps the name of the original URL in the pooch cache
+            url = f"{str(mirror).rstrip('/')}/{mirror_fname}"
+
+    if filepath.exists() and verify_file(filepath, known_hash, index_filepath):
+        # the file has already been verified, so that pooch does not need to rehash it
+        return pooch.retrieve(
+            url, None, fname=fname, path=path, processor=processor, **retrieve_kwargs
+        )
+    result = pooch.retrieve(
+        url, known_hash, fname=fname, path=path, processor=processor, **retrieve_kwargs
+    )
+    # pooch has verified the hash of the downloaded file
+    _index_file(filepath, known_hash, index_filepath)
+    return result
+
+
+def list_datasets(*, path=None, cache_dir=None, mirror=None):
+    """
+    List the datasets that are available locally.
+
+    Parameters
+    ----------
+    path : str or pathlib.Path, optional
+        The pooch cache directory where the dataset files are downloaded. If `None` is
+        provided, the default pooch cache directory will be used.
+    cache_dir : str or pathlib.Path, optional
+        Directory of the parsed-data cache (see `load_dataset`). If `None` is provided,
+        `path` will be used.
+    mirror : str or pathlib.Path, optional
+        Local directory of the mirror (mirror URLs are ignored). If `None` is provided,
+        the value set in `settings.DATASET_MIRROR` is taken.
+
+    Returns
+    -------
+    result : pandas.DataFrame
+        Data frame with a row for each local file of the datasets of
+        `settings.DATASET_DICT`, with the "dataset_key" and "year" of the dataset, the
+        "location" of the file, i.e., "mirror" and "download" for the raw files found
+        in the mirror and the pooch cache respectively and "parquet" or "feather" for
+        the parsed-data cache, its "filepath" and the "columns" of the parsed data
+        (`None` for the raw files).
+    """
+    path = _get_cache_path(path)
+    if cache_dir is None:
+        cache_dir = path
+    cache_dir = Path(cache_dir)
+    if mirror is None:
+        mirror = settings.DATASET_MIRROR
+    locations = [("download", path)]
+    if mirror is not None and not _is_url(mirror):
+        locations.insert(0, ("mirror", Path(mirror)))
+
+    rows = []
+    for dataset_key, dataset_items in settings.DATASET_DICT.items():
+        for year, dataset_item in dataset_items.items():
+            if year == "latest":
+                continue
+            fname = _get_fname(dataset_item["url"])
+            for location, location_dir in locations:
+                filepath = location_dir / fname
+                if filepath.exists():
+                    rows.append((dataset_key, year, location, str(filepath), None))
+            if sls_cache.pa is None:
+                continue
+            hash_prefix = _get_hash(dataset_item["known_hash"]).split(":")[-1][:16]
+            for cache_format, ext in sls_cache.CACHE_FORMATS.items():
+                for filepath in sorted(cache_dir.glob(f"{hash_prefix}-*.{ext}")):
+                    rows.append(
+                        (
+                            dataset_key,
+                            year,
+                            cache_format,
+                            str(filepath),
+                            sls_cache.read_cache_columns(filepath, cache_format),
+                        )
+                    )
+
+    return pd.DataFrame(
+        rows, columns=["dataset_key", "year", "location", "filepath", "columns"]
+    )
@@ -10,6 +10,8 @@ DEFAULT_INDEX_COLUMN = "RELI"
 DEFAULT_X_COLUMN = "E_COORD"
 DEFAULT_Y_COLUMN = "N_COORD"
 DEFAULT_SEP = ";"
+# number of rows of each chunk when filtering while reading
+DEFAULT_CHUNKSIZE = 500000
 
 # utils
 ## datasets
@@ -19,6 +21,23 @@ _sls_known_hash = "059307949698805030c3cc1f9e99fe4db73406bc21b848faf823e90e0ba68
 _statpop_known_hash = "80d9bccece07467e03872ceb642c6adfcc0472232d549fb1b37f988c1a919678"
 _bds_known_hash = "ade605c6b843b2fce12b99d67fdb0594f2508498c6009c949dffa108ea74a533"
 _statent_known_hash = "969b439be04b2699da6bcf1dd1f47b3f386352259e9f12f83c787b4c56d2c962"
+# compact data types, used with `dtypes="compact"`
+_sls_dtypes = {"RELI": "int32", "E_COORD": "int32", "N_COORD": "int32"}
+for _period in ["85", "97", "09", "18", "25"]:
+    for _column, _dtype in [
+        ("FJ{}", "uint16"),
+        ("LC{}_27", "uint8"),
+        ("LC{}_6", "uint8"),
+        ("LU{}_46", "uint16"),
+        ("LU{}_10", "uint16"),
+        ("LU{}_4", "uint8"),
+    ]:
+        # the 2020/25 survey is still ongoing so its columns may have missing values,
+        # hence we use nullable dtypes
+        if _period == "25":
+            _dtype = _dtype.replace("uint", "UInt")
+        _sls_dtypes[_column.format(_period)] = _dtype
+_koord_dtypes = {"RELI": "int32", "E_KOORD": "int32", "N_KOORD": "int32"}
 DATASET_DICT = {
     "sls": {
         "latest": "2024",
@@ -63,6 +82,7 @@ DATASET_DICT = {
                     "LU25_4",
                 ]
             },
+            "dtypes": _sls_dtypes,
         },
     },
     "statpop": {
@@ -74,6 +94,7 @@ DATASET_DICT = {
             "members": "ag-b-00.03-vz2023statpop/STATPOP2023.csv",
             "which_member": 0,
             "read_csv_kwargs": {"x_column": "E_KOORD", "y_column": "N_KOORD"},
+            "dtypes": _koord_dtypes,
         },
     },
     "bds": {
@@ -89,6 +110,7 @@ DATASET_DICT = {
                 "y_column": "N_KOORD",
                 "sep": ",",
             },
+            "dtypes": _koord_dtypes,
         },
     },
     "statent": {
@@ -104,9 +126,14 @@ DATASET_DICT = {
                 "y_column": "N_KOORD",
                 "sep": ",",
             },
+            "dtypes": _koord_dtypes,
         },
     },
 }
+# local mirror of the dataset files, either a directory or a base URL (e.g., of an
+# internal object store), where the files are named as in the pooch cache. See
+# `registry.retrieve`
+DATASET_MIRROR = None
 
 ## logging
 LOG_CONSOLE = False
@@ -0,0 +1,185 @@
+"""Transition (change) matrices between survey periods."""
+
+import itertools
+
+import numpy as np
+import pandas as pd
+
+from . import zonal as sls_zonal
+
+__all__ = ["transition_matrix", "transition_matrices"]
+
+_transition_matrix_doc = """
+Compute the transition matrix between two data columns
+
+The matrix is computed with a single `np.bincount` over the combined integer codes of
+the (zone,) from and to classes, which is much faster than `pd.crosstab`.
+
+Parameters
+----------%s
+from_column, to_column : str
+    names of the data columns of the earlier and later periods respectively, e.g.,
+    "LU09_4" and "LU18_4".
+weights : str or array-like, optional
+    name of a data column, or values aligned with the rows of the LandDataFrame, with
+    the weight of each pixel (e.g., its population). If not provided, the pixels are
+    counted. Missing weights count as 0.
+by : geopandas GeoSeries or GeoDataFrame, str or array-like, optional
+    the zones, so that a matrix is computed for each zone, either as geometries or as
+    the name of a data column (or values aligned with the rows of the LandDataFrame),
+    see `zonal_stats`. Pixels outside all zones (or with a missing zone) are ignored.
+geometry_crs : dict, optional
+    the starting coordinate reference system of the geometries of `by`, only used if
+    they have no crs set. If not given, it will take the default crs from the settings.
+method : {"raster", "sjoin"}, default "raster"
+    how the geometries of `by` are assigned to the pixels, see `label_by_geometries`.
+
+Returns
+-------
+result : pd.DataFrame
+    the transition matrix, whose index and columns are the classes of the earlier and
+    later periods respectively (the union of the classes of both columns). If `by` is
+    provided, the index is a (zone, class) MultiIndex. Pixels with missing values in
+    either column are ignored.
+"""
+
+_transition_matrices_doc = """
+Compute the transition matrices between pairs of data columns
+
+Parameters
+----------%s
+columns : list-like of str
+    names of the data columns, sorted by period, e.g., ["LU85_4", "LU97_4", "LU09_4",
+    "LU18_4"].
+pairs : {"all", "consecutive"}, default "all"
+    whether to compute the matrices between all the (earlier, later) pairs of columns
+    or only between consecutive columns.
+weights, by, geometry_crs, method : optional
+    see `transition_matrix`.
+
+Returns
+-------
+result : dict
+    mapping of the (from column, to column) pairs to their transition matrix (see
+    `transition_matrix`), whose classes are the union of the classes of all the
+    columns.
+"""
+
+
+def _get_values(ldf, values):
+    # values of a column (if a column name is provided) or of an array-like
+    if isinstance(values, str):
+        values = ldf[values]
+    return values
+
+
+def _get_weights(ldf, weights):
+    # float weights, where the missing values (e.g., of nullable integer columns) are 0
+    return pd.Series(_get_values(ldf, weights)).to_numpy(dtype=float, na_value=0)
+
+
+def _get_zones(ldf, by, geometry_crs, method):
+    # integer zone codes (-1 outside all zones), zone labels and number of zones, where
+    # the zones are processed as in `zonal_stats`
+    if by is None:
+        return None, None, 1
+    zone_codes, zones = sls_zonal._get_zone_codes(ldf, by, geometry_crs, method)
+    return np.asarray(zone_codes, dtype=np.int64), zones, len(zones)
+
+
+def _get_classes(ldf, columns):
+    # sorted union of the (non-missing) values of the columns
+    classes = pd.Index([], dtype=ldf[columns[0]].dtype)
+    for column in columns:
+        classes = classes.union(pd.Index(ldf[column].dropna().unique()))
+    return classes.sort_values()
+
+
+def _transition_matrix(
+    ldf, from_column, to_column, classes, weights, zone_codes, num_zones
+):
+    # transition matrix given the classes and (already processed) weights and zone codes
+    num_classes = len(classes)
+    from_codes = classes.get_indexer(ldf[from_column])
+    to_codes = classes.get_indexer(ldf[to_column])
+    valid = (from_codes >= 0) & (to_codes >= 0)
+    if zone_codes is not None:
+        valid &= zone_codes >= 0
+        codes = (zone_codes[valid] * num_classes + from_codes[valid]) * num_classes
+    else:
+        codes = from_codes[valid] * num_classes
+    codes += to_codes[valid]
+    if weights is not None:
+        weights = weights[valid]
+    return np.bincount(
+        codes, weights=weights, minlength=num_zones * num_classes**2
+    ).reshape(num_zones * num_classes, num_classes)
+
+
+def _to_frame(matrix, classes, zones):
+    # transition matrix as a data frame
+    index = classes
+    if zones is not None:
+        index = pd.MultiIndex.from_product([zones, classes])
+    return pd.DataFrame(matrix, index=index, columns=classes)
+
+
+def transition_matrix(  # noqa: D103
+    ldf,
+    from_column,
+    to_column,
+    *,
+    weights=None,
+    by=None,
+    geometry_crs=None,
+    method="raster",
+):
+    classes = _get_classes(ldf, [from_column, to_column])
+    if weights is not None:
+        weights = _get_weights(ldf, weights)
+    zone_codes, zones, num_zones = _get_zones(ldf, by, geometry_crs, method)
+    matrix = _transition_matrix(
+        ldf, from_column, to_column, classes, weights, zone_codes, num_zones
+    )
+    return _to_frame(matrix, classes, zones)
+
+
+transition_matrix.__doc__ = _transition_matrix_doc % "\nldf : LandDataFrame"
+
+
+def transition_matrices(  # noqa: D103
+    ldf,
+    columns,
+    *,
+    pairs="all",
+    weights=None,
+    by=None,
+    geometry_crs=None,
+    method="raster",
+):
+    if pairs == "all":
+        column_pairs = itertools.combinations(columns, 2)
+    elif pairs == "consecutive":
+        column_pairs = zip(columns[:-1], columns[1:])
+    else:
+        raise ValueError(
+            f"Unknown pairs {pairs!r}. Must be either 'all' or 'consecutive'."
+        )
+    # the classes, weights and zone codes are shared by all the pairs
+    classes = _get_classes(ldf, columns)
+    if weights is not None:
+        weights = _get_weights(ldf, weights)
+    zone_codes, zones, num_zones = _get_zones(ldf, by, geometry_crs, method)
+    return {
+        (from_column, to_column): _to_frame(
+            _transition_matrix(
+                ldf, from_column, to_column, classes, weights, zone_codes, num_zones
+            ),
+            classes,
+            zones,
+        )
+        for from_column, to_column in column_pairs
+    }
+
+
+transition_matrices.__doc__ = _transition_matrices_doc % "\nldf : LandDataFrame"
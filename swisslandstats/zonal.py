@@ -0,0 +1,106 @@
+"""Zonal statistics."""
+
+import numpy as np
+import pandas as pd
+
+from . import geometry as sls_geometry
+
+__all__ = ["zonal_stats"]
+
+ZONAL_STATS = ["count", "share", "area"]
+
+_zonal_stats_doc = """
+Compute per-zone class statistics of data columns
+
+Each pixel is assigned to a zone once, and the statistics of all the zones and classes
+of each column are then computed with a single grouped `np.bincount`.
+
+Parameters
+----------%s
+zones : geopandas GeoSeries or GeoDataFrame, str or array-like
+    either the geometries (zones), whose index is used as zone labels and which are
+    assigned to the pixels as in `label_by_geometries`, or the name of a data column
+    (or values aligned with the rows of the LandDataFrame) with the zone of each
+    pixel. Pixels outside all zones (or with a missing zone) are ignored.
+columns : str or list-like of str
+    names of the data columns whose classes are counted.
+stats : list-like of {"count", "share", "area"}, default ["count", "share", "area"]
+    the statistics of each class: the number of pixels ("count"), their proportion
+    among the pixels of the zone with data in the column ("share") and their area
+    ("area", in squared units of the CRS, i.e., square meters for the Swiss CRS).
+geometry_crs : dict, optional
+    the starting coordinate reference system of the passed-in geometries, only used if
+    they have no crs set. If not given, it will take the default crs from the settings.
+method : {"raster", "sjoin"}, default "raster"
+    how the geometries are assigned to the pixels, see `label_by_geometries`.
+
+Returns
+-------
+result : pd.DataFrame
+    tidy data frame with a row for each zone, column and class present in the zone,
+    with the "zone", "column" and "class" columns followed by the statistics.
+"""
+
+
+def _get_zone_codes(ldf, zones, geometry_crs, method):
+    # integer zone codes (-1 outside all zones) and zone labels
+    if isinstance(zones, str):
+        zones = ldf[zones]
+    if sls_geometry.gpd is not None and isinstance(
+        zones, (sls_geometry.gpd.GeoSeries, sls_geometry.gpd.GeoDataFrame)
+    ):
+        zone_codes = sls_geometry._get_geometry_codes(
+            ldf, zones, geometry_crs=geometry_crs, method=method
+        )
+        return zone_codes, zones.index
+    return pd.factorize(zones, sort=True)
+
+
+def zonal_stats(  # noqa: D103
+    ldf, zones, columns, stats=None, *, geometry_crs=None, method="raster"
+):
+    if stats is None:
+        stats = ZONAL_STATS
+    unknown_stats = set(stats).difference(ZONAL_STATS)
+    if unknown_stats:
+        raise ValueError(f"Unknown stats {unknown_stats}. Must be in {ZONAL_STATS}.")
+    if isinstance(columns, str):
+        columns = [columns]
+
+    zone_codes, zone_labels = _get_zone_codes(ldf, zones, geometry_crs, method)
+    in_zone = zone_codes >= 0
+    num_zones = len(zone_labels)
+    pixel_area = abs(ldf.res[0] * ldf.res[1])
+
+    dfs = []
+    for column in columns:
+        ser = ldf[column]
+        classes = pd.Index(ser.dropna().unique()).sort_values()
+        num_classes = len(classes)
+        class_codes = classes.get_indexer(ser)
+        valid = in_zone & (class_codes >= 0)
+        counts = np.bincount(
+            zone_codes[valid].astype(np.int64) * num_classes + class_codes[valid],
+            minlength=num_zones * num_classes,
+        ).reshape(num_zones, num_classes)
+        zone_idx, class_idx = np.nonzero(counts)
+        count = counts[zone_idx, class_idx]
+        df = pd.DataFrame(
+            {
+                "zone": zone_labels.take(zone_idx),
+                "column": column,
+                "class": classes.take(class_idx),
+            }
+        )
+        if "count" in stats:
+            df["count"] = count
+        if "share" in stats:
+            df["share"] = count / counts.sum(axis=1)[zone_idx]
+        if "area" in stats:
+            df["area"] = count * pixel_area
+        dfs.append(df)
+
+    return pd.concat(dfs, ignore_index=True)
+
+
+zonal_stats.__doc__ = _zonal_stats_doc % "\nldf : LandDataFrame"
@@ -1,19 +1,33 @@
 """swisslandstats tests."""
 
+import gc
+import itertools
 import logging as lg
+import os
+import pickle
+import shutil
 import tempfile
 import unittest
+import weakref
+from concurrent import futures
 from os import path
+from unittest import mock
 
+import dask.array as dask_array
 import geopandas as gpd
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
 import pooch
+import pyarrow as pa
 import pytest
+import rasterio as rio
 import responses
 import xarray as xr
+from affine import Affine
 from rasterio.crs import CRS
+from scipy import ndimage
+from shapely.geometry import box
 
 import swisslandstats as sls
 from swisslandstats import settings, utils
@@ -66,6 +80,47 @@ class TestSwissLandStats(unittest.TestCase):
             # test crs
             assert isinstance(ldf.crs, CRS)
 
+        # test reading the members straight out of the archive, selecting them either
+        # by position, name or predicate
+        if dataset_item["zip"]:
+            member_name = dataset_item["members"].split("/")[-1]
+            for stream_ldf in [
+                sls.load_dataset(dataset_key, unzip=False),
+                sls.load_dataset(dataset_key, unzip=False, engine="pyarrow"),
+                pd.concat(sls.load_dataset(dataset_key, unzip=False, chunksize=50)),
+            ] + [
+                sls.load_dataset(
+                    url=dataset_item["url"],
+                    retrieve_kwargs=retrieve_kwargs,
+                    which_member=_which_member,
+                    unzip=unzip,
+                    **dataset_item["read_csv_kwargs"],
+                )
+                for _which_member in [0, member_name, lambda name: name.endswith("csv")]
+                for unzip in [True, False]
+            ]:
+                pd.testing.assert_frame_equal(stream_ldf, ldf, check_frame_type=False)
+            with pytest.raises(ValueError):
+                sls.load_dataset(
+                    url=dataset_item["url"],
+                    retrieve_kwargs=retrieve_kwargs,
+                    which_member="inexistent.csv",
+                    unzip=False,
+                    **dataset_item["read_csv_kwargs"],
+                )
+        else:
+            # `unzip=False` has no effect on the files that are not zipped
+            for stream_ldf in [
+                sls.load_dataset(dataset_key, unzip=False),
+                sls.load_dataset(
+                    url=dataset_item["url"],
+                    retrieve_kwargs=retrieve_kwargs,
+                    unzip=False,
+                    **dataset_item["read_csv_kwargs"],
+                ),
+            ]:
+                pd.testing.assert_frame_equal(stream_ldf, ldf, check_frame_type=False)
+
         # try that setting an inexistent column as index should not raise a KeyError
         # because it is caught, but it can raise a ValueError if the dataset has
         # a non-empty default "columns" arg
@@ -92,6 +147,27 @@ class TestSwissLandStats(unittest.TestCase):
             <= ldf.shape[1]
         )
 
+        # test that the compact data types reduce the memory usage without changing
+        # the values, both with the dataset data types and for custom URLs
+        for compact_ldf in [
+            sls.load_dataset(dataset_key, dtypes="compact"),
+            sls.load_dataset(
+                url=dataset_item["url"],
+                retrieve_kwargs=retrieve_kwargs,
+                which_member=which_member,
+                dtypes="compact",
+                **dataset_item["read_csv_kwargs"],
+            ),
+        ]:
+            assert compact_ldf.memory_usage().sum() < ldf.memory_usage().sum()
+            pd.testing.assert_frame_equal(
+                compact_ldf, ldf, check_dtype=False, check_index_type=False
+            )
+            for column in [ldf.x_column, ldf.y_column]:
+                assert compact_ldf[column].dtype == "int32"
+        with pytest.raises(ValueError):
+            sls.load_dataset(dataset_key, dtypes="smallest")
+
         # now test geometry
         # geopandas exports
         gser = ldf.get_geoseries()
@@ -147,13 +223,830 @@ class TestSwissLandStats(unittest.TestCase):
         for dataset_key in other_datasets:
             _ = self._test_dataset(dataset_key)
 
+        # test loading the other datasets concurrently, parsing them either in a
+        # process or a thread pool
+        dataset_keys = sorted(other_datasets)
+        for parser_pool in ["process", "thread"]:
+            ldf_dict = sls.load_datasets(dataset_keys, parser_pool=parser_pool)
+            assert list(ldf_dict) == dataset_keys
+            for dataset_key, _ldf in ldf_dict.items():
+                pd.testing.assert_frame_equal(_ldf, sls.load_dataset(dataset_key))
+                assert _ldf.crs == sls.load_dataset(dataset_key).crs
+        # the parsing processes are not forked from the process that runs the
+        # download threads
+        with mock.patch.object(
+            futures, "ProcessPoolExecutor", wraps=futures.ProcessPoolExecutor
+        ) as process_pool_executor:
+            sls.load_datasets(dataset_keys[:1])
+        mp_context = process_pool_executor.call_args.kwargs["mp_context"]
+        assert mp_context.get_start_method() in ["forkserver", "spawn"]
+        merged_ldf = sls.load_datasets(dataset_keys, merge=True, max_workers=1)
+        assert isinstance(merged_ldf, sls.LandDataFrame)
+        assert merged_ldf.index.equals(
+            pd.Index(
+                sorted(set().union(*(_ldf.index for _ldf in ldf_dict.values()))),
+                name=settings.DEFAULT_INDEX_COLUMN,
+            )
+        )
+        with pytest.raises(ValueError):
+            sls.load_datasets(dataset_keys, parser_pool="greenlet")
+
+        # test that the verified files are not rehashed on later loads
+        with (
+            mock.patch.object(pooch, "file_hash", wraps=pooch.file_hash) as file_hash,
+            mock.patch.object(
+                pooch.hashes, "file_hash", wraps=pooch.hashes.file_hash
+            ) as hashes_file_hash,
+        ):
+            for dataset_key in dataset_keys:
+                sls.load_dataset(dataset_key)
+            file_hash.reset_mock()
+            hashes_file_hash.reset_mock()
+            for dataset_key in dataset_keys:
+                sls.load_dataset(dataset_key)
+            assert file_hash.call_count == 0
+            assert hashes_file_hash.call_count == 0
+
+        # test loading the datasets from a local mirror (without downloading them) and
+        # from a mirror URL
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            mirror_dir = path.join(tmp_dir, "mirror")
+            os.mkdir(mirror_dir)
+            for dataset_key in dataset_keys:
+                dataset_item = self.dataset_dict[dataset_key][
+                    self.dataset_dict[dataset_key]["latest"]
+                ]
+                # the files are named as in the pooch cache, where they were downloaded
+                fname = sls.registry._get_fname(dataset_item["url"])
+                shutil.copy(path.join(pooch.os_cache("pooch"), fname), mirror_dir)
+                with open(
+                    path.join(
+                        MOCK_DATASET_DIR, f"{dataset_key}.{MOCK_EXT_DICT[dataset_key]}"
+                    ),
+                    "rb",
+                ) as src:
+                    responses.add(
+                        responses.GET,
+                        f"https://mirror.example.org/datasets/{fname}",
+                        body=src.read(),
+                        status=200,
+                    )
+            num_calls = len(responses.calls)
+            for mirror, unzip in [(mirror_dir, False), (mirror_dir, True)]:
+                settings.DATASET_MIRROR = mirror
+                try:
+                    for dataset_key in dataset_keys:
+                        pd.testing.assert_frame_equal(
+                            sls.load_dataset(dataset_key, unzip=unzip),
+                            ldf_dict[dataset_key],
+                        )
+                finally:
+                    settings.DATASET_MIRROR = None
+            # the mirrored files are placed in the pooch cache, where the processor
+            # runs, so that nothing is written to the mirror
+            mirror_listing = sorted(os.listdir(mirror_dir))
+            local_path = path.join(tmp_dir, "local")
+            for dataset_key in dataset_keys:
+                dataset_item = self.dataset_dict[dataset_key][
+                    self.dataset_dict[dataset_key]["latest"]
+                ]
+                filepath = sls.registry.retrieve(
+                    dataset_item["url"],
+                    dataset_item["known_hash"],
+                    path=local_path,
+                    processor=pooch.Unzip() if dataset_item["zip"] else None,
+                    mirror=mirror_dir,
+                )
+                if dataset_item["zip"]:
+                    filepath = filepath[dataset_item["which_member"]]
+                assert path.commonpath([filepath, local_path]) == local_path
+                pd.testing.assert_frame_equal(
+                    sls.read_csv(filepath, **dataset_item["read_csv_kwargs"]),
+                    ldf_dict[dataset_key],
+                )
+            assert sorted(os.listdir(mirror_dir)) == mirror_listing
+            assert len(responses.calls) == num_calls
+            mirror_path = path.join(tmp_dir, "pooch")
+            for dataset_key in dataset_keys:
+                dataset_item = self.dataset_dict[dataset_key][
+                    self.dataset_dict[dataset_key]["latest"]
+                ]
+                filepath = sls.registry.retrieve(
+                    dataset_item["url"],
+                    dataset_item["known_hash"],
+                    path=mirror_path,
+                    processor=pooch.Unzip() if dataset_item["zip"] else None,
+                    mirror="https://mirror.example.org/datasets/",
+                )
+                if dataset_item["zip"]:
+                    filepath = filepath[dataset_item["which_member"]]
+                pd.testing.assert_frame_equal(
+                    sls.read_csv(filepath, **dataset_item["read_csv_kwargs"]),
+                    ldf_dict[dataset_key],
+                )
+            assert all(
+                call.request.url.startswith("https://mirror.example.org/datasets/")
+                for call in responses.calls[num_calls:]
+            )
+
+            # test listing the local files, including the parsed-data cache
+            sls.load_dataset("sls", cache="parquet", cache_dir=tmp_dir)
+            list_df = sls.list_datasets(cache_dir=tmp_dir, mirror=mirror_dir)
+            assert set(list_df["dataset_key"]) == set(dataset_keys)
+            for location in ["mirror", "download", "parquet"]:
+                assert location in set(list_df["location"])
+            parquet_row = list_df[list_df["location"] == "parquet"].iloc[0]
+            assert parquet_row["dataset_key"] == "sls"
+            assert set(parquet_row["columns"]) == set(ldf_dict["sls"].columns)
+
+            # test that a corrupted mirror file is detected
+            fname = sls.registry._get_fname(
+                self.dataset_dict["sls"][self.dataset_dict["sls"]["latest"]]["url"]
+            )
+            with open(path.join(mirror_dir, fname), "ab") as dst:
+                dst.write(b"\n")
+            settings.DATASET_MIRROR = mirror_dir
+            try:
+                with pytest.raises(ValueError):
+                    sls.load_dataset("sls")
+            finally:
+                settings.DATASET_MIRROR = None
+
         # now test basic features and pandas-like transformations with the SLS dataset
         # only test it with SLS because of the specific land use columns
         ldf = sls.load_dataset(dataset_key="sls")
+
+        # test the compact data types of the SLS dataset
+        compact_ldf = sls.load_dataset("sls", dtypes="compact")
+        assert compact_ldf["LU09_4"].dtype == "uint8"
+        assert compact_ldf["LU09_46"].dtype == "uint16"
+        assert np.all(
+            compact_ldf.to_xarray(["LU09_4", "LU25_4"])
+            == ldf.to_xarray(["LU09_4", "LU25_4"])
+        )
+
+        # test that the pyarrow and polars engines parse the same land data frame as
+        # the default one (although in the order of the requested columns)
+        for engine in ["pyarrow", "polars"]:
+            for kwargs in [
+                {},
+                {"dtypes": "compact"},
+                {"columns": ["LU18_4", "LU09_4"]},
+            ]:
+                engine_ldf = sls.load_dataset("sls", engine=engine, **kwargs)
+                c_ldf = sls.load_dataset("sls", **kwargs)
+                assert engine_ldf.columns.sort_values().equals(
+                    c_ldf.columns.sort_values()
+                )
+                pd.testing.assert_frame_equal(engine_ldf[c_ldf.columns], c_ldf)
+                assert engine_ldf.crs == c_ldf.crs
+            with pytest.raises(ValueError):
+                sls.load_dataset("sls", engine=engine, chunksize=10)
+        # the other engines are passed to pandas, also from `read_csv_kwargs`
+        pd.testing.assert_frame_equal(sls.load_dataset("sls", engine="python"), ldf)
+        pd.testing.assert_frame_equal(
+            sls.load_dataset("sls", read_csv_kwargs={"engine": "python"}), ldf
+        )
+        assert len(list(sls.load_dataset("sls", engine="python", chunksize=10))) == (
+            int(np.ceil(len(ldf) / 10))
+        )
+        with pytest.raises(ValueError):
+            sls.load_dataset("sls", engine="greenlet")
+        # polars infers the data types from all the rows, so that the columns whose
+        # first rows are empty are not parsed as strings
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            csv_filepath = path.join(tmp_dir, "sparse.csv")
+            x = 2600000 + 100 * np.arange(300)
+            y = np.full(300, 1200000)
+            pd.DataFrame(
+                {
+                    "RELI": sls.xy_to_reli(x, y),
+                    "E_COORD": x,
+                    "N_COORD": y,
+                    "LU25_4": pd.array([None] * 250 + [1] * 50, dtype="Int64"),
+                }
+            ).to_csv(csv_filepath, sep=";", index=False)
+            for kwargs in [{}, {"dtypes": {"LU25_4": "UInt8"}}]:
+                pd.testing.assert_frame_equal(
+                    sls.read_csv(csv_filepath, engine="polars", **kwargs),
+                    sls.read_csv(csv_filepath, **kwargs),
+                )
+
+        # test reading in chunks
+        chunks = list(sls.load_dataset("sls", chunksize=10))
+        assert len(chunks) == int(np.ceil(len(ldf) / 10))
+        for chunk in chunks:
+            assert isinstance(chunk, sls.LandDataFrame)
+            assert chunk.crs == ldf.crs
+            assert chunk.res == ldf.res
+            assert chunk.index.name == ldf.index.name
+        pd.testing.assert_frame_equal(pd.concat(chunks), ldf)
+        # test that rasterizing the chunks is equivalent to rasterizing the full data
+        # frame
+        columns = ["LU09_4", "LU18_4"]
+        assert np.all(
+            sls.rasterize_chunks(
+                iter(chunks),
+                columns,
+                transform=ldf.get_transform(),
+                shape=ldf.get_grid_index().shape,
+            )
+            == ldf.to_xarray(columns).values
+        )
+        # test that the pixels outside the target grid are ignored
+        assert sls.rasterize_chunks(
+            iter(chunks), "LU09_4", transform=ldf.get_transform(), shape=(2, 2)
+        ).shape == (2, 2)
+        # test aggregating the chunks
+        pd.testing.assert_series_equal(
+            sls.aggregate_chunks(iter(chunks), columns), ldf[columns].sum()
+        )
+        for func in ["count", "min", "max", "mean"]:
+            pd.testing.assert_frame_equal(
+                sls.aggregate_chunks(
+                    iter(chunks), ["LU18_4", "LC18_6"], by="LU09_4", func=func
+                ),
+                ldf.groupby("LU09_4")[["LU18_4", "LC18_6"]].agg(func),
+                check_frame_type=False,
+            )
+        with pytest.raises(ValueError):
+            sls.aggregate_chunks(iter(chunks), columns, func="median")
+        with pytest.raises(ValueError):
+            sls.aggregate_chunks(iter([]), columns)
+        # test that the compact chunks all have the same data types, i.e., the ones of
+        # the dataset (if any) rather than the ones of the values of each chunk
+        for chunk in sls.load_dataset("sls", chunksize=10, dtypes="compact"):
+            pd.testing.assert_series_equal(chunk.dtypes, compact_ldf.dtypes)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            csv_filepath = path.join(tmp_dir, "chunks.csv")
+            pd.DataFrame(ldf).reset_index().iloc[:20].assign(
+                LU09_46=[1] * 10 + [1000] * 10
+            ).to_csv(csv_filepath, sep=";", index=False)
+            compact_chunks = list(
+                sls.read_csv(csv_filepath, chunksize=10, dtypes="compact")
+            )
+        pd.testing.assert_series_equal(
+            compact_chunks[0].dtypes, compact_chunks[1].dtypes
+        )
+
+        # test filtering by bounding box and geometry while reading
+        x_min, y_min = ldf[[ldf.x_column, ldf.y_column]].min()
+        bbox = (x_min, y_min, x_min + 500, y_min + 1000)
+        bbox_ldf = sls.load_dataset("sls", bbox=bbox)
+        assert isinstance(bbox_ldf, sls.LandDataFrame)
+        assert bbox_ldf.crs == ldf.crs
+        assert 0 < len(bbox_ldf) < len(ldf)
+        assert bbox_ldf[ldf.x_column].max() <= bbox[2]
+        assert bbox_ldf[ldf.y_column].max() <= bbox[3]
+        # shift the geometry by half a pixel so that no pixel lies on its boundary
+        geometry = box(*(np.array(bbox) + 50)).union(
+            box(x_min + 550, y_min + 550, x_min + 750, y_min + 750)
+        )
+        for geometry_ldf in [
+            sls.load_dataset("sls", geometry=geometry),
+            pd.concat(sls.load_dataset("sls", geometry=geometry, chunksize=10)),
+        ]:
+            assert geometry_ldf.index.equals(
+                ldf.clip_by_geometry(geometry).index.sort_values()
+            )
+        assert len(sls.load_dataset("sls", bbox=bbox, geometry=geometry)) < len(
+            geometry_ldf
+        )
+        # test that an empty land data frame is returned when no pixel is kept or the
+        # file has no rows
+        for empty_ldf in [
+            sls.load_dataset("sls", bbox=(0, 0, 1, 1)),
+            sls.read_csv(
+                path.join(MOCK_DATASET_DIR, "sls.csv"),
+                columns=["LU09_4"],
+                bbox=bbox,
+                read_csv_kwargs={"nrows": 0},
+            ),
+        ]:
+            assert isinstance(empty_ldf, sls.LandDataFrame)
+            assert len(empty_ldf) == 0
+            assert "LU09_4" in empty_ldf.columns
+            # the empty land data frame does not span any grid
+            with pytest.raises(ValueError, match="empty"):
+                empty_ldf.to_ndarray("LU09_4")
+        # test that filtering by geometry only requires geopandas to reproject it
+        with mock.patch.object(sls.geometry, "gpd", None):
+            pd.testing.assert_frame_equal(
+                sls.load_dataset("sls", geometry=geometry), geometry_ldf
+            )
+            with pytest.raises(ImportError):
+                sls.load_dataset("sls", geometry=geometry, geometry_crs="EPSG:4326")
+
+        # test that the raster and spatial join clipping methods select the same
+        # pixels, also when the geometry lies partially or completely outside the grid
+        for _geometry in [
+            geometry,
+            geometry.buffer(230),
+            box(x_min - 1000, y_min - 1000, x_min + 350, y_min + 550),
+            box(x_min - 1000, y_min - 1000, x_min - 500, y_min - 500),
+        ]:
+            raster_ldf = ldf.clip_by_geometry(_geometry)
+            assert isinstance(raster_ldf, sls.LandDataFrame)
+            assert raster_ldf.index.sort_values().equals(
+                ldf.clip_by_geometry(_geometry, method="sjoin").index.sort_values()
+            )
+        # clipping an empty land data frame returns an empty land data frame
+        for method in ["raster", "sjoin"]:
+            assert len(ldf.iloc[:0].clip_by_geometry(geometry, method=method)) == 0
+        with pytest.raises(ValueError):
+            ldf.clip_by_geometry(geometry, method="mask")
+
+        # test labelling and clipping by many geometries in a single pass, which must
+        # match clipping by each geometry separately
+        zones = gpd.GeoDataFrame(
+            {"zone": ["a", "b", "c", "d"]},
+            geometry=[
+                box(
+                    x_min - 50 + i * 300, y_min - 50, x_min + 250 + i * 300, y_min + 950
+                )
+                for i in range(4)
+            ],
+            crs=ldf.crs,
+        ).set_index("zone")
+        for method in ["raster", "sjoin"]:
+            labels = ldf.label_by_geometries(zones, method=method)
+            assert labels.index.equals(ldf.index)
+            assert labels.isna().any()
+            zone_ldfs = ldf.clip_by_geometries(zones, method=method)
+            assert list(zone_ldfs) == list(zones.index)
+            for zone, zone_geometry in zones.geometry.items():
+                zone_ldf = zone_ldfs[zone]
+                assert isinstance(zone_ldf, sls.LandDataFrame)
+                assert zone_ldf.crs == ldf.crs
+                assert zone_ldf.index.equals(labels[labels == zone].index)
+                assert zone_ldf.index.sort_values().equals(
+                    ldf.clip_by_geometry(zone_geometry).index.sort_values()
+                )
+        # test that the geometries are projected to the crs of the land data frame
+        assert ldf.label_by_geometries(zones.to_crs("epsg:4326")).equals(labels)
+
+        # test zonal statistics against grouped value counts, with the zones given
+        # either as geometries or as the zone of each pixel
+        columns = ["LU09_4", "LU18_46"]
+        stats_df = ldf.zonal_stats(zones, columns)
+        assert stats_df.columns.equals(
+            pd.Index(["zone", "column", "class", "count", "share", "area"])
+        )
+        for _zones in [labels, labels.astype(str).where(labels.notna())]:
+            pd.testing.assert_frame_equal(
+                ldf.zonal_stats(_zones, columns).astype({"zone": str}),
+                stats_df,
+                check_dtype=False,
+            )
+        for column in columns:
+            column_df = stats_df[stats_df["column"] == column].set_index(
+                ["zone", "class"]
+            )
+            value_counts = ldf.groupby(labels, observed=True)[column].value_counts()
+            assert np.array_equal(column_df["count"], value_counts.sort_index())
+            assert np.allclose(column_df.groupby("zone")["share"].sum(), 1)
+        assert np.array_equal(
+            stats_df["area"], stats_df["count"] * ldf.res[0] * ldf.res[1]
+        )
+        assert ldf.zonal_stats(zones, "LU09_4", ["share"]).columns.equals(
+            pd.Index(["zone", "column", "class", "share"])
+        )
+        with pytest.raises(ValueError):
+            ldf.zonal_stats(zones, columns, ["median"])
+
+        # test the landscape metrics against labelling the patches of each clipped zone
+        for neighborhood, structure in [(4, None), (8, np.ones((3, 3)))]:
+            metrics_df = ldf.landscape_metrics(
+                columns, zones=zones, neighborhood=neighborhood
+            )
+            assert metrics_df[["zone", "column", "class"]].equals(
+                stats_df[["zone", "column", "class"]]
+            )
+            assert np.array_equal(metrics_df["class_area"], stats_df["area"])
+            for (zone, column), group_df in metrics_df.groupby(
+                ["zone", "column"], sort=False
+            ):
+                arr = zone_ldfs[zone].to_ndarray(column, dtype="int32")
+                num_patches, largest_patch_sizes = [], []
+                for _class in group_df["class"]:
+                    patch_labels, _num_patches = ndimage.label(
+                        arr == _class, structure=structure
+                    )
+                    num_patches.append(_num_patches)
+                    largest_patch_sizes.append(
+                        np.bincount(patch_labels.ravel())[1:].max()
+                    )
+                assert np.array_equal(group_df["number_of_patches"], num_patches)
+                assert np.allclose(
+                    group_df["largest_patch_index"],
+                    np.array(largest_patch_sizes) / np.sum(arr != 0) * 100,
+                )
+        # the total edge length of a landscape is twice the length of the edges
+        # between pixels of different classes (each edge is shared by two classes)
+        metrics_df = ldf.landscape_metrics("LU09_4", metrics=["edge_density"])
+        assert metrics_df.columns.equals(pd.Index(["column", "class", "edge_density"]))
+        arr = ldf.to_ndarray("LU09_4", dtype="int32")
+        edge_length = sum(
+            np.sum((from_arr != to_arr) & (from_arr != 0) & (to_arr != 0)) * res
+            for from_arr, to_arr, res in [
+                (arr[:, :-1], arr[:, 1:], ldf.res[1]),
+                (arr[:-1], arr[1:], ldf.res[0]),
+            ]
+        )
+        assert np.isclose(
+            metrics_df["edge_density"].sum(),
+            2 * edge_length / (len(ldf) * ldf.res[0] * ldf.res[1]) * 10000,
+        )
+        with pytest.raises(ValueError):
+            ldf.landscape_metrics(columns, metrics=["contagion"])
+        with pytest.raises(ValueError):
+            ldf.landscape_metrics(columns, neighborhood=6)
+        with mock.patch.object(sls.landscape, "sparse", None):
+            with pytest.raises(ImportError):
+                ldf.landscape_metrics(columns)
+
+        # test that the point geometries are cached, shared by the land data frames
+        # derived without changing the pixels (e.g., selecting or adding columns) and
+        # invalidated when the coordinates change
+        gser = ldf.get_geoseries()
+        assert ldf.get_geoseries().values[0] is gser.values[0]
+        assert ldf.to_geodataframe().geometry.values[0] is gser.values[0]
+        for _ldf in [ldf[[ldf.x_column, ldf.y_column, "LU09_4"]], ldf.assign(LU00=1)]:
+            assert _ldf.get_geoseries().values[0] is gser.values[0]
+        assert ldf.iloc[:2].get_geoseries().equals(gser.iloc[:2])
+        _ldf = ldf.copy()
+        _ldf[ldf.x_column] = _ldf[ldf.x_column] + 100
+        assert _ldf.get_geoseries().x.equals(gser.x + 100)
+        # test that the crs is taken from the current land data frame
+        _ldf.crs = CRS.from_epsg(21781)
+        assert _ldf.get_geoseries().crs == _ldf.crs
+
+        # test the parsed-data cache
+        with tempfile.TemporaryDirectory() as cache_dir:
+            for cache in ["parquet", "feather"]:
+                # the first call writes the cache and the second one reads it
+                for _ in range(2):
+                    cached_ldf = sls.load_dataset(
+                        "sls", cache=cache, cache_dir=cache_dir
+                    )
+                    assert isinstance(cached_ldf, sls.LandDataFrame)
+                    pd.testing.assert_frame_equal(cached_ldf, ldf)
+                    for attr in ["x_column", "y_column", "crs", "res"]:
+                        assert getattr(cached_ldf, attr) == getattr(ldf, attr)
+            # test that the columns of the memory-mapped feather cache are converted
+            # without copying them into memory allocated by pyarrow
+            del cached_ldf
+            gc.collect()
+            allocated_bytes = pa.total_allocated_bytes()
+            cached_ldf = sls.load_dataset("sls", cache="feather", cache_dir=cache_dir)
+            assert (
+                pa.total_allocated_bytes() - allocated_bytes
+                < cached_ldf.memory_usage().sum() / 2
+            )
+            assert len(os.listdir(cache_dir)) == 2
+            # test that the cache is keyed by the requested columns
+            columns = ["LU09_4"]
+            assert (
+                sls.load_dataset(
+                    "sls", columns=columns, cache="parquet", cache_dir=cache_dir
+                )
+                .columns.difference([ldf.x_column, ldf.y_column])
+                .equals(pd.Index(columns))
+            )
+            assert len(os.listdir(cache_dir)) == 3
+        with pytest.raises(ValueError):
+            sls.load_dataset("sls", cache="csv")
         # assert np.all(
         #     ldf.to_ndarray("LU09_4") == np.arange(4, dtype=np.uint8).reshape(2, 2)
         # )
         ldf.to_geotiff(tempfile.TemporaryFile(), "LU09_4")
+        # test the deprecated `column` argument
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tif_filepath = os.path.join(tmp_dir, "column.tif")
+            with pytest.warns(FutureWarning):
+                ldf.to_geotiff(tif_filepath, column="LU09_4")
+            with rio.open(tif_filepath) as src:
+                assert np.array_equal(src.read(1), ldf.to_ndarray("LU09_4"))
+        for kwargs in [{}, {"columns": "LU09_4", "column": "LU18_4"}]:
+            with pytest.raises(TypeError):
+                ldf.to_geotiff(tempfile.TemporaryFile(), **kwargs)
+        # test multi-band and cloud-optimized geotiff export
+        columns = ["LU09_4", "LU18_4"]
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            for cog, creation_options in [
+                (False, dict(tiled=True, blockxsize=16, blockysize=16)),
+                (True, dict(blocksize=16, predictor=2)),
+            ]:
+                tif_filepath = os.path.join(tmp_dir, f"cog-{cog}.tif")
+                ldf.to_geotiff(
+                    tif_filepath,
+                    columns,
+                    nodata=255,
+                    cog=cog,
+                    compress="deflate",
+                    num_threads="all_cpus",
+                    **creation_options,
+                )
+                with rio.open(tif_filepath) as src:
+                    self.assertEqual(src.count, len(columns))
+                    self.assertEqual(src.nodata, 255)
+                    self.assertEqual(src.descriptions, tuple(columns))
+                    self.assertEqual(src.block_shapes[0], (16, 16))
+                    self.assertEqual(src.compression.value, "DEFLATE")
+                    self.assertEqual(len(src.overviews(1)) > 0, cog)
+                    self.assertEqual(src.transform, ldf.get_transform())
+                    assert np.array_equal(
+                        src.read(), ldf.to_xarray(columns, nodata=255).values
+                    )
+        with tempfile.TemporaryFile() as tmp_file:
+            ldf.to_geotiff(tmp_file, "LU09_4", cog=True)
+            tmp_file.seek(0)
+            with rio.open(tmp_file) as src:
+                self.assertEqual(src.tags(ns="IMAGE_STRUCTURE")["LAYOUT"], "COG")
+        # test the inverse conversions from rasters
+        expected_ldf = ldf[[ldf.x_column, ldf.y_column] + columns].sort_index()
+        for from_ldf in [
+            sls.LandDataFrame.from_ndarray(
+                ldf.to_xarray(columns).values,
+                transform=ldf.get_transform(),
+                columns=columns,
+            ),
+            sls.LandDataFrame.from_xarray(ldf.to_xarray(columns)),
+            sls.LandDataFrame.from_xarray(ldf.to_dataset(columns)),
+        ]:
+            pd.testing.assert_frame_equal(
+                from_ldf.sort_index(),
+                expected_ldf,
+                check_dtype=False,
+                check_frame_type=False,
+            )
+            self.assertEqual(from_ldf.res, ldf.res)
+            self.assertEqual(from_ldf.crs, ldf.crs)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tif_filepath = os.path.join(tmp_dir, "ldf.tif")
+            ldf.to_geotiff(tif_filepath, columns)
+            for window_height in [None, 7]:
+                pd.testing.assert_frame_equal(
+                    sls.LandDataFrame.from_geotiff(
+                        tif_filepath, window_height=window_height
+                    ).sort_index(),
+                    expected_ldf,
+                    check_dtype=False,
+                    check_frame_type=False,
+                )
+            from_ldf = sls.LandDataFrame.from_geotiff(tif_filepath, bands=[2])
+            assert from_ldf.columns.equals(
+                pd.Index([ldf.x_column, ldf.y_column, columns[1]])
+            )
+        # pixels with no data are dropped unless `nodata` is None, and the RELI index
+        # is only set for hectare grids
+        arr = ldf.to_ndarray("LU09_4")
+        from_ldf = sls.LandDataFrame.from_ndarray(
+            arr, transform=ldf.get_transform(), nodata=None
+        )
+        self.assertEqual(len(from_ldf), arr.size)
+        assert from_ldf.columns.equals(pd.Index([ldf.x_column, ldf.y_column, "band_1"]))
+        from_ldf = sls.LandDataFrame.from_ndarray(
+            arr, transform=ldf.get_transform() * Affine.scale(2)
+        )
+        self.assertEqual(from_ldf.res, (200, 200))
+        self.assertEqual(len(from_ldf), len(ldf))
+        assert from_ldf.index.name is None
+        # test the RELI conversions
+        reli = sls.xy_to_reli(ldf[ldf.x_column], ldf[ldf.y_column])
+        assert np.array_equal(reli, ldf.index)
+        assert np.array_equal(
+            reli,
+            sls.xy_to_reli(ldf[ldf.x_column] - 2000000, ldf[ldf.y_column] - 1000000),
+        )
+        x, y = sls.reli_to_xy(ldf.index)
+        assert np.array_equal(x, ldf[ldf.x_column]) and np.array_equal(
+            y, ldf[ldf.y_column]
+        )
+        assert sls.reli_to_xy(48551097, lv95=False) == (485500, 109700)
+        # test the national hectare grid conversions
+        assert sls.xy_to_rowcol(2480000, 1299900) == (0, 0)
+        num_rows, num_cols = sls.GRID_SHAPE
+        assert sls.xy_to_rowcol(2839900, 1070000) == (num_rows - 1, num_cols - 1)
+        rows, cols = sls.xy_to_rowcol(ldf[ldf.x_column], ldf[ldf.y_column])
+        assert np.array_equal(
+            (rows, cols),
+            sls.xy_to_rowcol(ldf[ldf.x_column] + 50, ldf[ldf.y_column] + 50),
+        )
+        assert np.array_equal((rows, cols), sls.reli_to_rowcol(ldf.index))
+        assert np.array_equal(sls.rowcol_to_reli(rows, cols), ldf.index)
+        assert np.array_equal(
+            sls.rowcol_to_xy(rows, cols), (ldf[ldf.x_column], ldf[ldf.y_column])
+        )
+        assert sls.rowcol_to_xy(0, 0, lv95=False) == (480000, 299900)
+        grid_key = ldf.get_grid_key()
+        assert grid_key.dtype == np.int32
+        assert ldf.get_grid_key() is grid_key
+        assert np.array_equal(grid_key, rows * num_cols + cols)
+        assert np.array_equal(sls.grid_key_to_rowcol(grid_key), (rows, cols))
+        assert np.array_equal(
+            sls.xy_to_grid_key(ldf[ldf.x_column], ldf[ldf.y_column]), grid_key
+        )
+        with pytest.raises(ValueError):
+            sls.xy_to_grid_key(2470000, 1200000)
+        with pytest.raises(ValueError):
+            sls.LandDataFrame(
+                ldf, x_column=ldf.x_column, y_column=ldf.y_column, res=(200, 200)
+            ).get_grid_key()
+        # test focal operations against a brute-force moving window
+        arr = ldf.to_ndarray("LU09_4", nodata=np.nan, dtype="float64")
+        grid_index = ldf.get_grid_index()
+
+        def _brute_force(window, func, value=None):
+            half_rows, half_cols = window[0] // 2, window[1] // 2
+            result = []
+            for row, col in zip(grid_index.rows, grid_index.cols):
+                values = arr[
+                    max(row - half_rows, 0) : row + half_rows + 1,
+                    max(col - half_cols, 0) : col + half_cols + 1,
+                ]
+                values = values[~np.isnan(values)]
+                if value is not None:
+                    values = values == value
+                if func == "majority":
+                    classes, counts = np.unique(values, return_counts=True)
+                    result.append(classes[np.argmax(counts)])
+                else:
+                    result.append(getattr(np, func)(values))
+            return np.array(result)
+
+        for window, func, value in [
+            (1, "sum", None),
+            (3, "mean", None),
+            ((5, 3), "sum", None),
+            (3, "majority", None),
+            (5, "mean", 1),
+            (5, "sum", 1),
+        ]:
+            window_shape = window if isinstance(window, tuple) else (window, window)
+            expected = _brute_force(window_shape, func, value)
+            for block_rows in [2, 7, 512]:
+                result = ldf.focal(
+                    "LU09_4", window, func, value=value, block_rows=block_rows
+                )
+                assert result.index.equals(ldf.index)
+                assert np.allclose(result, expected)
+            if func != "mean":
+                assert pd.api.types.is_integer_dtype(result.dtype)
+        for window in [2, (3, 3, 3), 0]:
+            with pytest.raises(ValueError):
+                ldf.focal("LU09_4", window)
+        with pytest.raises(ValueError):
+            ldf.focal("LU09_4", 3, "median")
+        # the star import of the function does not shadow its module
+        assert callable(sls.focal)
+        assert sls.focal_stats.focal is sls.focal
+
+        # test the aggregation to the kilometric grid against a groupby of the
+        # coordinates rounded down to the kilometer
+        coarse_ldf = ldf.coarsen(
+            10, {"LU09_4": "mode", "FJ85": "sum", "LU18_4": "share", "LU85_4": "mean"}
+        )
+        assert isinstance(coarse_ldf, sls.LandDataFrame)
+        assert coarse_ldf.res == (1000, 1000)
+        assert coarse_ldf.crs == ldf.crs
+        grouped = ldf.groupby(
+            [ldf[ldf.x_column] // 1000 * 1000, ldf[ldf.y_column] // 1000 * 1000]
+        )
+        # the coarse pixels are identified by their centroid
+        assert np.array_equal(
+            coarse_ldf[[ldf.x_column, ldf.y_column]],
+            np.array(list(grouped.groups.keys())) + 450,
+        )
+        assert pd.api.types.is_integer_dtype(coarse_ldf[ldf.x_column].dtype)
+        # the coarse grid covers the original one and is aligned with it
+        bounds = rio.transform.array_bounds(
+            *ldf.get_grid_index().shape, ldf.get_transform()
+        )
+        coarse_bounds = rio.transform.array_bounds(
+            *coarse_ldf.get_grid_index().shape, coarse_ldf.get_transform()
+        )
+        assert coarse_bounds[0] == ldf[ldf.x_column].min() // 1000 * 1000 - 50
+        assert coarse_bounds[3] == ldf[ldf.y_column].max() // 1000 * 1000 + 950
+        assert len(coarse_bounds) == len(bounds) == 4
+        for coarse_bound, bound, sign in zip(coarse_bounds, bounds, [1, 1, -1, -1]):
+            assert 0 <= sign * (bound - coarse_bound) < 1000
+            assert (bound - coarse_bound) % 100 == 0
+        assert np.array_equal(coarse_ldf["FJ85"], grouped["FJ85"].sum())
+        assert np.allclose(coarse_ldf["LU85_4"], grouped["LU85_4"].mean())
+        assert np.array_equal(
+            coarse_ldf["LU09_4"],
+            grouped["LU09_4"].agg(lambda ser: ser.value_counts().sort_index().idxmax()),
+        )
+        shares = grouped["LU18_4"].value_counts(normalize=True).unstack(fill_value=0)
+        assert np.allclose(
+            coarse_ldf[[f"LU18_4_{_class}" for _class in shares.columns]], shares
+        )
+        assert coarse_ldf.to_ndarray("LU09_4").shape == (
+            np.ptp(coarse_ldf[ldf.y_column]) // 1000 + 1,
+            np.ptp(coarse_ldf[ldf.x_column]) // 1000 + 1,
+        )
+        # the sums of nullable integer columns keep an integer dtype
+        _ldf = ldf.assign(FJ85=ldf["FJ85"].astype("UInt32"))
+        _ldf.loc[_ldf.index[:3], "FJ85"] = pd.NA
+        coarse_sum = _ldf.coarsen(10, {"FJ85": "sum"})["FJ85"]
+        assert pd.api.types.is_integer_dtype(coarse_sum.dtype)
+        assert coarse_sum.sum() == _ldf["FJ85"].sum()
+        # a single function is applied to all the data columns
+        coarse_ldf = ldf.coarsen(2, "count")
+        assert coarse_ldf.columns.equals(ldf.columns)
+        assert np.all(
+            coarse_ldf.drop(columns=[ldf.x_column, ldf.y_column]).sum() == len(ldf)
+        )
+        for factor, agg in [(0, "sum"), (2.5, "sum"), (2, "median")]:
+            with pytest.raises(ValueError):
+                ldf.coarsen(factor, agg)
+
+        # test the transition matrices against crosstab
+        columns = ["LU85_4", "LU97_4", "LU09_4", "LU18_4"]
+        # include missing values (as in the ongoing survey)
+        _ldf = ldf.copy()
+        _ldf["LU18_4"] = _ldf["LU18_4"].astype("UInt8")
+        _ldf.loc[_ldf.index[:3], "LU18_4"] = pd.NA
+        for from_column, to_column in [("LU85_4", "LU18_4"), ("LU85_46", "LU09_46")]:
+            matrix = _ldf.transition_matrix(from_column, to_column)
+            assert matrix.index.equals(matrix.columns)
+            assert matrix.index.is_monotonic_increasing
+            crosstab = pd.crosstab(_ldf[from_column], _ldf[to_column])
+            pd.testing.assert_frame_equal(
+                matrix.loc[crosstab.index, crosstab.columns],
+                crosstab,
+                check_names=False,
+                check_dtype=False,
+                check_index_type=False,
+                check_column_type=False,
+            )
+            assert matrix.drop(crosstab.index).sum().sum() == 0
+        zones = np.where(_ldf[ldf.x_column] > _ldf[ldf.x_column].median(), "b", "a")
+        weights = _ldf["FJ85"]
+        matrix = _ldf.transition_matrix("LU85_4", "LU09_4", weights=weights, by=zones)
+        crosstab = pd.crosstab(
+            [zones, _ldf["LU85_4"]], _ldf["LU09_4"], values=weights, aggfunc="sum"
+        ).fillna(0)
+        pd.testing.assert_frame_equal(
+            matrix.loc[crosstab.index, crosstab.columns],
+            crosstab,
+            check_names=False,
+            check_index_type=False,
+            check_column_type=False,
+        )
+        # the zones can also be geometries, as in `zonal_stats`
+        x_split = _ldf[ldf.x_column].median() + 50
+        x_min, y_min = _ldf[[ldf.x_column, ldf.y_column]].min()
+        x_max, y_max = _ldf[[ldf.x_column, ldf.y_column]].max()
+        zone_geometries = gpd.GeoSeries(
+            [
+                box(x_min - 50, y_min - 50, x_split, y_max + 50),
+                box(x_split, y_min - 50, x_max + 50, y_max + 50),
+            ],
+            index=["a", "b"],
+            crs=ldf.crs,
+        )
+        for method in ["raster", "sjoin"]:
+            pd.testing.assert_frame_equal(
+                _ldf.transition_matrix(
+                    "LU85_4",
+                    "LU09_4",
+                    weights=weights,
+                    by=zone_geometries,
+                    method=method,
+                ),
+                matrix,
+            )
+        # missing weights count as 0
+        weights = _ldf["FJ85"].astype("UInt16")
+        weights.iloc[:3] = pd.NA
+        pd.testing.assert_frame_equal(
+            _ldf.transition_matrix("LU85_4", "LU09_4", weights=weights),
+            _ldf.transition_matrix("LU85_4", "LU09_4", weights=weights.fillna(0)),
+        )
+        matrices = _ldf.transition_matrices(columns, by=zones)
+        assert list(matrices) == list(itertools.combinations(columns, 2))
+        pd.testing.assert_frame_equal(
+            matrices[("LU85_4", "LU18_4")],
+            _ldf.transition_matrix("LU85_4", "LU18_4", by=zones),
+        )
+        assert list(_ldf.transition_matrices(columns, pairs="consecutive")) == list(
+            zip(columns[:-1], columns[1:])
+        )
+        with pytest.raises(ValueError):
+            _ldf.transition_matrices(columns, pairs="none")
+
+        # the RELI index is derived from the coordinates when there is no RELI column
+        derived_ldf = sls.LandDataFrame(
+            pd.DataFrame(ldf).reset_index(drop=True),
+            index_column=settings.DEFAULT_INDEX_COLUMN,
+            x_column=ldf.x_column,
+            y_column=ldf.y_column,
+            crs=ldf.crs,
+            res=ldf.res,
+        )
+        assert derived_ldf.index.equals(ldf.index)
 
         # test plots
         assert isinstance(
@@ -186,10 +1079,93 @@ class TestSwissLandStats(unittest.TestCase):
         # to test for the presence of nan: merged_ldf['LU85_4'].isna().any()
         assert np.sum(merged_ldf["LU00"].isna()) == 1
 
+        # test the multi-way merge, where the RELI is derived from the coordinates if
+        # it is not the index
+        xy_columns = [ldf.x_column, ldf.y_column]
+        ldfs = [
+            ldf[xy_columns + ["LU09_4", "LU18_4"]].iloc[:60],
+            ldf[xy_columns + ["LU09_4", "LU85_4"]].iloc[30:].reset_index(drop=True),
+            ldf[xy_columns + ["FJ85"]].iloc[::2],
+        ]
+        for how, num_pixels in [("outer", len(ldf)), ("inner", 15), ("left", 60)]:
+            merged_ldf = sls.merge_many(ldfs, how=how)
+            assert isinstance(merged_ldf, sls.LandDataFrame)
+            assert merged_ldf.index.name == settings.DEFAULT_INDEX_COLUMN
+            assert merged_ldf.index.is_monotonic_increasing
+            self.assertEqual(len(merged_ldf), num_pixels)
+            assert merged_ldf.columns.equals(
+                pd.Index(xy_columns + ["LU09_4", "LU18_4", "LU85_4", "FJ85"])
+            )
+            expected_ldf = ldf.loc[merged_ldf.index]
+            # the coordinates are filled from all the land data frames
+            pd.testing.assert_frame_equal(
+                merged_ldf[xy_columns], expected_ldf[xy_columns], check_frame_type=False
+            )
+            # the integer columns with missing pixels are nullable
+            for column, start, stop in [
+                ("LU18_4", None, 60),
+                ("LU85_4", 30, None),
+            ]:
+                expected_ser = ldf[column].iloc[start:stop]
+                pd.testing.assert_series_equal(
+                    merged_ldf[column].dropna(),
+                    expected_ser[expected_ser.index.isin(merged_ldf.index)],
+                    check_dtype=False,
+                )
+        assert sls.merge_many(ldfs)["LU18_4"].dtype == "Int64"
+        assert sls.merge_many(ldfs, how="inner")["LU18_4"].dtype == "int64"
+        with pytest.raises(ValueError):
+            sls.merge_many(ldfs, how="right")
+
         # test that `get_transform` returns a different transform if, e.g., we
         # change the min x or max y value
         assert ldf.get_transform() != ldf.iloc[:2].get_transform()
 
+        # test that the grid index is cached and shared by the raster exports
+        grid_index = ldf.get_grid_index()
+        assert ldf.get_grid_index() is grid_index
+        ldf.to_ndarray("LU09_4")
+        assert ldf.get_grid_index() is grid_index
+        # test that the first row of the array corresponds to the maximum y
+        arr = ldf.to_ndarray("LU09_4")
+        assert arr.shape == grid_index.shape
+        assert np.all(arr[grid_index.rows, grid_index.cols] == ldf["LU09_4"])
+        assert np.all(
+            grid_index.rows[ldf[ldf.y_column] == ldf[ldf.y_column].max()] == 0
+        )
+        # test that the cache is invalidated when the resolution or the coordinates
+        # change
+        _ldf = ldf.copy()
+        _ldf.res = (200, 200)
+        assert _ldf.get_grid_index().shape != grid_index.shape
+        _ldf = ldf.copy()
+        _ldf[ldf.x_column] = _ldf[ldf.x_column] + 100
+        assert _ldf.get_grid_index().origin != grid_index.origin
+        assert _ldf.get_grid_index().shape == grid_index.shape
+        # test that the cache is dropped when pickling
+        assert pickle.loads(pickle.dumps(ldf)).get_grid_index() is not grid_index
+        # test that the derived land data frames with other coordinates (e.g., slices)
+        # do not keep the cache of the land data frame alive
+        _ldf = ldf.copy()
+        _ldf.get_geoseries()
+        grid_cache_ref = weakref.ref(_ldf._get_grid_cache())
+        sliced_ldf = _ldf.iloc[:2]
+        del _ldf
+        gc.collect()
+        assert grid_cache_ref() is None
+        assert len(sliced_ldf.get_grid_index().rows) == 2
+        # test that an empty land data frame raises a clear error in the raster exports
+        # that depend on the grid index
+        empty_ldf = ldf.iloc[:0]
+        for func in [
+            empty_ldf.get_grid_index,
+            empty_ldf.get_transform,
+            lambda: empty_ldf.to_ndarray("LU09_4"),
+            lambda: empty_ldf.to_xarray(["LU09_4"]),
+        ]:
+            with pytest.raises(ValueError, match="empty"):
+                func()
+
         # test export to xarray
         # ldf = sls.read_csv(path.join(MOCK_DATASET_DIR, "sls.csv"))
         ldf["LU85_4"] = pd.Series(1, index=ldf.index[:-1], name="LU85_4")
@@ -212,6 +1188,89 @@ class TestSwissLandStats(unittest.TestCase):
         # test that the data array has the proper dtype
         dtype = "uint16"
         assert ldf.to_xarray(columns, dtype=dtype).dtype == dtype
+        # test that the data array matches the arrays of each column (including the
+        # missing values, which are set to `nodata`)
+        da = ldf.to_xarray(columns, nodata=nodata)
+        for column in columns:
+            assert np.all(da.sel(time=column) == ldf.to_ndarray(column, nodata=nodata))
+        assert np.sum(da.sel(time="LU85_4") == nodata) > np.sum(
+            da.sel(time="LU09_4") == nodata
+        )
+
+        # test windowed rasterization (the window is aligned to the pixel grid and may
+        # extend beyond the extent of the data)
+        arr = ldf.to_ndarray("LU85_4", nodata=nodata)
+        _transform = ldf.get_transform()
+        left, top = _transform * (2, 10)
+        right, bottom = _transform * (7, 30)
+        bounds = (left + 1, bottom + 1, right - 1, top - 1)
+        assert np.array_equal(
+            ldf.to_ndarray("LU85_4", nodata=nodata, bounds=bounds), arr[10:30, 2:7]
+        )
+        window_da = ldf.to_xarray(columns, nodata=nodata, bounds=bounds)
+        assert window_da.equals(
+            da.isel({ldf.y_column: slice(10, 30), ldf.x_column: slice(2, 7)})
+        )
+        xres, yres = ldf.res
+        bounds = (_transform.c - 3 * xres, bottom, right, _transform.f + yres)
+        window_arr = ldf.to_ndarray("LU85_4", nodata=nodata, bounds=bounds)
+        assert window_arr.shape == (31, 10)
+        assert np.all(window_arr[0] == nodata) and np.all(window_arr[:, :3] == nodata)
+        assert np.array_equal(window_arr[1:, 3:], arr[:30, :7])
+        with pytest.raises(ValueError):
+            ldf.to_ndarray("LU85_4", bounds=(right, bottom, left, top))
+        # test lazy rasterization
+        for chunks in [4, (1, 16, 3), {"time": 1, ldf.y_column: 20}]:
+            lazy_da = ldf.to_xarray(columns, nodata=nodata, chunks=chunks)
+            assert isinstance(lazy_da.data, dask_array.Array)
+            assert lazy_da.attrs == da.attrs
+            assert lazy_da.equals(da)
+        assert lazy_da.chunks[1][0] == 20
+        lazy_da = ldf.to_xarray(columns, nodata=nodata, bounds=bounds, chunks=7)
+        assert lazy_da.compute().equals(
+            ldf.to_xarray(columns, nodata=nodata, bounds=bounds)
+        )
+        with mock.patch.object(sls.dataframe, "dask_array", None):
+            with pytest.raises(ImportError):
+                ldf.to_xarray(columns, chunks=4)
+        # test dataset conversion, with the smallest data type that holds both the
+        # values and the nodata value of each column
+        ldf["FJ85"] = ldf["FJ85"].astype("int64")
+        ds = ldf.to_dataset(["FJ85"] + columns, nodata={"LU09_4": nodata})
+        assert isinstance(ds, xr.Dataset)
+        assert ds["FJ85"].dtype == "uint16"
+        assert ds["LU85_4"].dtype == "uint8"
+        assert ds["LU09_4"].attrs["nodata"] == nodata
+        assert ds.attrs == {"pyproj_srs": da.attrs["pyproj_srs"]}
+        assert np.array_equal(ds["FJ85"], ldf.to_ndarray("FJ85", dtype="uint16"))
+        assert ds["LU09_4"].equals(da.sel(time="LU09_4", drop=True))
+        assert ldf.to_dataset(columns, nodata=-1)["LU85_4"].dtype == "int16"
+        assert ldf.to_dataset(columns, dtypes="float32")["LU09_4"].dtype == "float32"
+        assert set(ldf.assign(name="a").to_dataset().data_vars) == set(
+            ldf.columns.drop([ldf.x_column, ldf.y_column])
+        )
+        lazy_ds = ldf.to_dataset(columns, chunks={ldf.y_column: 20})
+        assert lazy_ds["LU09_4"].chunks[0][0] == 20
+        assert lazy_ds.equals(ldf.to_dataset(columns))
+        assert ldf.to_dataset(columns, bounds=bounds, chunks=(13, 4)).equals(
+            ldf.to_dataset(columns, bounds=bounds)
+        )
+        with mock.patch.object(sls.dataframe, "dask_array", None):
+            with pytest.raises(ImportError):
+                ldf.to_dataset(columns, chunks=4)
+        # test sparse rasterization (missing values are not stored)
+        for sparse, sparse_format in [(True, "csr"), ("coo", "coo")]:
+            sparse_arr = ldf.to_ndarray("LU85_4", sparse=sparse)
+            assert sparse_arr.format == sparse_format
+            assert sparse_arr.nnz == ldf["LU85_4"].notna().sum()
+            assert np.array_equal(sparse_arr.toarray(), ldf.to_ndarray("LU85_4"))
+        assert np.array_equal(
+            ldf.to_ndarray("LU85_4", sparse=True, bounds=bounds).toarray(),
+            ldf.to_ndarray("LU85_4", bounds=bounds),
+        )
+        with mock.patch.object(sls.dataframe, "sp_sparse", None):
+            with pytest.raises(ImportError):
+                ldf.to_ndarray("LU85_4", sparse=True)
 
 
 def test_logging():